@@ -1,5 +1,8 @@
 import argparse
+import os
+import random
 import sys
+import time
 from collections.abc import Sequence
 from importlib.metadata import version
 from pathlib import Path
@@ -8,7 +11,7 @@ from .core.directions import LEVEL_DIRS
 from .core.game import Game
 from .core.word import Direction
 from .mask import Mask, shapes
-from .utils import get_random_words
+from .utils import available_cpus, get_random_words
 
 BUILTIN_MASK_SHAPES_OBJECTS = shapes.get_shape_objects()
 
@@ -60,7 +63,8 @@ def create_parser() -> argparse.ArgumentParser:
 
 Valid Levels: {", ".join([str(i) for i in LEVEL_DIRS])}
 Valid Directions: {", ".join([d.name for d in Direction])}
-* Directions are to be provided as a comma-separated list.""",
+* Directions are to be provided as a comma-separated list.
+* Generate many puzzles at once with `word-search batch` (see `batch -h`).""",
         epilog="Copyright 2024 Josh Duncan (joshbduncan.com)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -209,7 +213,7 @@ def preview_masks() -> None:
 
     for shape in BUILTIN_MASK_SHAPES_OBJECTS:
         mask: Mask = eval(f"shapes.{shape}")()
-        mask.generate(preview_size)
+        mask.render(preview_size)
         table = Table(
             title=shape,
             title_style="bold italic green",
@@ -264,6 +268,252 @@ def build_puzzle(args: argparse.Namespace):
     pass
 
 
+def create_batch_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="word-search batch",
+        description="Generate many Word Search puzzles across multiple processes. \
+Puzzles already found in the output directory are skipped so an \
+interrupted batch can be resumed by running the same command again.",
+    )
+    parser.add_argument(
+        "-i",
+        "--manifest",
+        type=Path,
+        help="Text file with the words for one puzzle per line.",
+    )
+    parser.add_argument(
+        "-n",
+        "--count",
+        type=int,
+        help="Count of puzzles to generate. Required without a manifest \
+(random words are used), otherwise limits the manifest lines used.",
+    )
+    parser.add_argument(
+        "-r",
+        "--random",
+        type=int,
+        action=RandomAction,
+        default=10,
+        help="Count of random words for each puzzle without a manifest \
+(default: 10).",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=available_cpus(),
+        help="Count of worker processes (default: available CPU count).",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        required=True,
+        help="Output directory for the saved puzzles.",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["CSV", "JSON", "PDF", "csv", "json", "pdf"],
+        metavar="EXPORT_FORMAT",
+        default="PDF",
+        help='Puzzle output format (choices: "CSV", "JSON", "PDF").',
+    )
+    parser.add_argument(
+        "-c",
+        "--cheat",
+        action="store_true",
+        help="Include the puzzle solution within each output file.",
+    )
+    parser.add_argument(
+        "-d",
+        "--difficulty",
+        "-l",
+        "--level",
+        action=DifficultyAction,
+        help="Difficulty level (numeric) or cardinal directions \
+puzzle words can go.",
+    )
+    parser.add_argument(
+        "-hk",
+        "--hide-key",
+        action="store_true",
+        help="Hide the answer key from output.",
+    )
+    parser.add_argument(
+        "-lc",
+        "--lowercase",
+        action="store_true",
+        help="Output puzzle letters in lower (as opposed to the UPPERCASE default).",
+    )
+    parser.add_argument(
+        "-m",
+        "--mask",
+        choices=BUILTIN_MASK_SHAPES_OBJECTS,
+        metavar="MASK_SHAPE",
+        help=f"Mask each puzzle to a shape \
+(choices: {', '.join(BUILTIN_MASK_SHAPES_OBJECTS)}).",
+    )
+    parser.add_argument(
+        "--no-validators",
+        action="store_true",
+        help="Disable default word validators.",
+    )
+    parser.add_argument(
+        "-rall",
+        "--require-all-words",
+        action="store_true",
+        help="Require all words to be placed by the generator.",
+    )
+    parser.add_argument(
+        "-s",
+        "--size",
+        action=SizeAction,
+        type=int,
+        help=f"{Game.MIN_PUZZLE_SIZE} <= puzzle size <= {Game.MAX_PUZZLE_SIZE}",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Base seed. Puzzle `i` (and its random words) use `seed + i`.",
+    )
+    return parser
+
+
+def batch_task(
+    index: int, words: str | None, path: Path, args: argparse.Namespace
+) -> Path:
+    """Generate and save a single batch puzzle (run in a worker process).
+
+    Args:
+        index: Puzzle index within the batch.
+        words: Puzzle words or None for random words.
+        path: Output file path.
+        args: Parsed batch arguments.
+
+    Returns:
+        The saved file path.
+    """
+    from .word_search import WordSearch
+
+    seed = None if args.seed is None else args.seed + index
+    if words is None:
+        words = ",".join(
+            get_random_words(args.random, args.size, rng=random.Random(seed))
+        )
+    masks: list[Mask] = [getattr(shapes, args.mask)()] if args.mask else []
+    puzzle = next(
+        WordSearch.generate_many(
+            [words],
+            level=args.difficulty,
+            size=args.size,
+            masks=masks,
+            require_all_words=args.require_all_words,
+            validators=None if args.no_validators else WordSearch.DEFAULT_VALIDATORS,
+            seed=seed,
+        )
+    )
+    # save to a temporary file first so an interrupted batch never leaves
+    # a partial puzzle that would be skipped when the batch is resumed
+    temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temp.unlink(missing_ok=True)
+    try:
+        puzzle.save(
+            path=temp,
+            format=args.format.upper(),
+            solution=args.cheat,
+            lowercase=args.lowercase,
+            hide_key=args.hide_key,
+        )
+        os.replace(temp, path)
+    finally:
+        temp.unlink(missing_ok=True)
+    return path.absolute()
+
+
+def batch(argv: Sequence[str]) -> int:
+    """Word Search Generator batch CLI.
+
+    Args:
+        argv (Sequence[str]): Batch command line arguments.
+
+    Returns:
+        int: Exit status.
+    """
+    parser = create_batch_parser()
+    args = parser.parse_args(argv)
+    if args.manifest is None and args.count is None:
+        parser.error("either -i/--manifest or -n/--count is required")
+    if args.count is not None and args.count < 1:
+        parser.error("-n/--count must be >=1")
+    if args.jobs < 1:
+        parser.error("-j/--jobs must be >=1")
+
+    # one puzzle per manifest line (or random words for each puzzle)
+    word_lists: list[str | None]
+    if args.manifest:
+        word_lists = [line.strip() for line in args.manifest.read_text().splitlines()]
+        word_lists = [words for words in word_lists if words]
+        if args.count is not None:
+            word_lists = word_lists[: args.count]
+    else:
+        word_lists = [None] * args.count
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    ext = args.format.lower()
+    tasks = [
+        (i, words, args.output / f"puzzle-{i + 1:05d}.{ext}")
+        for i, words in enumerate(word_lists)
+    ]
+    # resume by skipping any puzzles that were already saved
+    todo = [task for task in tasks if not task[2].exists()]
+    skipped = len(tasks) - len(todo)
+    if skipped:
+        print(f"Skipping {skipped} existing puzzle(s).", file=sys.stderr)
+
+    start = time.perf_counter()
+    failed = 0
+    done = 0
+
+    def report(path: Path, error: Exception | None = None) -> None:
+        nonlocal done, failed
+        done += 1
+        if error is not None:
+            failed += 1
+            print(f"[{done}/{len(todo)}] Failed {path}: {error}", file=sys.stderr)
+        else:
+            print(f"[{done}/{len(todo)}] Puzzle saved: {path}", file=sys.stderr)
+
+    if args.jobs == 1 or len(todo) <= 1:
+        for i, words, path in todo:
+            try:
+                batch_task(i, words, path, args)
+                report(path)
+            except Exception as e:
+                report(path, e)
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(todo))) as executor:
+            futures = {
+                executor.submit(batch_task, i, words, path, args): path
+                for i, words, path in todo
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    report(futures[future])
+                except Exception as e:
+                    report(futures[future], e)
+
+    print(
+        f"Generated {done - failed} puzzle(s) in {time.perf_counter() - start:.2f}s"
+        + (f", {failed} failed." if failed else "."),
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     """Word Search Generator CLI.
 
@@ -273,6 +523,11 @@ def main(argv: Sequence[str] | None = None) -> int:
     Returns:
         int: Exit status.
     """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "batch":
+        return batch(argv[1:])
+
     parser = create_parser()
     args = parser.parse_args(argv)
 
@@ -2,16 +2,20 @@ __all__ = [
     "Formatter",
     "Game",
     "Generator",
+    "Grid",
     "Puzzle",
+    "PuzzleCache",
     "Validator",
     "Word",
 ]
 
 from typing import TypeVar
 
+from .cache import PuzzleCache
 from .formatter import Formatter
 from .game import Game, Puzzle
 from .generator import Generator
+from .grid import Grid
 from .validator import Validator
 from .word import Word
 
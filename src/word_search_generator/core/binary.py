@@ -0,0 +1,196 @@
+"""Compact, versioned binary format for generated puzzles.
+
+Every value is little-endian and the layout (version 1) is:
+
+- header (`HEADER`): magic (`MAGIC`), format version, flags (`MASKED`,
+  `LARGE`), puzzle size, word directions and secret word directions (one bit
+  per `Direction`), word count, and the byte lengths of the two string tables
+- code table: the `Grid` characters for codes 1 and up (UTF-8, NUL separated)
+- text table: the word texts (UTF-8, NUL separated)
+- cells: one `Grid` code byte per puzzle cell (row-major)
+- mask (`MASKED` puzzles only): one bitset per row, bit `x` set when column
+  `x` is active (see `pack_rows()`), each padded to whole bytes
+- words: one fixed size record (`WORD`) per word of (text table index,
+  start row, start column, direction, word flags). Unplaced words use the
+  direction `UNPLACED`.
+
+A 25x25 puzzle with 20 words takes about 1KB (versus about 5KB for the
+`json` property) and loading one never runs the generator.
+"""
+
+from __future__ import annotations
+
+import struct
+from math import ceil
+from typing import TYPE_CHECKING
+
+from ..mask import pack_rows, unpack_rows
+from .directions import Direction
+from .grid import Grid
+from .word import Word
+
+if TYPE_CHECKING:  # pragma: no cover
+    from . import GameType
+    from .game import DirectionSet, Game
+
+
+MAGIC = b"WSGP"
+VERSION = 1
+
+# magic, version, flags, size, directions, secret directions, word count,
+# code table bytes, text table bytes
+HEADER = struct.Struct("<4sBBHBBHHI")
+# text index, start row, start column, direction, word flags
+WORD = struct.Struct("<HHHBB")
+
+# header flags
+MASKED = 1
+LARGE = 2
+
+# word flags
+SECRET = 1
+
+DIRECTIONS = list(Direction)
+UNPLACED = 0xFF
+SEPARATOR = "\0"
+
+
+class BinaryFormatError(ValueError):
+    """For when data isn't a puzzle in a supported binary format."""
+
+    pass
+
+
+def _pack_directions(directions: DirectionSet) -> int:
+    return sum(1 << DIRECTIONS.index(d) for d in directions)
+
+
+def _unpack_directions(bits: int) -> DirectionSet:
+    return {d for i, d in enumerate(DIRECTIONS) if bits >> i & 1}
+
+
+def dumps(game: Game) -> bytes:
+    """Serialize the current puzzle, mask, and words of `game`.
+
+    Raises:
+        GridAlphabetError: The puzzle has more than 255 distinct characters.
+    """
+    puzzle = game.puzzle
+    size = len(puzzle)
+    grid = Grid.from_puzzle(puzzle)
+    words = sorted(game.words, key=lambda word: word.text)
+    masked = any(game.INACTIVE in row for row in game.mask)
+
+    alphabet = SEPARATOR.join(grid.alphabet[1:]).encode()
+    texts = SEPARATOR.join(word.text for word in words).encode()
+    flags = (MASKED if masked else 0) | (LARGE if game.large else 0)
+    parts: list[bytes | bytearray] = [
+        HEADER.pack(
+            MAGIC,
+            VERSION,
+            flags,
+            size,
+            _pack_directions(game.directions),
+            _pack_directions(getattr(game, "secret_directions", set())),
+            len(words),
+            len(alphabet),
+            len(texts),
+        ),
+        alphabet,
+        texts,
+        grid.cells,
+    ]
+    if masked:
+        row_bytes = ceil(size / 8)
+        parts.extend(row.to_bytes(row_bytes, "little") for row in pack_rows(game.mask))
+    for i, word in enumerate(words):
+        word_flags = SECRET if word.secret else 0
+        if word.direction is None:
+            parts.append(WORD.pack(i, 0, 0, UNPLACED, word_flags))
+            continue
+        parts.append(
+            WORD.pack(
+                i,
+                word.start_row,
+                word.start_column,
+                DIRECTIONS.index(word.direction),
+                word_flags,
+            )
+        )
+    return b"".join(parts)
+
+
+def loads(data: bytes | bytearray | memoryview, game_type: type[GameType]) -> GameType:
+    """Rebuild a `game_type` game from data created by `dumps()` without
+    generating the puzzle again.
+
+    The data is read in place through a `memoryview` (only the cell codes are
+    copied, straight into a `Grid`).
+
+    Raises:
+        BinaryFormatError: Not a puzzle, an unsupported format version,
+            or truncated data.
+    """
+    view = memoryview(data).cast("B")
+    if len(view) < HEADER.size or bytes(view[:4]) != MAGIC:
+        raise BinaryFormatError("Data is not a binary word search puzzle.")
+    (
+        _,
+        version,
+        flags,
+        size,
+        directions,
+        secret_directions,
+        word_count,
+        alphabet_length,
+        texts_length,
+    ) = HEADER.unpack_from(view)
+    if version != VERSION:
+        raise BinaryFormatError(f"Unsupported binary format version {version}.")
+    row_bytes = ceil(size / 8)
+    mask_length = size * row_bytes if flags & MASKED else 0
+    offset = HEADER.size
+    length = (
+        offset
+        + alphabet_length
+        + texts_length
+        + size * size
+        + mask_length
+        + word_count * WORD.size
+    )
+    if len(view) != length:
+        raise BinaryFormatError(f"Expected {length} bytes but got {len(view)}.")
+
+    alphabet = str(view[offset : offset + alphabet_length], "utf-8")
+    offset += alphabet_length
+    texts = str(view[offset : offset + texts_length], "utf-8").split(SEPARATOR)
+    offset += texts_length
+    grid = Grid(size)
+    for char in alphabet.split(SEPARATOR) if alphabet else []:
+        grid.code(char)
+    grid.cells[:] = view[offset : offset + size * size]
+    offset += size * size
+
+    game = game_type(size=size, large=bool(flags & LARGE))
+    game._directions = _unpack_directions(directions)
+    if hasattr(game, "_secret_directions"):
+        game._secret_directions = _unpack_directions(secret_directions)
+    if flags & MASKED:
+        rows = [
+            int.from_bytes(view[i : i + row_bytes], "little")
+            for i in range(offset, offset + mask_length, row_bytes)
+        ]
+        offset += mask_length
+        mask = unpack_rows(rows, size)
+    else:
+        mask = game._build_puzzle(size, game.ACTIVE)
+
+    words = set()
+    for index, row, col, direction, word_flags in WORD.iter_unpack(view[offset:]):
+        word = Word(texts[index], secret=bool(word_flags & SECRET), rng=game.random)
+        if direction != UNPLACED:
+            word.start_row, word.start_column = row, col
+            word.direction = DIRECTIONS[direction]
+        words.add(word)
+    game._restore(grid.to_puzzle(), mask, words)
+    return game
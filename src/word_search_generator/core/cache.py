@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+
+    from .game import Game, Puzzle
+
+
+class PuzzleCache:
+    """Persistent cache of generated puzzles stored in a local SQLite file.
+
+    Puzzles are keyed by a canonical hash of everything that decides the
+    generated puzzle (see `key()`), so the same words, settings, mask, and
+    seed are only ever generated once. The least recently used puzzles are
+    evicted once the cache holds more than `max_entries` puzzles.
+
+    Only seeded games (or games with a seeded generator) use the cache since
+    an unseeded game should get a different puzzle every time (see
+    `cacheable()`).
+
+    Example:
+        ```python
+        cache = PuzzleCache("puzzles.db")
+        ws = WordSearch("cat dog pig", seed=1, cache=cache)
+        print(cache.hits, cache.misses)
+        ```
+    """
+
+    def __init__(self, path: str | Path = ":memory:", max_entries: int = 10000):
+        """Initialize a puzzle cache.
+
+        Args:
+            path: SQLite database file. Defaults to ":memory:" which only
+                lasts as long as the cache object.
+            max_entries: Most puzzles to keep. Defaults to 10000.
+
+        Raises:
+            ValueError: `max_entries` less than 1.
+        """
+        if max_entries < 1:
+            raise ValueError("Cache max_entries must be >= 1.")
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._connection: sqlite3.Connection | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Database connection (opened on first use)."""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS puzzles "
+                + "(key TEXT PRIMARY KEY, entry TEXT NOT NULL, used INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS puzzles_used ON puzzles (used)"
+            )
+            self._connection.commit()
+        return self._connection
+
+    @staticmethod
+    def cacheable(game: Game) -> bool:
+        """Is the puzzle `game` generates decided by its inputs (i.e. is the
+        game or its generator seeded)."""
+        return (
+            game.seed is not None or getattr(game.generator, "seed", None) is not None
+        )
+
+    @staticmethod
+    def key(game: Game) -> str:
+        """Canonical hash of the inputs that decide the puzzle `game`
+        generates: words, word directions, size, mask, generator (type,
+        alphabet, and settings), validators, and seed."""
+        generator = game.generator
+        inputs = {
+            "words": sorted((word.text, word.secret) for word in game.words),
+            "directions": sorted(d.name for d in game.directions),
+            "secret_directions": sorted(
+                d.name for d in getattr(game, "secret_directions", ())
+            ),
+            "size": game.size,
+            "mask": ["".join(row) for row in game.mask],
+            "generator": [
+                type(generator).__qualname__,
+                getattr(generator, "alphabet", None),
+                getattr(generator, "seed", None),
+                type(getattr(generator, "ordering", None)).__qualname__,
+                getattr(generator, "forward_check", None),
+                getattr(generator, "tile_size", None),
+            ],
+            "validators": [
+                [type(validator).__qualname__, repr(sorted(vars(validator).items()))]
+                for validator in game.validators or ()
+            ],
+            "max_words": game.MAX_PUZZLE_WORDS,
+            "seed": game.seed,
+        }
+        encoded = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def get(self, key: str) -> tuple[Puzzle, dict[str, list[Any]]] | None:
+        """Get the cached puzzle and word placements for `key`.
+
+        Returns:
+            The puzzle and the placement of each placed word by text as
+            [start row, start column, direction name], or None if the
+            puzzle isn't cached.
+        """
+        connection = self.connection
+        row = connection.execute(
+            "SELECT entry FROM puzzles WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        connection.execute(
+            "UPDATE puzzles SET used = (SELECT MAX(used) FROM puzzles) + 1 "
+            + "WHERE key = ?",
+            (key,),
+        )
+        connection.commit()
+        entry = json.loads(row[0])
+        return entry["puzzle"], entry["words"]
+
+    def put(self, key: str, game: Game) -> None:
+        """Store the puzzle and word placements of `game` under `key`,
+        evicting the least recently used puzzles if the cache is full."""
+        entry = {
+            "puzzle": game._puzzle,
+            "words": {
+                word.text: [
+                    word.start_row,
+                    word.start_column,
+                    word.direction.name,
+                ]
+                for word in game.words
+                if word.direction is not None
+            },
+        }
+        connection = self.connection
+        connection.execute(
+            "INSERT OR REPLACE INTO puzzles (key, entry, used) VALUES "
+            + "(?, ?, (SELECT COALESCE(MAX(used), 0) + 1 FROM puzzles))",
+            (key, json.dumps(entry, separators=(",", ":"))),
+        )
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            connection.execute(
+                "DELETE FROM puzzles WHERE key IN "
+                + "(SELECT key FROM puzzles ORDER BY used LIMIT ?)",
+                (excess,),
+            )
+        connection.commit()
+
+    def clear(self) -> None:
+        """Remove every cached puzzle and reset the counters."""
+        self.connection.execute("DELETE FROM puzzles")
+        self.connection.commit()
+        self.hits = self.misses = 0
+
+    def close(self) -> None:
+        """Close the database connection (reopened if the cache is used again)."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __len__(self) -> int:
+        return int(
+            self.connection.execute("SELECT COUNT(*) FROM puzzles").fetchone()[0]
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        return state
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}('{self.path}', "
+            + f"max_entries={self.max_entries}, hits={self.hits}, "
+            + f"misses={self.misses})"
+        )
@@ -1,17 +1,26 @@
 import json
-from collections.abc import Iterable, Sized
-from math import log2
+import random
+from collections.abc import Callable, Iterable, Iterator, Sized
+from contextlib import contextmanager
+from math import ceil, log2, sqrt
 from pathlib import Path
-from typing import TypeAlias
+from typing import TYPE_CHECKING, TypeAlias
 
 from ..core.formatter import Formatter
-from ..core.generator import Generator
-from ..mask import CompoundMask, Mask
+from ..core.generator import Budget, Generator
+from ..mask import CompoundMask, Mask, combine_rows, pack_rows, unpack_rows
+from ..mask.bitmap import Bitmap
 from ..utils import BoundingBox, find_bounding_box
+from . import binary
+from .cache import PuzzleCache
 from .directions import LEVEL_DIRS, Direction
+from .grid import Grid
 from .validator import Validator
 from .word import KeyInfo, KeyInfoJson, Word
 
+if TYPE_CHECKING:  # pragma: no cover
+    from . import GameType
+
 
 class EmptyPuzzleError(Exception):
     """For when a `Game` puzzle is requested but is currently empty."""
@@ -76,6 +85,9 @@ class Game:
     MIN_PUZZLE_WORDS = 1
     MAX_PUZZLE_WORDS = 100
     MAX_FIT_TRIES = 1000
+    # limits for `large` puzzles (wall posters, "mega" puzzles)
+    LARGE_MAX_PUZZLE_SIZE = 1000
+    LARGE_MAX_PUZZLE_WORDS = 10000
 
     DEFAULT_GENERATOR: Generator | None = None
     DEFAULT_FORMATTER: Formatter | None = None
@@ -93,9 +105,23 @@ class Game:
         generator: Generator | None = None,
         formatter: Formatter | None = None,
         validators: Iterable[Validator] | None = None,
+        seed: int | None = None,
+        lazy: bool = False,
+        large: bool = False,
+        cache: PuzzleCache | None = None,
     ):
+        # lift the size and word limits first since input is checked against them
+        self.large = large
+
+        # setup random number generation (unless a subclass already
+        # had to, it can't be reseeded once words are colored from it)
+        self.seed: int | None = seed
+        if not hasattr(self, "random"):
+            self.random: random.Random = random.Random(seed)
+
         # setup puzzle
         self._words: WordSet = set()
+        self._word_sets: dict[str, WordSet] = {}
         self._level: DirectionSet = set()
         self._size: int = size if size else 0
         self.require_all_words: bool = require_all_words
@@ -103,6 +129,12 @@ class Game:
         self._puzzle: Puzzle = []
         self._masks: list[Mask] = []
         self._mask: Puzzle = []
+        self.budget: Budget = Budget()
+        self.lazy: bool = lazy
+        self.cache: PuzzleCache | None = cache
+        self._batch_depth: int = 0
+        self._pending: bool = False
+        self._pending_reset: bool = False
 
         # setup required defaults
         self.generator: Generator | None = (
@@ -136,7 +168,7 @@ class Game:
             self._size = size
 
         if self.words:
-            self.generate()
+            self._regenerate()
 
     # **************************************************** #
     # ******************** PROPERTIES ******************** #
@@ -150,18 +182,39 @@ class Game:
     @property
     def placed_words(self) -> WordSet:
         """Words of any type currently placed in the puzzle."""
-        return {word for word in self.words if word.placed}
+        self._flush()
+        return self._word_set("placed", lambda word: word.placed)
 
     @property
     def unplaced_words(self) -> WordSet:
         """Words of any type not currently placed in the puzzle."""
-        return {word for word in self.words if not word.placed}
+        self._flush()
+        return self._word_set("unplaced", lambda word: not word.placed)
+
+    def _word_set(self, name: str, select: Callable[[Word], bool]) -> WordSet:
+        """Words picked by `select`, memoized under `name` until the puzzle
+        words or their placements change (see `_reset_word_sets()`)."""
+        words = self._word_sets.get(name)
+        if words is None:
+            words = self._word_sets[name] = {w for w in self._words if select(w)}
+        return set(words)
+
+    def _reset_word_sets(self) -> None:
+        """Forget the memoized word sets after the puzzle words (or their
+        placements) change."""
+        self._word_sets.clear()
 
     @property
     def puzzle(self) -> Puzzle:
         """The current puzzle state."""
+        self._flush()
         return self._puzzle
 
+    @property
+    def grid(self) -> Grid:
+        """Compact copy of the current puzzle state (see `Grid`)."""
+        return Grid.from_puzzle(self.puzzle)
+
     @property
     def solution(self) -> None:
         """Solution to the current puzzle state."""
@@ -169,7 +222,8 @@ class Game:
 
     @property
     def mask(self) -> Puzzle:
-        """The current puzzle state."""
+        """The current puzzle mask."""
+        self._flush()
         return self._mask
 
     @property
@@ -214,7 +268,7 @@ class Game:
         return json.dumps(
             {
                 "puzzle": self.cropped_puzzle,
-                "words": [word.text for word in self.placed_words],
+                "words": sorted(word.text for word in self.placed_words),
             }
         )
 
@@ -222,6 +276,23 @@ class Game:
     # ******************** GETTERS/SETTERS ******************** #
     # ********************************************************* #
 
+    @property
+    def large(self) -> bool:
+        """Large puzzle mode. Lifts the puzzle size and word limits to
+        `LARGE_MAX_PUZZLE_SIZE` and `LARGE_MAX_PUZZLE_WORDS`."""
+        return self._large
+
+    @large.setter
+    def large(self, value: bool) -> None:
+        self._large = value
+        cls = type(self)
+        self.MAX_PUZZLE_SIZE = (
+            cls.LARGE_MAX_PUZZLE_SIZE if value else cls.MAX_PUZZLE_SIZE
+        )
+        self.MAX_PUZZLE_WORDS = (
+            cls.LARGE_MAX_PUZZLE_WORDS if value else cls.MAX_PUZZLE_WORDS
+        )
+
     @property
     def directions(self) -> DirectionSet:
         """Valid directions for puzzle words."""
@@ -237,7 +308,7 @@ class Game:
                 from the Direction object.
         """
         self._directions = self.validate_level(value)
-        self.generate()
+        self._regenerate()
 
     @property
     def direction_set_repr(self) -> str:
@@ -264,6 +335,7 @@ class Game:
     @property
     def size(self) -> int:
         """Size (in characters) of the word search puzzle."""
+        self._flush()
         return self._size
 
     @size.setter
@@ -278,6 +350,16 @@ class Game:
             ValueError: Must be greater than `self.MIN_PUZZLE_SIZE` and
                 less than `self.MAX_PUZZLE_SIZE`.
         """
+        if self._resize(value):
+            self._regenerate()
+
+    def _resize(self, value: int) -> bool:
+        """Validate and set the puzzle size and reapply the masks
+        without regenerating the puzzle.
+
+        Returns:
+            If the size changed.
+        """
         if not isinstance(value, int):
             raise TypeError("Size must be an integer.")
         if not self.MIN_PUZZLE_SIZE <= value <= self.MAX_PUZZLE_SIZE:
@@ -285,10 +367,11 @@ class Game:
                 f"Puzzle size must be >= {self.MIN_PUZZLE_SIZE}"
                 + f" and <= {self.MAX_PUZZLE_SIZE}."
             )
-        if self.size != value:
-            self._size = value
-            self._reapply_masks()
-            self.generate()
+        if self._size == value:
+            return False
+        self._size = value
+        self._reapply_masks()
+        return True
 
     @property
     def validators(self) -> Iterable[Validator] | None:
@@ -303,7 +386,7 @@ class Game:
             value: Game word validators.
         """
         self._validators = value
-        self.generate()
+        self._regenerate()
 
     # ************************************************* #
     # ******************** METHODS ******************** #
@@ -342,6 +425,25 @@ class Game:
             raise MissingFormatterError()
         return str(self.formatter.save(self, path, format, *args, **kwargs))
 
+    def to_bytes(self) -> bytes:
+        """The current puzzle, mask, and words in the compact binary
+        format (see `core.binary`). Load it with `from_bytes()`."""
+        if not self.puzzle or not self.placed_words:
+            raise EmptyPuzzleError()
+        return binary.dumps(self)
+
+    @classmethod
+    def from_bytes(
+        cls: "type[GameType]", data: bytes | bytearray | memoryview
+    ) -> "GameType":
+        """Rebuild a game from `to_bytes()` data without generating the
+        puzzle again.
+
+        Raises:
+            BinaryFormatError: `data` isn't a puzzle in a supported format.
+        """
+        return binary.loads(data, cls)
+
     # *************************************************************** #
     # ******************** PROCESSING/GENERATION ******************** #
     # *************************************************************** #
@@ -351,12 +453,25 @@ class Game:
         """Build an empty nested list/puzzle grid."""
         return [[char] * size for _ in range(size)]
 
-    def generate(self, reset_size: bool = False) -> None:
+    def generate(
+        self,
+        reset_size: bool = False,
+        timeout: float | None = None,
+        max_steps: int | None = None,
+    ) -> None:
         """Generate the puzzle grid.
 
+        When `timeout` or `max_steps` is reached the generator stops searching
+        and the best partial puzzle found so far is kept. See `self.budget`
+        for how much of the budget was used.
+
         Args:
             reset_size: Recalculate the puzzle size before generation.
                 Defaults to False.
+            timeout: Wall-clock limit in seconds for the generator.
+                Defaults to None (unlimited).
+            max_steps: Search step (attempted word placement) limit for the
+                generator. Defaults to None (unlimited).
 
         Raises:
             MissingGeneratorError: No set puzzle generator.
@@ -365,12 +480,17 @@ class Game:
             NoValidWordsError: No valid game words.
             MissingWordError: Not all game words could be placed by the generator.
         """
+        self._pending = self._pending_reset = False
         if not self.generator:
             raise MissingGeneratorError()
         if not self.words:
             raise EmptyWordlistError("No words have been added to the puzzle.")
         if not self.size or reset_size:
-            self.size = self._calc_puzzle_size(self._words, self._directions)
+            self._resize(
+                self._calc_puzzle_size(
+                    self._words, self._directions, max_size=self.MAX_PUZZLE_SIZE
+                )
+            )
         min_word_length = (
             min([len(word.text) for word in self.words]) if self.words else self.size
         )
@@ -380,26 +500,89 @@ class Game:
             )
         for word in self.words:
             word.remove_from_puzzle()
+        self._reset_word_sets()
         if not self.mask or len(self.mask) != self.size:
             self._mask = self._build_puzzle(self.size, self.ACTIVE)
-        self._puzzle = self.generator.generate(self)
+        self.budget = Budget(timeout, max_steps)
+        self._generate_puzzle()
+        self._reset_word_sets()
         if not self.masked and not self.placed_words:
             raise NoValidWordsError("No valid words have been added to the puzzle.")
         if self.require_all_words and self.unplaced_words:
             raise MissingWordError("All words could not be placed in the puzzle.")
 
+    def _generate_puzzle(self) -> None:
+        """Run the generator, or load the puzzle from `cache` when the same
+        puzzle was already generated. Puzzles cut short by the generation
+        budget (or from unseeded games) aren't cached."""
+        assert self.generator is not None
+        if self.cache is None or not self.cache.cacheable(self):
+            self._puzzle = self.generator.generate(self)
+            return
+        key = self.cache.key(self)
+        cached = self.cache.get(key)
+        if cached is None:
+            self._puzzle = self.generator.generate(self)
+            if not self.budget.exhausted:
+                self.cache.put(key, self)
+            return
+        puzzle, placements = cached
+        for word in self._words:
+            if word.text in placements:
+                row, col, direction = placements[word.text]
+                word.start_row, word.start_column = row, col
+                word.direction = Direction[direction]
+        self._puzzle = puzzle
+
+    def _restore(self, puzzle: Puzzle, mask: Puzzle, words: WordSet) -> None:
+        """Setup an already generated puzzle (e.g. loaded by `from_bytes()`)
+        without generating it again. `words` must already hold their
+        placements. A masked puzzle gets a single static `Bitmap` mask
+        of its active cells."""
+        size = len(puzzle)
+        self._size = size
+        self._puzzle = puzzle
+        self._mask = mask
+        self._masks = []
+        rows = pack_rows(mask)
+        if any(row != (1 << size) - 1 for row in rows):
+            bitmap = Bitmap(
+                [
+                    (x, y)
+                    for y, row in enumerate(mask)
+                    for x, char in enumerate(row)
+                    if char == self.ACTIVE
+                ]
+            )
+            bitmap.puzzle_size = size
+            bitmap.rows = rows
+            self._masks.append(bitmap)
+        self._words = words
+        self._reset_word_sets()
+        self._pending = self._pending_reset = False
+
     def _process_input(self, words: str, secret: bool = False) -> WordSet:
         clean_words = self._cleanup_input(words, secret=secret)
         return clean_words
 
     @staticmethod
-    def _calc_puzzle_size(words: WordSet, level: Sized, size: int | None = None) -> int:
+    def _calc_puzzle_size(
+        words: WordSet,
+        level: Sized,
+        size: int | None = None,
+        max_size: int | None = None,
+    ) -> int:
         """Calculate the puzzle grid size.
 
+        Word lists too big for a `MAX_PUZZLE_SIZE` puzzle (only possible for
+        `large` games) get a puzzle about twice the area of their letters.
+
         Args:
             words: Game words.
             level: Game level.
             size: Set puzzle size. Defaults to None.
+            max_size: Largest allowed puzzle size. Defaults to None which
+                uses `Game.MAX_PUZZLE_SIZE`.
 
         Returns:
             Calculated puzzle size.
@@ -411,7 +594,11 @@ class Game:
             multiplier = len(words) / 15 if len(words) > 15 else 1
             # level lengths in `core.directions` are nice multiples of 2
             l_size = log2(len(level)) if level else 1  # protect against log(0) in tests
-            size = min(round(longest + l_size * 2 * multiplier), Game.MAX_PUZZLE_SIZE)
+            size = round(longest + l_size * 2 * multiplier)
+            if size > Game.MAX_PUZZLE_SIZE:
+                letters = sum(len(word.text) for word in words)
+                size = max(Game.MAX_PUZZLE_SIZE, longest, ceil(sqrt(letters * 2)))
+            size = min(size, max_size or Game.MAX_PUZZLE_SIZE)
         return size
 
     def add_words(
@@ -419,6 +606,7 @@ class Game:
         words: str | WordSet,
         secret: bool = False,
         reset_size: bool = False,
+        incremental: bool = False,
     ) -> None:
         """Add words to the puzzle.
 
@@ -427,31 +615,58 @@ class Game:
             secret: Should the new words be secret. Defaults to False.
             reset_size: Reset the puzzle size based on the updated words.
                 Defaults to False.
+            incremental: Place the new words into the current puzzle instead
+                of generating a new one, so every other word (and most of the
+                filler characters) stays where it is. Falls back to generating
+                a new puzzle when the words can't be patched in.
+                Defaults to False.
         """
         if isinstance(words, str):
             words = self._process_input(words, secret)
 
+        # words being updated (e.g. made secret) can't be patched in place
+        updated = bool(self._words & words)
         # remove all new words first so any updates are reflected in the word list
         self._words.symmetric_difference_update(words)
         self._words.update(words)
-        self.generate(reset_size=reset_size)
+        self._reset_word_sets()
+        if incremental and not updated and self._patch(words, reset_size=reset_size):
+            return
+        self._regenerate(reset_size)
 
-    def remove_words(self, words: str | WordSet, reset_size: bool = False) -> None:
+    def remove_words(
+        self,
+        words: str | WordSet,
+        reset_size: bool = False,
+        incremental: bool = False,
+    ) -> None:
         """Remove words from the puzzle.
 
         Args:
             words: Words to remove.
             reset_size: Reset the puzzle size based on the updated words.
                 Defaults to False.
+            incremental: Only redraw the puzzle cells freed by the removed
+                words instead of generating a new puzzle. Falls back to
+                generating a new puzzle when that isn't possible.
+                Defaults to False.
         """
         if isinstance(words, str):
             words = self._process_input(words)
 
+        removed = {word for word in self._words if word in words}
         self._words.difference_update(words)
-        self.generate(reset_size=reset_size)
+        self._reset_word_sets()
+        if incremental and self._patch(removed, remove=True, reset_size=reset_size):
+            return
+        self._regenerate(reset_size)
 
     def replace_words(
-        self, words: str | WordSet, secret: bool = False, reset_size: bool = False
+        self,
+        words: str | WordSet,
+        secret: bool = False,
+        reset_size: bool = False,
+        incremental: bool = False,
     ) -> None:
         """Replace all words from the puzzle.
 
@@ -460,13 +675,71 @@ class Game:
             secret: Should the new words be secret. Defaults to False.
             reset_size: Reset the puzzle size based on the updated words.
                 Defaults to False.
+            incremental: Only remove the words that aren't in `words` and
+                place the new ones into the current puzzle instead of
+                generating a new puzzle (see `add_words()`). Defaults to False.
         """
         if isinstance(words, str):
             words = self._process_input(words, secret)
 
+        if not incremental:
+            self._words.clear()
+            self._words.update(words)
+            self._reset_word_sets()
+            self._regenerate(reset_size)
+            return
+
+        current = {word.text: word for word in self._words}
+        kept = {
+            current[word.text]
+            for word in words
+            if word.text in current and current[word.text].secret == word.secret
+        }
+        stale = self._words - kept
+        fresh = set(words) - kept
         self._words.clear()
-        self._words.update(words)
-        self.generate(reset_size=reset_size)
+        self._words.update(kept | fresh)
+        self._reset_word_sets()
+        if self._patch(stale, remove=True, reset_size=reset_size) and self._patch(
+            fresh, reset_size=reset_size
+        ):
+            return
+        self._regenerate(reset_size)
+
+    def _patch(
+        self, words: WordSet, remove: bool = False, reset_size: bool = False
+    ) -> bool:
+        """Try to patch `words` into (or out of) the current puzzle with the
+        generator instead of generating a new puzzle.
+
+        Args:
+            words: Words added to (or removed from) the game word list.
+            remove: The words were removed. Defaults to False.
+            reset_size: The puzzle size is being reset (which always requires
+                a new puzzle). Defaults to False.
+
+        Returns:
+            The puzzle was patched.
+        """
+        if (
+            reset_size
+            or self._batch_depth
+            or self.lazy
+            or self._pending
+            or not self._puzzle
+            or not self.generator
+            or not self._words
+        ):
+            return False
+        if not words:
+            return True
+        patch = self.generator.remove_words if remove else self.generator.add_words
+        puzzle = patch(self, words)
+        self._reset_word_sets()
+        if puzzle is None:
+            return False
+        self._puzzle = puzzle
+        return True
 
     def _cleanup_input(self, words: str, secret: bool = False) -> WordSet:
         """Cleanup provided input string."""
@@ -483,7 +756,7 @@ class Game:
         while word_list and len(word_set) <= self.MAX_PUZZLE_WORDS:
             word = word_list.pop(0)
             if word:
-                word_set.add(Word(word, secret=secret))
+                word_set.add(Word(word, secret=secret, rng=self.random))
         return word_set
 
     @staticmethod
@@ -530,39 +803,83 @@ class Game:
 
     def apply_mask(self, mask: Mask) -> None:
         """Apply a singular mask object to the puzzle."""
-        if not self.puzzle:
+        if not self._puzzle:
+            # a lazy puzzle has to be generated once to know its size
+            self._flush()
+        if not self._puzzle:
             raise EmptyPuzzleError()
         if not isinstance(mask, Mask | CompoundMask):
             raise TypeError("Please provide a Mask object.")
-        if mask.puzzle_size != self.size:
-            mask.generate(self.size)
-        for y in range(self.size):
-            for x in range(self.size):
-                self.mask[y][x] = self.mask[y][x]
-                mask.mask[y][x] = mask.mask[y][x]
-                match mask.method:
-                    case 1:
-                        self.mask[y][x] = (
-                            self.ACTIVE
-                            if mask.mask[y][x] == self.mask[y][x] == self.ACTIVE
-                            else self.INACTIVE
-                        )
-                    case 2:
-                        if mask.mask[y][x] == self.ACTIVE:
-                            self.mask[y][x] = self.ACTIVE
-                    case 3:
-                        if mask.mask[y][x] == self.ACTIVE:
-                            self.mask[y][x] = self.INACTIVE
+        self._combine_mask(mask)
         # add mask to puzzle instance for later reference
         if mask not in self.masks:
             self.masks.append(mask)
         # fill in the puzzle
-        self.generate()
+        self._regenerate()
+
+    def _combine_mask(self, mask: Mask) -> None:
+        """Combine `mask` into the current puzzle mask (based on `mask.method`)
+        without regenerating the puzzle."""
+        if mask.puzzle_size != self._size:
+            mask.render(self._size)
+        rows = combine_rows(pack_rows(self._mask), mask.rows, mask.method)
+        self._mask = unpack_rows(rows, self._size)
 
     def apply_masks(self, masks: Iterable[Mask]) -> None:
-        """Apply a group of masks to the puzzle."""
-        for mask in masks:
-            self.apply_mask(mask)
+        """Apply a group of masks to the puzzle. All masks are combined
+        first and the puzzle is only generated once."""
+        with self.batch_update():
+            for mask in masks:
+                self.apply_mask(mask)
+
+    @contextmanager
+    def batch_update(self) -> Iterator["Game"]:
+        """Stage several changes and only generate the puzzle once when the
+        block exits instead of after each one. Covers the mask operations
+        (`apply_mask()`, `invert_mask()`, etc.), adding/removing words, and
+        setting the size, directions, or validators.
+
+        Errors from generating the puzzle (e.g. `MissingWordError`) are raised
+        when the block exits. For a `lazy` game, or when the block raises an
+        error, the puzzle isn't generated until it is next used (see `lazy`).
+
+        Example:
+            ```python
+            with puzzle.batch_update():
+                puzzle.size = 25
+                puzzle.directions = "N,S,E,W"
+                puzzle.apply_mask(Circle())
+                puzzle.invert_mask()
+            ```
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+        # only reached when the block didn't raise, otherwise the staged
+        # changes are left pending
+        if not self._batch_depth and not self.lazy:
+            self._flush()
+
+    def _regenerate(self, reset_size: bool = False) -> None:
+        """Generate the puzzle after a change, or wait until the outermost
+        `batch_update()` block exits (or the puzzle is used for a `lazy` game).
+
+        Args:
+            reset_size: Recalculate the puzzle size before generation.
+                Defaults to False.
+        """
+        if self._batch_depth or self.lazy:
+            self._pending = True
+            self._pending_reset = self._pending_reset or reset_size
+        else:
+            self.generate(reset_size=reset_size)
+
+    def _flush(self) -> None:
+        """Generate the puzzle if any changes are waiting on it."""
+        if self._pending:
+            self.generate(reset_size=self._pending_reset)
 
     def show_mask(self) -> None:
         """Show the current puzzle mask."""
@@ -577,44 +894,45 @@ class Game:
         actual mask(s) found in `WordSearch.mask`."""
         self._mask = [
             [self.ACTIVE if c == self.INACTIVE else self.INACTIVE for c in row]
-            for row in self.mask
+            for row in self._mask
         ]
-        self.generate()
+        self._regenerate()
 
     def flip_mask_horizontal(self) -> None:
         """Flip the current puzzle mask along the vertical axis (left to right).
         Has no effect on the actual mask(s) found in `WordSearch.mask`."""
-        self._mask = [r[::-1] for r in self.mask]
-        self.generate()
+        self._mask = [r[::-1] for r in self._mask]
+        self._regenerate()
 
     def flip_mask_vertical(self) -> None:
         """Flip the current puzzle mask along the horizontal axis (top to bottom).
         Has no effect on the actual mask(s) found in `WordSearch.mask`."""
-        self._mask = self.mask[::-1]
-        self.generate()
+        self._mask = self._mask[::-1]
+        self._regenerate()
 
     def transpose_mask(self) -> None:
         """Interchange each row with the corresponding column
         of the current puzzle mask. Has no effect on the actual
         mask(s) found in `WordSearch.mask`."""
-        self._mask = list(map(list, zip(*self.mask, strict=False)))
-        self.generate()
+        self._mask = list(map(list, zip(*self._mask, strict=False)))
+        self._regenerate()
 
     def remove_masks(self) -> None:
         self._masks = []
-        self._mask = self._build_puzzle(self.size, self.ACTIVE)
-        self.generate()
+        self._mask = self._build_puzzle(self._size, self.ACTIVE)
+        self._regenerate()
 
     def remove_static_masks(self) -> None:
         self._masks = [mask for mask in self.masks if not mask.static]
 
     def _reapply_masks(self) -> None:
-        """Reapply all current masks to the puzzle."""
-        self._mask = self._build_puzzle(self.size, self.ACTIVE)
+        """Reapply all current masks to the puzzle mask (the puzzle itself
+        isn't regenerated)."""
+        self._mask = self._build_puzzle(self._size, self.ACTIVE)
         for mask in self.masks:
-            if mask.static and mask.puzzle_size != self.size:
+            if mask.static and mask.puzzle_size != self._size:
                 continue
-            self.apply_mask(mask)
+            self._combine_mask(mask)
 
     # ******************************************************** #
     # ******************** DUNDER METHODS ******************** #
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import string
+import time
 from abc import ABC, abstractmethod
 from functools import wraps
 from typing import TYPE_CHECKING, TypeAlias
@@ -10,6 +11,7 @@ if TYPE_CHECKING:  # pragma: no cover
 
     from . import GameType
     from .game import Puzzle
+    from .word import Word
 
 
 Fit: TypeAlias = tuple[str, list[tuple[int, int]]]
@@ -32,6 +34,77 @@ class WordFitError(Exception):
     pass
 
 
+class Budget:
+    """Wall-clock and step limits for a single puzzle generation.
+
+    Generators call `spend()` for each unit of search work (e.g. every
+    attempted word placement) and stop searching once it returns False,
+    keeping the best result found so far. After generation, `steps`,
+    `elapsed`, and `exhausted` report how much of the budget was used.
+    """
+
+    def __init__(
+        self, timeout: float | None = None, max_steps: int | None = None
+    ) -> None:
+        """Initialize a generation budget.
+
+        Args:
+            timeout: Wall-clock limit in seconds. Defaults to None (unlimited).
+            max_steps: Search step limit. Defaults to None (unlimited).
+
+        Raises:
+            ValueError: Negative `timeout` or `max_steps`.
+        """
+        if timeout is not None and timeout < 0:
+            raise ValueError("Budget timeout must be >= 0.")
+        if max_steps is not None and max_steps < 0:
+            raise ValueError("Budget max_steps must be >= 0.")
+        self.timeout = timeout
+        self.max_steps = max_steps
+        self.start()
+
+    @property
+    def limited(self) -> bool:
+        """Budget has a time or step limit."""
+        return self.timeout is not None or self.max_steps is not None
+
+    @property
+    def remaining(self) -> float | None:
+        """Seconds left before the timeout, or None without a timeout."""
+        if self.timeout is None:
+            return None
+        return max(0.0, self.timeout - (time.perf_counter() - self._started))
+
+    def start(self) -> None:
+        """Reset the steps taken and restart the clock."""
+        self.steps = 0
+        self.elapsed = 0.0
+        self.exhausted = False
+        self._started = time.perf_counter()
+
+    def spend(self, steps: int = 1) -> bool:
+        """Use `steps` of the budget if there is enough left.
+
+        Returns:
+            The steps were spent (searching can continue).
+        """
+        self.elapsed = time.perf_counter() - self._started
+        if (self.max_steps is not None and self.steps + steps > self.max_steps) or (
+            self.timeout is not None and self.elapsed > self.timeout
+        ):
+            self.exhausted = True
+            return False
+        self.steps += steps
+        return True
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(timeout={self.timeout}, "
+            + f"max_steps={self.max_steps}, steps={self.steps}, "
+            + f"elapsed={self.elapsed:.4f}, exhausted={self.exhausted})"
+        )
+
+
 def retry(retries: int = 1000):
     """Custom retry decorator for retrying a function `retries` times.
 
@@ -75,7 +148,7 @@ class Generator(ABC):
             alphabet: Alphabet (letters) to use for the puzzle filler characters.
         """
         if alphabet:
-            self.alphabet = list({c.upper() for c in alphabet if c.isalpha()})
+            self.alphabet = sorted({c.upper() for c in alphabet if c.isalpha()})
         else:
             self.alphabet = ALPHABET
 
@@ -94,3 +167,32 @@ class Generator(ABC):
         Returns:
             The generated puzzle.
         """
+
+    def add_words(self, game: GameType, words: Iterable[Word]) -> Puzzle | None:
+        """Place `words` into the current puzzle of `game` without
+        regenerating it. Generators that can't patch a puzzle return None
+        and the game generates a new puzzle instead.
+
+        Args:
+            game: The base `Game` object (`words` are already in its word list).
+            words: New words to place.
+
+        Returns:
+            The patched puzzle or None if the puzzle needs to be regenerated.
+        """
+        return None
+
+    def remove_words(self, game: GameType, words: Iterable[Word]) -> Puzzle | None:
+        """Remove `words` from the current puzzle of `game` without
+        regenerating it. Generators that can't patch a puzzle return None
+        and the game generates a new puzzle instead.
+
+        Args:
+            game: The base `Game` object (`words` are already removed from
+                its word list).
+            words: Removed words (still holding their puzzle placement).
+
+        Returns:
+            The patched puzzle or None if the puzzle needs to be regenerated.
+        """
+        return None
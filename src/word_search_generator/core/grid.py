@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from .game import Puzzle
+
+
+class GridAlphabetError(Exception):
+    """For when a `Grid` can't hold any more distinct characters."""
+
+    def __init__(self, message="A grid can hold at most 255 distinct characters."):
+        self.message = message
+        super().__init__(self.message)
+
+
+class Grid:
+    """Compact square puzzle grid stored in a single contiguous `bytearray`.
+
+    Each cell holds a one byte code that indexes the grid code table
+    (`alphabet`), where code 0 is always an empty cell (`""`). Whole rows,
+    columns, and diagonals are sliced straight out of the buffer, and a
+    snapshot of the entire grid is a single `bytes` copy.
+
+    The rest of the package works with the nested list `Puzzle` format so
+    use `from_puzzle()` and `to_puzzle()` to convert between the two.
+
+    Example:
+        ```python
+        grid = Grid.from_puzzle(puzzle.puzzle)
+        saved = grid.snapshot()
+        grid[0, 0] = "Z"
+        grid.restore(saved)
+        ```
+    """
+
+    EMPTY = 0
+
+    def __init__(self, size: int, alphabet: Iterable[str] = ()) -> None:
+        """Initialize an empty grid.
+
+        Args:
+            size: Count of rows (and columns).
+            alphabet: Characters to add to the code table up front (any other
+                characters are added as they are written). Defaults to ().
+
+        Raises:
+            ValueError: Negative `size`.
+        """
+        if size < 0:
+            raise ValueError("Grid size must be >= 0.")
+        self.size = size
+        self.alphabet: list[str] = [""]
+        self.codes: dict[str, int] = {"": self.EMPTY}
+        for char in sorted(set(alphabet)):
+            self.code(char)
+        self.cells = bytearray(size * size)
+
+    @classmethod
+    def from_puzzle(cls, puzzle: Puzzle, alphabet: Iterable[str] = ()) -> Grid:
+        """Build a grid from a nested list `Puzzle`.
+
+        Args:
+            puzzle: Puzzle to copy.
+            alphabet: Characters to add to the code table up front.
+                Defaults to ().
+        """
+        grid = cls(len(puzzle), alphabet)
+        code = grid.code
+        grid.cells = bytearray(code(char) for row in puzzle for char in row)
+        return grid
+
+    def to_puzzle(self) -> Puzzle:
+        """Copy the grid into a nested list `Puzzle`."""
+        alphabet = self.alphabet
+        chars = [alphabet[code] for code in self.cells]
+        size = self.size
+        return [chars[i : i + size] for i in range(0, size * size, size)]
+
+    def code(self, char: str) -> int:
+        """Code of `char` in the code table (added if it's new).
+
+        Raises:
+            GridAlphabetError: The code table is full.
+        """
+        code = self.codes.get(char)
+        if code is None:
+            if len(self.alphabet) > 255:
+                raise GridAlphabetError()
+            code = self.codes[char] = len(self.alphabet)
+            self.alphabet.append(char)
+        return code
+
+    def decode(self, codes: Iterable[int]) -> str:
+        """Characters for `codes` (empty cells are skipped)."""
+        alphabet = self.alphabet
+        return "".join(alphabet[code] for code in codes)
+
+    def row(self, row: int) -> bytes:
+        """Codes of every cell in `row`."""
+        return bytes(self.cells[row * self.size : (row + 1) * self.size])
+
+    def column(self, col: int) -> bytes:
+        """Codes of every cell in column `col`, top to bottom."""
+        return bytes(self.cells[col :: self.size])
+
+    def diagonal(self, key: int) -> bytes:
+        """Codes of the top-left to bottom-right diagonal where
+        `col - row == key`, top to bottom."""
+        size = self.size
+        if not -size < key < size:
+            return b""
+        start = key if key >= 0 else -key * size
+        return bytes(self.cells[start : size * size : size + 1][: size - abs(key)])
+
+    def antidiagonal(self, key: int) -> bytes:
+        """Codes of the bottom-left to top-right diagonal where
+        `row + col == key`, bottom to top."""
+        size = self.size
+        if not 0 <= key < size * 2 - 1:
+            return b""
+        col = max(0, key - size + 1)
+        start = (key - col) * size + col
+        count = min(key, size - 1) - col + 1
+        if count == 1:
+            return bytes(self.cells[start : start + 1])
+        return bytes(self.cells[start :: 1 - size][:count])
+
+    def snapshot(self) -> bytes:
+        """Copy of every cell code (see `restore()`)."""
+        return bytes(self.cells)
+
+    def restore(self, snapshot: bytes) -> None:
+        """Return the grid cells to a `snapshot()`."""
+        if len(snapshot) != len(self.cells):
+            raise ValueError("Snapshot doesn't match the grid size.")
+        self.cells[:] = snapshot
+
+    def view(self) -> memoryview:
+        """Zero-copy (row-major, one byte per cell) view of the cell codes."""
+        return memoryview(self.cells)
+
+    def copy(self) -> Grid:
+        """Independent copy of the grid."""
+        grid = Grid(self.size)
+        grid.alphabet = list(self.alphabet)
+        grid.codes = dict(self.codes)
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    def __getitem__(self, position: tuple[int, int]) -> str:
+        row, col = position
+        return self.alphabet[self.cells[row * self.size + col]]
+
+    def __setitem__(self, position: tuple[int, int], char: str) -> None:
+        row, col = position
+        self.cells[row * self.size + col] = self.code(char)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __eq__(self, __o: object) -> bool:
+        if not isinstance(__o, Grid):
+            return False
+        if self.alphabet == __o.alphabet:
+            return self.cells == __o.cells
+        return self.to_puzzle() == __o.to_puzzle()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={self.size})"
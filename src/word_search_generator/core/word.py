@@ -1,12 +1,12 @@
 import colorsys
 import random
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import NamedTuple, TypedDict
 
 from rich.style import Style
 
 from ..utils import BoundingBox
-from .game import Direction
+from .directions import Direction
 from .validator import Validator
 
 
@@ -31,23 +31,40 @@ class KeyInfoJson(TypedDict):
 class Word:
     """This class represents a Word within a WordSearch puzzle."""
 
+    __slots__ = (
+        "text",
+        "secret",
+        "start_row",
+        "start_column",
+        "direction",
+        "_color_seed",
+        "_color",
+    )
+
     def __init__(
         self,
         text: str,
         secret: bool = False,
+        rng: random.Random | None = None,
     ) -> None:
-        """Initialize a Word Search puzzle Word."""
+        """Initialize a Word Search puzzle Word.
+
+        Args:
+            text: Word text.
+            secret: Is the word secret. Defaults to False.
+            rng: Random number generator used to pick the word color.
+                Defaults to None which uses the global `random` module.
+        """
         self.text = text.upper().strip()
         self.start_row: int | None = None
         self.start_column: int | None = None
-        self.coordinates: list[tuple[int, int]] = []
         self.direction: Direction | None = None
         self.secret = secret
-        self.color = colorsys.hsv_to_rgb(
-            random.random(),
-            random.randint(42, 98) / 100,
-            random.randint(40, 90) / 100,
-        )
+        # only a seed is drawn up front, the color itself is picked the
+        # first time a formatter asks for it (see `color`)
+        source = rng if rng is not None else random
+        self._color_seed = source.getrandbits(32)
+        self._color: tuple[float, float, float] | None = None
 
     def validate(
         self, validators: Iterable[Validator], placed_words: list[str]
@@ -84,14 +101,54 @@ class Word:
 
         Note: Used `is not None` since 0 vals for start_row/column are not truthy
         """
-        return all(
-            (
-                self.start_column is not None,
-                self.start_row is not None,
-                self.direction is not None,
-            )
+        return (
+            self.direction is not None
+            and self.start_row is not None
+            and self.start_column is not None
         )
 
+    @property
+    def color(self) -> tuple[float, float, float]:
+        """Random RGB color (each value 0-1) used to highlight the word."""
+        if self._color is None:
+            rng = random.Random(self._color_seed)
+            self._color = colorsys.hsv_to_rgb(
+                rng.random(),
+                rng.randint(42, 98) / 100,
+                rng.randint(40, 90) / 100,
+            )
+        return self._color
+
+    @color.setter
+    def color(self, value: tuple[float, float, float]) -> None:
+        self._color = value
+
+    @property
+    def coordinates(self) -> list[tuple[int, int]]:
+        """Puzzle (row, column) of each word letter. Only the start position
+        and direction are stored so these are worked out on each access."""
+        row, col, direction = self.start_row, self.start_column, self.direction
+        if row is None or col is None or direction is None:
+            return []
+        dr, dc = direction.r_move, direction.c_move
+        return [(row + dr * i, col + dc * i) for i in range(len(self.text))]
+
+    @coordinates.setter
+    def coordinates(self, value: Sequence[tuple[int, int]]) -> None:
+        """Set the word placement from the coordinates of its letters.
+
+        Args:
+            value: Puzzle (row, column) of each letter. An empty sequence
+                removes the word from the puzzle.
+        """
+        if not value:
+            self.remove_from_puzzle()
+            return
+        self.start_row, self.start_column = value[0]
+        if len(value) > 1:
+            (r1, c1), (r2, c2) = value[0], value[1]
+            self.direction = Direction((r2 - r1, c2 - c1))
+
     @property
     def position(self) -> Position:
         """Current start position of the word in the puzzle
@@ -223,7 +280,6 @@ class Word:
         """Remove word placement details when a puzzle is reset."""
         self.start_row = None
         self.start_column = None
-        self.coordinates = []
         self.direction = None
 
     def __bool__(self) -> bool:
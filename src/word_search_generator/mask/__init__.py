@@ -1,5 +1,135 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any, TypeAlias
+
 from ..utils import BoundingBox, find_bounding_box
 
+_TO_BITS = str.maketrans({"*": "1", "#": "0"})
+_FROM_BITS = str.maketrans({"1": "*", "0": "#"})
+
+
+def pack_rows(grid: list[list[str]]) -> list[int]:
+    """Pack a 2-D array of `Mask.ACTIVE`/`Mask.INACTIVE` characters into one
+    integer bitset per row (bit `x` of row `y` is set when `grid[y][x]` is active).
+
+    Args:
+        grid (list[list[str]]): 2-D array to pack.
+
+    Raises:
+        ValueError: `grid` contains characters other than
+            `Mask.ACTIVE` and `Mask.INACTIVE`.
+
+    Returns:
+        list[int]: Packed rows.
+    """
+    return [int("".join(reversed(row)).translate(_TO_BITS) or "0", 2) for row in grid]
+
+
+def unpack_rows(rows: list[int], width: int) -> list[list[str]]:
+    """Unpack integer bitset rows created by `pack_rows()` back into
+    a 2-D array of `Mask.ACTIVE`/`Mask.INACTIVE` characters.
+
+    Args:
+        rows (list[int]): Packed rows.
+        width (int): Number of columns in each row.
+
+    Returns:
+        list[list[str]]: 2-D array.
+    """
+    return [list(format(row, f"0{width}b")[::-1].translate(_FROM_BITS)) for row in rows]
+
+
+def combine_rows(rows: list[int], other: list[int], method: int) -> list[int]:
+    """Combine two sets of packed rows a whole row at a time.
+
+    Args:
+        rows (list[int]): Packed rows being masked.
+        other (list[int]): Packed rows of the mask being applied.
+        method (int): How `other` is applied (1=Standard (Intersection),
+            2=Additive, 3=Subtractive).
+
+    Returns:
+        list[int]: Combined packed rows.
+    """
+    if method == 1:
+        return [a & b for a, b in zip(rows, other, strict=False)]
+    if method == 2:
+        return [a | b for a, b in zip(rows, other, strict=False)]
+    return [a & ~b for a, b in zip(rows, other, strict=False)]
+
+
+# packed rows, width, and mask attributes of a generated mask
+RasterEntry: TypeAlias = tuple[tuple[int, ...], int, dict[str, Any]]
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable version of a mask parameter.
+
+    Raises:
+        TypeError: Parameter can't be used as part of a cache key.
+    """
+    if value is None or isinstance(value, str | int | float | Path):
+        return value
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    raise TypeError(f"Can't cache a mask with a {type(value).__name__} parameter.")
+
+
+class MaskCache:
+    """Least recently used cache of generated mask rasters shared by every
+    puzzle in the process.
+
+    Rasters are keyed by mask class, mask parameters, and puzzle size (see
+    `Mask.cache_key()`) and stored packed (see `Mask.rows`), so a batch of
+    puzzles using the same shape at the same size only draws it once.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize (int, optional): Maximum number of rasters kept before
+                the least recently used one is dropped. Defaults to 128.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, RasterEntry] = OrderedDict()
+
+    def get(self, key: Hashable) -> RasterEntry | None:
+        """Cached (rows, width, state) for `key` or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, entry: RasterEntry) -> None:
+        """Store `entry` under `key`, dropping the least recently used
+        entries when over `maxsize`."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached rasters and reset the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+MASK_CACHE = MaskCache()
+
+# mask attributes that don't change the generated raster
+_UNCACHED_ATTRS = frozenset({"_grid", "_rows", "_width", "_method"})
+
 
 class MaskNotGenerated(Exception):
     """Mask has not yet been generated."""
@@ -14,6 +144,20 @@ class Mask:
     ACTIVE = "*"
     INACTIVE = "#"
     METHODS = [1, 2, 3]
+    # can generated rasters be shared through `MASK_CACHE`, only for classes
+    # that set it themselves since the key only covers instance attributes
+    # (see `__init_subclass__()`)
+    cacheable = False
+    # attributes set by `generate()` rather than the constructor (left out of
+    # `cache_key()` so the key only depends on the mask parameters and size)
+    generated_attrs: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # caching is never inherited, a subclass can draw from state
+        # (class attributes, files, globals) the cache key doesn't cover
+        if "cacheable" not in cls.__dict__:
+            cls.cacheable = False
 
     def __init__(
         self,
@@ -39,13 +183,58 @@ class Mask:
         self.method = method
         self.static = static
         self._puzzle_size: int = 0
-        self._mask: list[list[str]] = []
+        # the mask is stored unpacked (`_grid`), packed (`_rows`), or both
+        self._grid: list[list[str]] | None = []
+        self._rows: list[int] | None = None
+        self._width: int = 0
+
+    @property
+    def _mask(self) -> list[list[str]]:
+        """Mask as a 2-D array (list[list[str]]), unpacked from `Mask.rows`
+        when needed. Since the returned array can be drawn on directly,
+        `Mask.rows` will be repacked from it the next time it is used."""
+        if self._grid is None:
+            self._grid = unpack_rows(self._rows or [], self._width)
+        self._rows = None
+        return self._grid
+
+    @_mask.setter
+    def _mask(self, value: list[list[str]]) -> None:
+        self._grid = value
+        self._rows = None
+        self._width = len(value[0]) if value else 0
 
     @property
     def mask(self) -> list[list[str]]:
         """Mask as a 2-D array (list[list[str]])."""
         return self._mask
 
+    @property
+    def rows(self) -> list[int]:
+        """Mask packed into one integer bitset per row (bit `x` of row `y` is set
+        when that cell is active). Used for combining and transforming masks
+        a whole row at a time. Don't modify the returned list.
+
+        Raises:
+            ValueError: Mask contains characters other than `Mask.ACTIVE`
+                and `Mask.INACTIVE`.
+        """
+        if self._rows is None:
+            self._rows = pack_rows(self._grid or [])
+        return self._rows
+
+    @rows.setter
+    def rows(self, value: list[int]) -> None:
+        self._rows = value
+        self._grid = None
+
+    def _packed(self) -> list[int] | None:
+        """`Mask.rows` or None if the mask can't be packed."""
+        try:
+            return self.rows
+        except ValueError:
+            return None
+
     @property
     def method(self) -> int:
         """Mask method."""
@@ -119,9 +308,22 @@ class Mask:
         for filling mask shapes so it needs to know the actual mask bounds no
         matter where lie."""
 
-        if not self.mask:
+        if not self._width:
             return None
-        return find_bounding_box(self._mask, self.ACTIVE)
+        rows = self._packed()
+        if rows is None:
+            return find_bounding_box(self._mask, self.ACTIVE)
+        size = len(rows)
+        filled = [y for y, row in enumerate(rows) if row]
+        if not filled:
+            return ((0, 0), (size, size))
+        combined = 0
+        for row in rows:
+            combined |= row
+        return (
+            ((combined & -combined).bit_length() - 1, filled[0]),
+            (combined.bit_length() - 1, filled[-1]),
+        )
 
     @staticmethod
     def build_mask(size: int, char: str) -> list[list[str]]:
@@ -143,6 +345,55 @@ class Mask:
         self._mask = self.build_mask(self.puzzle_size, self.INACTIVE)
         self._draw()
 
+    def cache_key(self) -> Hashable | None:
+        """Key identifying the raster `generate()` produces at the current
+        `puzzle_size` (mask class, attributes, and size), or None when the
+        mask can't be cached."""
+        if not self.cacheable:
+            return None
+        try:
+            params = tuple(
+                sorted(
+                    (name, _freeze(value))
+                    for name, value in self.__dict__.items()
+                    if name not in _UNCACHED_ATTRS and name not in self.generated_attrs
+                )
+            )
+        except TypeError:
+            return None
+        return (type(self), params)
+
+    def render(self, puzzle_size: int) -> None:
+        """Generate the mask at `puzzle_size`, reusing the raster from
+        `MASK_CACHE` when an identical mask has already been generated
+        at that size.
+
+        Args:
+            puzzle_size (int): Size of the puzzle the mask will applied to.
+        """
+        self.puzzle_size = puzzle_size
+        key = self.cache_key()
+        if key is None:
+            self.generate(puzzle_size)
+            return
+        entry = MASK_CACHE.get(key)
+        if entry is None:
+            self.generate(puzzle_size)
+            rows = self._packed()
+            if rows is not None:
+                state = {
+                    name: list(value) if isinstance(value, list) else value
+                    for name, value in self.__dict__.items()
+                    if name not in _UNCACHED_ATTRS
+                }
+                MASK_CACHE.put(key, (tuple(rows), self._width, state))
+            return
+        packed, width, state = entry
+        for name, value in state.items():
+            self.__dict__[name] = list(value) if isinstance(value, list) else value
+        self._width = width
+        self.rows = list(packed)
+
     def _draw(self) -> None:
         """Placeholder for custom subclass `_draw()` methods.
 
@@ -188,22 +439,43 @@ class Mask:
 
     def invert(self) -> None:
         """Invert the mask. Has no effect on the mask `method`."""
-        self._mask = [
-            [self.ACTIVE if c == self.INACTIVE else self.INACTIVE for c in row]
-            for row in self.mask
-        ]
+        rows = self._packed()
+        if rows is None:
+            self._mask = [
+                [self.ACTIVE if c == self.INACTIVE else self.INACTIVE for c in row]
+                for row in self.mask
+            ]
+            return
+        full = (1 << self._width) - 1
+        self.rows = [row ^ full for row in rows]
 
     def flip_horizontal(self) -> None:
         """Flip mask along the vertical axis (left to right)."""
-        self._mask = [r[::-1] for r in self.mask]
+        rows = self._packed()
+        if rows is None:
+            self._mask = [r[::-1] for r in self.mask]
+            return
+        width = self._width
+        self.rows = [int(format(row, f"0{width}b")[::-1], 2) for row in rows]
 
     def flip_vertical(self) -> None:
         """Flip mask along the horizontal axis (top to bottom)."""
-        self._mask = self.mask[::-1]
+        rows = self._packed()
+        if rows is None:
+            self._mask = self.mask[::-1]
+            return
+        self.rows = rows[::-1]
 
     def transpose(self) -> None:
         """Reverse/permute the axes of the mask."""
-        self._mask = list(map(list, zip(*self.mask, strict=False)))
+        rows = self._packed()
+        if rows is None:
+            self._mask = list(map(list, zip(*self.mask, strict=False)))
+            return
+        width = self._width
+        columns = zip(*(format(row, f"0{width}b")[::-1] for row in rows), strict=False)
+        self._width = len(rows)
+        self.rows = [int("".join(column)[::-1], 2) for column in columns]
 
     def reset_points(self) -> None:
         """Reset all mask coordinate points."""
@@ -214,6 +486,8 @@ class CompoundMask(Mask):
     """This class represents a subclass of the Mask object
     and allows you to generate a single mask from a set of masks."""
 
+    cacheable = True
+
     def __init__(
         self, masks: list[Mask] | None = None, method: int = 1, static: bool = True
     ) -> None:
@@ -243,7 +517,7 @@ class CompoundMask(Mask):
         self.puzzle_size = puzzle_size
         self._mask = self.build_mask(self.puzzle_size, self.ACTIVE)
         for mask in self.masks:
-            mask.generate(self.puzzle_size)
+            mask.render(self.puzzle_size)
             self._apply_mask(mask)
 
     def _apply_mask(self, mask: Mask) -> None:
@@ -259,22 +533,7 @@ class CompoundMask(Mask):
             raise MaskNotGenerated(
                 "Please use `object.generate()` before calling `object.show()`."
             )
-        for y in range(self.puzzle_size):
-            for x in range(self.puzzle_size):
-                if mask.method == 1:
-                    if (
-                        mask.mask[y][x] == self.ACTIVE
-                        and self.mask[y][x] == self.ACTIVE
-                    ):
-                        self.mask[y][x] = self.ACTIVE
-                    else:
-                        self.mask[y][x] = self.INACTIVE
-                elif mask.method == 2:
-                    if mask.mask[y][x] == self.ACTIVE:
-                        self.mask[y][x] = self.ACTIVE
-                else:
-                    if mask.mask[y][x] == self.ACTIVE:
-                        self.mask[y][x] = self.INACTIVE
+        self.rows = combine_rows(self.rows, mask.rows, mask.method)
 
 
 # Import all base masks shapes for easier access
@@ -1,10 +1,24 @@
-from pathlib import Path
+from __future__ import annotations
+
+import os
+from array import array
+from collections import OrderedDict
+from itertools import compress
+from typing import TYPE_CHECKING
 
 from PIL import Image, ImageChops
 
 from ..utils import in_bounds
 from . import Mask, MaskNotGenerated
 
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Hashable
+    from pathlib import Path
+
+# normalized (thresholded and trimmed) images by (path, mtime, threshold)
+_IMAGE_CACHE: OrderedDict[tuple[str, int, int], Image.Image] = OrderedDict()
+IMAGE_CACHE_SIZE = 16
+
 
 class ContrastError(Exception):
     pass
@@ -14,6 +28,8 @@ class Bitmap(Mask):
     """This class represents a subclass of the Mask object
     and generates a mask from a set of coordinate points."""
 
+    cacheable = True
+
     def __init__(
         self,
         points: list[tuple[int, int]] | None = None,
@@ -52,6 +68,9 @@ class BitmapImage(Bitmap):
     """This class represents a subclass of the Bitmap object
     and generates a mask a mask from a raster image."""
 
+    cacheable = True
+    generated_attrs = frozenset({"points"})
+
     threshold = 200  # normalization contrast point
 
     def __init__(self, fp: str | Path, method: int = 1, static: bool = False) -> None:
@@ -77,14 +96,72 @@ class BitmapImage(Bitmap):
         """Generate a new mask at `puzzle_size` from a raster image."""
         self.puzzle_size = puzzle_size
         self._mask = self.build_mask(self.puzzle_size, self.INACTIVE)
-        img = Image.open(self.fp, formats=("BMP", "JPEG", "PNG"))
-        self.points = BitmapImage.process_image(
-            img, self.puzzle_size, BitmapImage.threshold
+        image = BitmapImage.load_image(self.fp, BitmapImage.threshold)
+        pixels, width = BitmapImage.extract_pixels(
+            image, self.puzzle_size, BitmapImage.threshold
         )
+        self.points = [(i % width, i // width) for i in pixels]
         if not self.points:
             raise ContrastError("The provided image lacked enough contrast.")
         self._draw()
 
+    def cache_key(self) -> Hashable | None:
+        """Key identifying the generated raster, which also includes the
+        image file modification time so edited images are redrawn and the
+        (class level) `threshold`."""
+        key = super().cache_key()
+        try:
+            mtime = os.stat(self.fp).st_mtime_ns
+        except OSError:
+            return None
+        return None if key is None else (key, mtime, BitmapImage.threshold)
+
+    @staticmethod
+    def load_image(fp: str | Path, threshold: int = 200) -> Image.Image:
+        """Open the raster image at `fp` and normalize it (convert it to
+        black-and-white and trim any excess pixels from the edges).
+
+        Normalized images are cached by path and modification time so
+        resizing a mask doesn't reopen and decode the image again.
+        """
+        key = (os.path.realpath(fp), os.stat(fp).st_mtime_ns, threshold)
+        image = _IMAGE_CACHE.get(key)
+        if image is None:
+            with Image.open(fp, formats=("BMP", "JPEG", "PNG")) as img:
+                image = BitmapImage.normalize_image(img, threshold)
+            _IMAGE_CACHE[key] = image
+            while len(_IMAGE_CACHE) > IMAGE_CACHE_SIZE:
+                _IMAGE_CACHE.popitem(last=False)
+        _IMAGE_CACHE.move_to_end(key)
+        return image
+
+    @staticmethod
+    def normalize_image(image: Image.Image, threshold: int = 200) -> Image.Image:
+        """Convert a `PIL.Image` object to black-and-white (in a single
+        lookup table pass) and trim any excess pixels from the edges."""
+        lut = [255 if px > threshold else 0 for px in range(256)]
+        image = image.convert("L").point(lut, mode="1")
+        diff = ImageChops.difference(image, Image.new("L", image.size, (255)))
+        return image.crop(diff.getbbox())
+
+    @staticmethod
+    def extract_pixels(
+        image: Image.Image, size: int, threshold: int = 200
+    ) -> tuple[array[int], int]:
+        """Resize a normalized image to fit within `size` and find its
+        black pixels.
+
+        Returns:
+            tuple[array[int], int]: Flat indexes of the black pixels
+                (row by row) and the width of the resized image.
+        """
+        image = image.copy()
+        image.thumbnail((size, size))
+        data = image.convert("L").tobytes()
+        black = bytes(1 if px <= threshold else 0 for px in range(256))
+        pixels = array("L", compress(range(len(data)), data.translate(black)))
+        return pixels, image.width
+
     @staticmethod
     def process_image(
         image: Image.Image, size: int, threshold: int = 200
@@ -92,16 +169,7 @@ class BitmapImage(Bitmap):
         """Take a `PIL.Image` object, convert it to black-and-white, trim any
         excess pixels from the edges, resize it, and return all of the black
         pixels as a (x, y) coordinates."""
-        image = image.convert("L").point(
-            lambda px: 255 if px > BitmapImage.threshold else 0, mode="1"
+        indexes, w = BitmapImage.extract_pixels(
+            BitmapImage.normalize_image(image, BitmapImage.threshold), size, threshold
         )
-        diff = ImageChops.difference(image, Image.new("L", image.size, (255)))
-        bbox = diff.getbbox()
-        image = image.crop(bbox)
-        image.thumbnail((size, size))
-        w, _ = image.size
-        return [
-            (0 if i == 0 else i % w, i // w)
-            for i, px in enumerate(image.getdata())
-            if px <= threshold
-        ]
+        return [(i % w, i // w) for i in indexes]
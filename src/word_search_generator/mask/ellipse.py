@@ -1,6 +1,7 @@
 import math
 
-from ..utils import distance, float_range
+from ..utils import distance
+from . import MaskNotGenerated
 from .bitmap import Bitmap
 
 
@@ -8,6 +9,9 @@ class Ellipse(Bitmap):
     """This class represents a subclass of the Bitmap object
     and generates an Ellipse masks."""
 
+    cacheable = True
+    generated_attrs = frozenset({"points", "_spans"})
+
     def __init__(
         self,
         width: int | None = None,
@@ -34,12 +38,13 @@ class Ellipse(Bitmap):
         self.width = width
         self.height = height
         self.center = center
+        self._spans: list[tuple[int, int, int]] = []
 
     def generate(self, puzzle_size: int) -> None:
         """Generate a new mask at `puzzle_size`."""
         self.puzzle_size = puzzle_size
         self._mask = self.build_mask(self.puzzle_size, self.INACTIVE)
-        self.points = Ellipse.calculate_ellipse_points(
+        rows = Ellipse.calculate_ellipse_rows(
             self.width if self.width else self.puzzle_size,
             self.height if self.height else self.puzzle_size,
             (
@@ -49,8 +54,26 @@ class Ellipse(Bitmap):
             ),
             puzzle_size,
         )
+        self.points = Ellipse.rows_to_points(rows)
+        self._spans = [(int(y), int(x1), int(x2)) for y, x1, x2 in rows]
         self._draw()
 
+    def _draw(self) -> None:
+        """Fill each row span of the ellipse directly into `Object._mask`.
+
+        Raises:
+            MaskNotGenerated: Mask has not yet been generated.
+        """
+        if not self.puzzle_size:
+            raise MaskNotGenerated(
+                "No puzzle size specified. Please use the `.generate()` method."
+            )
+        size = self.puzzle_size
+        for y, x1, x2 in self._spans:
+            x1, x2 = max(x1, 0), min(x2, size - 1)
+            if 0 <= y < size and x1 <= x2:
+                self._mask[y][x1 : x2 + 1] = [self.ACTIVE] * (x2 - x1 + 1)
+
     @staticmethod
     def calculate_ellipse_points(
         width: int,
@@ -59,6 +82,37 @@ class Ellipse(Bitmap):
         puzzle_size: int,
     ) -> list[tuple[int, int]]:
         """Calculate all coordinates within an ellipse."""
+        return Ellipse.rows_to_points(
+            Ellipse.calculate_ellipse_rows(width, height, origin, puzzle_size)
+        )
+
+    @staticmethod
+    def rows_to_points(
+        rows: list[tuple[float, float, float]],
+    ) -> list[tuple[int, int]]:
+        """Expand the rows from `calculate_ellipse_rows()` into coordinates."""
+        return [
+            (int(x1 + i), int(y)) for y, x1, x2 in rows for i in range(int(x2 - x1) + 1)
+        ]
+
+    @staticmethod
+    def calculate_ellipse_rows(
+        width: int,
+        height: int,
+        origin: tuple[int, int],
+        puzzle_size: int,
+    ) -> list[tuple[float, float, float]]:
+        """Calculate the horizontal span of an ellipse on each of its rows.
+
+        Instead of checking the distance of every candidate point, the half-width
+        of the ellipse is solved for each row and then only the points at the
+        edges of the span are checked with `within_radius()` (so the result is
+        exactly the same set of points).
+
+        Returns:
+            list[tuple[float, float, float]]: Each row as (y, first x, last x)
+                before being truncated to puzzle coordinates.
+        """
         width_r = width / 2
         height_r = height / 2
         ratio = width_r / height_r
@@ -80,19 +134,35 @@ class Ellipse(Bitmap):
             y_offset = origin[1] - 1
         else:
             y_offset = origin[1]
-        # check all points and see if they fit inside of the ellipse
-        points = []
+        # candidate x values (minX + i) are symmetric around 0 so only the
+        # last one inside of the ellipse needs to be found for each row
+        rows = []
         minY = -max_pointsY / 2 + 1
-        maxY = max_pointsY / 2 - 1
         minX = -max_pointsX / 2 + 1
-        maxX = max_pointsX / 2 - 1
-        for y in float_range(minY, maxY + 1):
-            for x in float_range(minX, maxX + 1):
-                if Ellipse.within_radius(x, y, width_r, ratio):
-                    points.append((int(x + x_offset), int(y + y_offset)))
-        return points
+        count = max_pointsX - 1
+        middle = count // 2
+        for j in range(max_pointsY - 1):
+            y = minY + j
+            if count < 1 or not Ellipse.within_radius(minX + middle, y, width_r, ratio):
+                continue
+            half = math.sqrt(max(width_r**2 - (y * ratio) ** 2, 0))
+            last = min(max(math.floor(half - minX), middle), count - 1)
+            while last + 1 < count and Ellipse.within_radius(
+                minX + last + 1, y, width_r, ratio
+            ):
+                last += 1
+            while not Ellipse.within_radius(minX + last, y, width_r, ratio):
+                last -= 1
+            rows.append(
+                (
+                    y + y_offset,
+                    minX + count - 1 - last + x_offset,
+                    minX + last + x_offset,
+                )
+            )
+        return rows
 
     @staticmethod
-    def within_radius(x: int, y: int, radius: float, ratio: float) -> bool:
+    def within_radius(x: float, y: float, radius: float, ratio: float) -> bool:
         """Check if a coordinate is within a given radius."""
         return distance(x, y, ratio) <= radius
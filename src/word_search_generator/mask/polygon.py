@@ -8,6 +8,8 @@ class Polygon(Mask):
     """This class represents a subclass of the Mask object
     and generates a polygon mask from a set of coordinate points."""
 
+    cacheable = True
+
     def __init__(
         self,
         points: list[tuple[int, int]] | None = None,
@@ -119,39 +121,58 @@ class Polygon(Mask):
                 self.mask[y][x] = c
 
     def _fill_shape(self, c: str) -> None:
-        """Fill the interior of a polygon using the single character string `c`."""
-
-        def ray_casting(point, polygon):
-            """Ray Casting algorithm used to determine if a
-            coordinate is within a polygon."""
-            x, y = point
-            ct = 0
-            for i in range(len(polygon) - 1):
-                x1, y1 = polygon[i]
-                x2, y2 = polygon[i + 1]
-                if (y < y1) != (y < y2) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
-                    ct += 1
-            return ct % 2 == 1
+        """Fill the interior of a polygon using the single character string `c`.
 
+        Uses a scanline fill over an edge table: for each row the crossings of
+        all active edges are found once and every cell between alternating
+        pairs of crossings is filled (the even-odd rule, so the result matches
+        casting a ray to the right from every cell)."""
         if not self.puzzle_size or not self.bounding_box:
             raise MaskNotGenerated(
                 "No puzzle size specified. Please use the `generate()` method."
             )
 
-        # check all points within the polygon bounding box
+        # only rows/columns within the polygon bounding box are filled
         bbox = self.bounding_box
         min_x, min_y = bbox[0]
         max_x, max_y = bbox[1]
+        min_x, min_y = max(min_x, 0), max(min_y, 0)
+        max_x = min(max_x, self.puzzle_size - 1)
+        max_y = min(max_y, self.puzzle_size - 1)
+
+        # edge table (horizontal edges never cross a scanline)
+        path = self.points + [self.points[0]]
+        edges = sorted(
+            (min(y1, y2), max(y1, y2), x1, y1, x2, y2)
+            for (x1, y1), (x2, y2) in zip(path, path[1:], strict=False)
+            if y1 != y2
+        )
+        active: list[tuple[int, int, int, int, int, int]] = []
+        i = 0
         for y in range(min_y, max_y + 1):
-            for x in range(min_x, max_x + 1):
-                in_polygon = ray_casting((x, y), self.points + [self.points[0]])
-                if in_polygon and in_bounds(x, y, self.puzzle_size, self.puzzle_size):
-                    self.mask[y][x] = c
+            while i < len(edges) and edges[i][0] <= y:
+                active.append(edges[i])
+                i += 1
+            active = [edge for edge in active if y < edge[1]]
+            if not active:
+                continue
+            crossings = sorted(
+                (x2 - x1) * (y - y1) / (y2 - y1) + x1 for _, _, x1, y1, x2, y2 in active
+            )
+            # a cell is inside when an odd number of crossings lie to its right
+            row = self.mask[y]
+            for j in range((len(crossings) + 1) % 2, len(crossings), 2):
+                start = max(math.ceil(crossings[j - 1]) if j else min_x, min_x)
+                end = min(math.ceil(crossings[j]) - 1, max_x)
+                if start <= end:
+                    row[start : end + 1] = [c] * (end - start + 1)
 
 
 class Rectangle(Polygon):
     """This subclass of `Polygon` represents a Rectangle mask object."""
 
+    cacheable = True
+
     def __init__(
         self,
         width: int,
@@ -187,6 +208,9 @@ class Rectangle(Polygon):
 class RegularPolygon(Polygon):
     """This subclass of `Polygon` represents a RegularPolygon mask object."""
 
+    cacheable = True
+    generated_attrs = frozenset({"points"})
+
     def __init__(
         self,
         vertices: int = 3,
@@ -284,6 +308,9 @@ class RegularPolygon(Polygon):
 class Star(Polygon):
     """This subclass of `Polygon` represents a Star mask object."""
 
+    cacheable = True
+    generated_attrs = frozenset({"points"})
+
     def __init__(
         self,
         outer_vertices: int = 5,
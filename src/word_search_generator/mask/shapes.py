@@ -17,11 +17,14 @@ def get_shape_objects():
 
 
 class Circle(Ellipse):
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class Club(CompoundMask):
+    cacheable = True
     min_size = 18
 
     def __init__(self) -> None:
@@ -82,11 +85,15 @@ for a {self.__class__.__name__} mask."
 
 
 class Diamond(RegularPolygon):
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__(vertices=4, angle=90)
 
 
 class Donut(CompoundMask):
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -112,6 +119,7 @@ class Donut(CompoundMask):
 
 
 class Fish(CompoundMask):
+    cacheable = True
     min_size = 18
 
     def __init__(self) -> None:
@@ -162,6 +170,7 @@ for a {self.__class__.__name__} mask."
 
 
 class Flower(CompoundMask):
+    cacheable = True
     min_size = 9
 
     def __init__(self) -> None:
@@ -196,6 +205,7 @@ for a {self.__class__.__name__} mask."
 
 
 class Heart(CompoundMask):
+    cacheable = True
     min_size = 8
 
     def __init__(self) -> None:
@@ -269,21 +279,28 @@ for a {self.__class__.__name__} mask."
 
 
 class Hexagon(RegularPolygon):
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__(vertices=6, angle=90)
 
 
 class Octagon(RegularPolygon):
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__(vertices=8, angle=22.5)
 
 
 class Pentagon(RegularPolygon):
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__(vertices=5)
 
 
 class Spade(CompoundMask):
+    cacheable = True
     min_size = 18
 
     def __init__(self) -> None:
@@ -361,11 +378,15 @@ for a {self.__class__.__name__} mask."
 
 
 class Star5(Star):
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__()
 
 
 class Star6(CompoundMask):
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__()
         self.masks = [
@@ -375,11 +396,15 @@ class Star6(CompoundMask):
 
 
 class Star8(Star):
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__(outer_vertices=8)
 
 
 class Tree(CompoundMask):
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -420,6 +445,8 @@ class Tree(CompoundMask):
 
 
 class Triangle(RegularPolygon):
+    cacheable = True
+
     def __init__(self) -> None:
         super().__init__(vertices=3)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+import os
 import random
 from typing import TYPE_CHECKING, TypeAlias
 
@@ -40,11 +41,19 @@ def float_range(
         count += 1
 
 
-def distance(x: int, y: int, ratio: float) -> float:
+def distance(x: float, y: float, ratio: float) -> float:
     """Calculate the distance between two coordinates on a grid."""
     return math.sqrt(math.pow(y * ratio, 2) + math.pow(x, 2))
 
 
+def available_cpus() -> int:
+    """Count of CPUs the current process can run on (respecting its CPU
+    affinity where supported)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
 def in_bounds(x: int, y: int, width: int, height: int) -> bool:
     """Validate position (x, y) is within the supplied bounds."""
     return x >= 0 and x < width and y >= 0 and y < height
@@ -148,8 +157,12 @@ def get_answer_key_str(words: WordSet, bbox: BoundingBox) -> str:
     return ", ".join(get_answer_key_list(words, bbox))
 
 
-def get_random_words(n: int, max_length: int | None = None) -> list[str]:
-    """Return a list of random dictionary words."""
+def get_random_words(
+    n: int, max_length: int | None = None, rng: random.Random | None = None
+) -> list[str]:
+    """Return a list of random dictionary words. Provide `rng` to draw the
+    words from a specific random number generator instead of the global one."""
+    source = rng if rng is not None else random
     if max_length:
-        return random.sample([word for word in WORD_LIST if len(word) <= max_length], n)
-    return random.sample(WORD_LIST, n)
+        return source.sample([word for word in WORD_LIST if len(word) <= max_length], n)
+    return source.sample(WORD_LIST, n)
@@ -1,4 +1,10 @@
 __all__ = [
+    "InputOrder",
+    "LongestFirst",
+    "MostConstrainedFirst",
+    "ParallelWordSearchGenerator",
+    "TiledWordSearchGenerator",
+    "WordOrder",
     "WordSearchFormatter",
     "WordSearchGenerator",
     "WordSearch",
@@ -6,4 +12,7 @@ __all__ = [
 
 from ._formatter import WordSearchFormatter
 from ._generator import WordSearchGenerator
+from ._ordering import InputOrder, LongestFirst, MostConstrainedFirst, WordOrder
+from ._parallel import ParallelWordSearchGenerator
+from ._tiled import TiledWordSearchGenerator
 from .word_search import WordSearch
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+
+from ..utils import in_bounds
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from ..core.game import Puzzle
+
+
+# puzzle lines (∂row, ∂col) that pass through a single cell
+LINES = ((0, 1), (1, 0), (1, 1), (-1, 1))
+# stand-in for empty puzzle cells so words can't match across gaps
+EMPTY = " "
+
+
+class DuplicateDetector:
+    """Detects duplicate copies of placed words created by writing a
+    single character into a puzzle.
+
+    All placed words (and their reverses) are compiled into a single
+    Aho-Corasick automaton so each check is one pass over the four puzzle
+    lines running through the changed cell, no matter how many words have
+    been placed. Words are added and removed as they are placed and rolled
+    back. Words can be compiled into the automaton ahead of time (see
+    `reserve()`) so adding them later doesn't need a recompile.
+    """
+
+    def __init__(self, words: Iterable[str] | None = None) -> None:
+        """Initialize a duplicate word detector.
+
+        Args:
+            words: Currently placed word texts. Defaults to None.
+        """
+        self._words: set[str] = set(words) if words else set()
+        self._reserved: set[str] = set()
+        self._compiled = False
+        self._goto: list[dict[str, int]] = []
+        self._fail: list[int] = []
+        self._output: list[list[str]] = []
+        self.radius = 0
+
+    @property
+    def words(self) -> set[str]:
+        """Word texts the detector is currently checking for."""
+        return set(self._words)
+
+    def reserve(self, words: Iterable[str]) -> None:
+        """Compile `words` into the automaton up front without checking for
+        them yet, so they can be added (and removed) without a recompile."""
+        reserved = set(words) - self._reserved
+        if reserved:
+            self._reserved.update(reserved)
+            self._compiled = False
+
+    def add(self, word: str) -> None:
+        """Start checking for duplicates of `word`."""
+        if word not in self._words:
+            self._words.add(word)
+            if word in self._reserved and self._compiled:
+                self.radius = max(self.radius, len(word))
+            else:
+                self._compiled = False
+
+    def remove(self, word: str) -> None:
+        """Stop checking for duplicates of `word`."""
+        if word in self._words:
+            self._words.discard(word)
+            if word in self._reserved and self._compiled:
+                if len(word) == self.radius:
+                    self.radius = max(map(len, self._words), default=0)
+            else:
+                self._compiled = False
+
+    def compile(self) -> None:
+        """Build the Aho-Corasick automaton for the current (and reserved)
+        words."""
+        goto: list[dict[str, int]] = [{}]
+        output: list[list[str]] = [[]]
+        for word in self._words | self._reserved:
+            for pattern in {word, word[::-1]}:
+                node = 0
+                for char in pattern:
+                    if char not in goto[node]:
+                        goto.append({})
+                        output.append([])
+                        goto[node][char] = len(goto) - 1
+                    node = goto[node][char]
+                output[node].append(word)
+
+        # breadth-first pass to link each node to its longest proper suffix
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail[child] = goto[state].get(char, 0)
+                output[child] = output[child] + output[fail[child]]
+
+        self._goto, self._fail, self._output = goto, fail, output
+        self.radius = max(map(len, self._words), default=0)
+        self._compiled = True
+
+    def matches(self, text: str) -> list[tuple[int, str]]:
+        """Find all placed words (or their reverses) within `text`.
+
+        Returns:
+            List of (start index, word text) for every match.
+        """
+        if not self._compiled:
+            self.compile()
+        goto, fail, output = self._goto, self._fail, self._output
+        words = self._words
+        found = []
+        node = 0
+        for i, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for word in output[node]:
+                if word in words:
+                    found.append((i - len(word) + 1, word))
+        return found
+
+    def no_duped_words(
+        self,
+        puzzle: Puzzle,
+        char: str,
+        position: tuple[int, int],
+        current_word: str | None = None,
+    ) -> bool:
+        """Make sure that writing `char` at `position` in `puzzle` will not
+        create a duplicate of any placed word.
+
+        Args:
+            puzzle: Current puzzle state.
+            char: Character to be written.
+            position: Puzzle (row, column) for the character.
+            current_word: Word currently being placed. Placed words that fit
+                inside of it (or that it fits inside of) are ignored.
+                Defaults to None.
+
+        Returns:
+            No new duplicate word would be created.
+        """
+        if not self._words:
+            return True
+        if not self._compiled:
+            self.compile()
+        row, col = position
+        size = len(puzzle)
+        reach = self.radius - 1
+        for dr, dc in LINES:
+            # capture the line through `position` out to the longest word length
+            chars: list[str] = []
+            center = 0
+            for step in range(-reach, reach + 1):
+                r, c = row + dr * step, col + dc * step
+                if not in_bounds(c, r, size, size):
+                    continue
+                if step == 0:
+                    center = len(chars)
+                    chars.append(char)
+                else:
+                    chars.append(puzzle[r][c] or EMPTY)
+            for start, word in self.matches("".join(chars)):
+                if not start <= center < start + len(word):
+                    continue
+                if current_word and (word in current_word or current_word in word):
+                    continue
+                return False
+        return True
+
+    def find_duplicates(
+        self, puzzle: Puzzle, cells: Iterable[tuple[int, int]] | None = None
+    ) -> list[list[tuple[int, int]]]:
+        """Find every copy of a placed word (or its reverse) along the puzzle
+        lines running through `cells`.
+
+        Args:
+            puzzle: Current puzzle state.
+            cells: Puzzle (row, column) positions to check. Defaults to None
+                which checks every line of the puzzle.
+
+        Returns:
+            Puzzle coordinates of each match.
+        """
+        if not self._words:
+            return []
+        size = len(puzzle)
+        if cells is None:
+            keys = {
+                (line, key) for line in LINES for key in range(-size + 1, size * 2 - 1)
+            }
+        else:
+            keys = {(line, line_key(line, cell)) for cell in cells for line in LINES}
+        found = []
+        for line, key in keys:
+            coords = line_coordinates(line, key, size)
+            if not coords:
+                continue
+            text = "".join(puzzle[r][c] or EMPTY for r, c in coords)
+            for start, word in self.matches(text):
+                found.append(coords[start : start + len(word)])
+        return found
+
+
+def line_key(line: tuple[int, int], cell: tuple[int, int]) -> int:
+    """Identify the puzzle line heading in `line` that passes through `cell`."""
+    row, col = cell
+    return {
+        (0, 1): row,
+        (1, 0): col,
+        (1, 1): col - row,
+        (-1, 1): row + col,
+    }[line]
+
+
+def line_coordinates(
+    line: tuple[int, int], key: int, size: int
+) -> list[tuple[int, int]]:
+    """Puzzle coordinates, in order, of the line heading in `line` identified
+    by `key` (see `line_key()`). Empty for keys outside of the puzzle."""
+    if line == (0, 1):
+        cells = [(key, col) for col in range(size)] if 0 <= key < size else []
+    elif line == (1, 0):
+        cells = [(row, key) for row in range(size)] if 0 <= key < size else []
+    elif line == (1, 1):
+        cells = [(row, row + key) for row in range(size)]
+    else:
+        cells = [(key - col, col) for col in range(size)]
+    return [(r, c) for r, c in cells if in_bounds(c, r, size, size)]
@@ -209,21 +209,20 @@ class WordSearchFormatter(Formatter):
             word_list = [word.lower() for word in word_list]
             puzzle = [[c.lower() for c in line] for line in puzzle]
 
-        data = json.dumps(
-            {
-                "puzzle": puzzle,
-                "words": [
-                    word.text.lower() if lowercase else word.text
-                    for word in game.placed_words
-                ],
-                "key": {
-                    word.text.lower() if lowercase else word.text: word.key_info_json
-                    for word in game.placed_words
-                },
-            }
-        )
-        # Return data for integration instead of writing out
-        return data
+        data = {
+            "puzzle": puzzle,
+            "words": [
+                word.text.lower() if lowercase else word.text
+                for word in game.placed_words
+            ],
+            "key": {
+                word.text.lower() if lowercase else word.text: word.key_info_json
+                for word in game.placed_words
+            },
+        }
+        with open(path, "x", encoding="utf-8") as f:
+            json.dump(data, f)
+        return path.absolute()
 
     def write_pdf_file(
         self,
@@ -3,105 +3,315 @@ from __future__ import annotations
 import random
 from typing import TYPE_CHECKING, TypeAlias
 
-from ..core.generator import Generator, WordFitError, retry
+from ..core.generator import ALPHABET, Generator
 from ..core.word import Direction, Word
 from ..utils import in_bounds
+from ._detector import DuplicateDetector
+from ._ordering import MostConstrainedFirst, WordOrder
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
     from ..core import GameType
-    from ..core.game import Puzzle
+    from ..core.game import DirectionSet, Game, Puzzle
+
+
+Candidate: TypeAlias = tuple[tuple[int, int], Direction]
+CandidateIndex: TypeAlias = dict[tuple[int, Direction], list[tuple[int, int]]]
+UndoLog: TypeAlias = list[tuple[int, int]]
+
 
+class Placement:
+    """A single frame of the backtracking placement search.
 
-Fit: TypeAlias = tuple[str, list[tuple[int, int]]]
-Fits: TypeAlias = list[tuple[str, list[tuple[int, int]]]]
+    Tracks the word being placed, the candidate (position, direction) pairs
+    still left to try, and the undo log of puzzle cells written by the
+    current placement of the word."""
+
+    def __init__(self, word: Word, candidates: list[Candidate]) -> None:
+        self.word = word
+        self.candidates = candidates
+        self.candidate: Candidate | None = None
+        self.changed: UndoLog = []
 
 
 class WordSearchGenerator(Generator):
     """Default generator for standard WordSearch puzzles."""
 
-    def __init__(self, alphabet = [], seed: int = 0) -> None:
-      """Initialize Generator."""
-      self.alphabet = alphabet
-      self.positions = []
+    MAX_BACKTRACKS = 100
+    MAX_REDRAWS = 100
+
+    def __init__(
+        self,
+        alphabet: str | Iterable[str] = ALPHABET,
+        seed: int | None = None,
+        ordering: WordOrder | None = None,
+        forward_check: bool = True,
+    ) -> None:
+        """Initialize Generator.
+
+        Args:
+            alphabet: Alphabet (letters) to use for the puzzle filler characters.
+            seed: Seed used for every puzzle generated when the game doesn't
+                provide its own. Defaults to None which never reseeds.
+            ordering: Order words are placed in. Defaults to None which
+                uses `MostConstrainedFirst`.
+            forward_check: After each placement make sure every remaining
+                word can still fit somewhere in the puzzle. Defaults to True.
+        """
+        super().__init__(alphabet)
+        self.game: Game
+        self.ordering = ordering if ordering is not None else MostConstrainedFirst()
+        self.forward_check = forward_check
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.runs: dict[Direction, list[list[int]]] = {}
+        self.index: CandidateIndex = {}
+        self.slot_index: dict[tuple[int, bool], list[Candidate]] = {}
+        self._layout: tuple[frozenset[Direction], frozenset[Direction]] | None = None
+        self._layout_mask: Puzzle = []
+        self.letters: dict[str, set[tuple[int, int]]] = {}
+        self.placeable: list[Word] = []
+        self._detector: DuplicateDetector | None = None
+        self._placements: set[frozenset[tuple[int, int]]] = set()
 
     def generate(self, game: GameType) -> Puzzle:
         self.game = game
+        # a seeded game (or generator) always starts from the same state
+        # so the same inputs produce the same puzzle every time
+        seed = getattr(game, "seed", None)
+        if seed is None:
+            seed = self.seed
+        if seed is not None:
+            self.random.seed(seed)
         self.puzzle = game._build_puzzle(game.size, "")
+        self.check_layout(game)
+        self.supports: dict[Word, Candidate] = {}
+        self.letters = {}
+        self._detector = DuplicateDetector()
         self.fill_words()
         if any(word.placed for word in game.words):
             self.fill_blanks()
         return self.puzzle
 
+    def check_layout(self, game: GameType) -> None:
+        """Reset the candidate indexes if the layout of `game` has changed.
+
+        The indexes only depend on the mask and word directions so they are
+        kept for as long as those stay the same."""
+        layout = (
+            frozenset(game.directions),
+            frozenset(getattr(game, "secret_directions", ())),
+        )
+        if layout != self._layout or game.mask != self._layout_mask:
+            self._layout = layout
+            self._layout_mask = [row[:] for row in game.mask]
+            self.runs = {}
+            self.index = {}
+            self.slot_index = {}
+
+    def add_words(self, game: GameType, words: Iterable[Word]) -> Puzzle | None:
+        """Place `words` into the current puzzle of `game` without
+        regenerating it.
+
+        Every word already in the puzzle stays where it is. Each new word is
+        written over filler characters (or matching letters) in a random slot
+        and then only the filler characters within any duplicates it created
+        are redrawn (see `patch_word()`).
+
+        Returns:
+            The patched puzzle or None if any of the words couldn't be placed
+            (or don't pass the game validators) so the puzzle needs to be
+            regenerated.
+        """
+        fillers = self.setup_patch(game)
+        placed = [word.text for word in game.words if word.placed]
+        words = sorted(words, key=lambda word: word.text)
+        if len(placed) + len(words) > game.MAX_PUZZLE_WORDS:
+            return None
+        for word in words:
+            if game.validators and not word.validate(game.validators, placed):
+                return None
+            placed.append(word.text)
+        pending = self.ordering.order(
+            [word for word in words if not word.secret], self
+        ) + self.ordering.order([word for word in words if word.secret], self)
+        for word in pending:
+            if not self.patch_word(word, fillers):
+                return None
+        return self.puzzle
+
+    def remove_words(self, game: GameType, words: Iterable[Word]) -> Puzzle | None:
+        """Remove `words` (already dropped from the game word list) from the
+        current puzzle of `game` without regenerating it.
+
+        Only the cells that no remaining word uses are redrawn with filler
+        characters and every other puzzle cell stays the same.
+
+        Returns:
+            The patched puzzle or None if the puzzle needs to be regenerated.
+        """
+        self.setup_patch(game)
+        if not self._placements:
+            return None
+        fixed = {cell for placement in self._placements for cell in placement}
+        freed = sorted(
+            {cell for word in words for cell in word.coordinates if cell not in fixed}
+        )
+        for word in words:
+            word.remove_from_puzzle()
+        chars = self.random.choices(self.alphabet, k=len(freed))
+        for (row, col), char in zip(freed, chars, strict=True):
+            self.puzzle[row][col] = char
+        if not self.redraw_duplicates(set(freed), freed, {}):
+            return None
+        return self.puzzle
+
+    def setup_patch(self, game: GameType) -> set[tuple[int, int]]:
+        """Start patching the current puzzle of `game` (see `add_words()`).
+
+        Returns:
+            The filler cells (active cells not used by any placed word).
+        """
+        self.game = game
+        self.puzzle = [row[:] for row in game.puzzle]
+        self.check_layout(game)
+        self.letters = {}
+        placed = [word for word in game.words if word.placed]
+        self._detector = DuplicateDetector(word.text for word in placed)
+        self._placements = {frozenset(word.coordinates) for word in placed}
+        fixed = {cell for word in placed for cell in word.coordinates}
+        return {
+            (row, col)
+            for row, line in enumerate(game.mask)
+            for col, cell in enumerate(line)
+            if cell == game.ACTIVE and (row, col) not in fixed
+        }
+
+    def patch_word(self, word: Word, fillers: set[tuple[int, int]]) -> bool:
+        """Write `word` over filler characters (or matching letters) in up to
+        `MAX_FIT_TRIES` random slots until one doesn't create a duplicate
+        word that can't be fixed by redrawing filler characters.
+
+        Args:
+            word: Word to place.
+            fillers: Filler cells of the puzzle. Cells used by the placed
+                word are removed.
+
+        Returns:
+            The word was placed.
+        """
+        slots = self.slots(word)
+        for position, direction in self.random.sample(
+            slots, min(len(slots), self.game.MAX_FIT_TRIES)
+        ):
+            row, col = position
+            coords = [
+                (row + direction.r_move * i, col + direction.c_move * i)
+                for i in range(len(word.text))
+            ]
+            if not all(
+                (r, c) in fillers or self.puzzle[r][c] == char
+                for (r, c), char in zip(coords, word.text, strict=True)
+            ):
+                continue
+            changed: dict[tuple[int, int], str] = {}
+            for (r, c), char in zip(coords, word.text, strict=True):
+                changed[(r, c)] = self.puzzle[r][c]
+                self.puzzle[r][c] = char
+            claimed = fillers.intersection(coords)
+            fillers.difference_update(claimed)
+            placement = frozenset(coords)
+            self._placements.add(placement)
+            self.detector.add(word.text)
+            if self.redraw_duplicates(fillers, coords, changed, word.text):
+                word.start_row, word.start_column = position
+                word.direction = direction
+                return True
+            # roll back the placement and any redrawn filler characters
+            for (r, c), char in changed.items():
+                self.puzzle[r][c] = char
+            fillers.update(claimed)
+            self._placements.discard(placement)
+            self.detector.remove(word.text)
+        return False
+
+    def redraw_duplicates(
+        self,
+        fillers: set[tuple[int, int]],
+        cells: list[tuple[int, int]],
+        changed: dict[tuple[int, int], str],
+        word: str | None = None,
+    ) -> bool:
+        """Redraw filler characters until no placed word is duplicated along
+        the puzzle lines running through `cells` (like `fill_blanks()`).
+
+        Args:
+            fillers: Filler cells that can be redrawn.
+            cells: Puzzle cells that were just written.
+            changed: Original character of each changed cell, updated with
+                every redrawn cell so they can be rolled back.
+            word: Text of the word that was just written to `cells`. Any
+                copy of it (anywhere in the puzzle) or duplicate running
+                through it that can't be redrawn is an error. Defaults to None.
+
+        Returns:
+            All duplicates were removed.
+        """
+        written = set(cells)
+        duplicates = self.detector.find_duplicates(self.puzzle, cells)
+        if word is not None:
+            duplicates += DuplicateDetector([word]).find_duplicates(self.puzzle)
+        for _ in range(self.MAX_REDRAWS):
+            redraw: set[tuple[int, int]] = set()
+            for duplicate in duplicates:
+                if frozenset(duplicate) in self._placements:
+                    continue
+                redrawable = fillers.intersection(duplicate)
+                if redrawable:
+                    redraw.update(redrawable)
+                    continue
+                if word is None:
+                    continue
+                # duplicates made up of placed words are allowed just like in
+                # `place_word()`, as long as they aren't another copy of the
+                # new word and the new word only overlaps words within it
+                text = "".join(self.puzzle[r][c] for r, c in duplicate)
+                if word in (text, text[::-1]):
+                    return False
+                if written.intersection(duplicate) and not any(
+                    part in word or word in part for part in (text, text[::-1])
+                ):
+                    return False
+            if not redraw:
+                return True
+            blanks = sorted(redraw)
+            chars = self.random.choices(self.alphabet, k=len(blanks))
+            for (r, c), char in zip(blanks, chars, strict=True):
+                changed.setdefault((r, c), self.puzzle[r][c])
+                self.puzzle[r][c] = char
+            duplicates = self.detector.find_duplicates(self.puzzle, blanks)
+        return False
+
+    @property
+    def detector(self) -> DuplicateDetector:
+        """Duplicate word detector for the current puzzle. When not created
+        by `generate()` it is seeded with the currently placed game words."""
+        if self._detector is None:
+            self._detector = DuplicateDetector(
+                word.text for word in self.game.words if word.placed
+            )
+        return self._detector
+
     def no_duped_words(
-        self, puzzle: Puzzle, char: str, position: tuple[int, int], current_word: str | None = None
+        self, char: str, position: tuple[int, int], current_word: str | None = None
     ) -> bool:
         """Make sure that adding `char` at `position` will not create a
         duplicate of any word already placed in the puzzle."""
-        placed_word_strings = []
-        for word_obj in self.game.words:
-            if word_obj.placed:
-                if current_word and (
-                    current_word in word_obj.text or word_obj.text in current_word
-                ):
-                    continue
-                placed_word_strings.append(word_obj.text)
-        if not placed_word_strings:
-            return True
-
-        # calculate how large of a search radius to check
-        radius = len(max(placed_word_strings, key=len)) if placed_word_strings else 0
-        # track each directional fragment of characters
-        fragments = self.capture_fragments(puzzle, radius, position)
-        # check to see if any duped words are now present
-        before_ct = after_ct = 0
-        for word_text in placed_word_strings:
-            for before in fragments:
-                # remove the current word
-                # after = before.replace(current_word, "")
-                after = before.replace("*", char)
-                if word_text in before or word_text[::-1] in before:
-                    before_ct += 1
-                if word_text in after or word_text[::-1] in after:
-                    after_ct += 1
-        return before_ct == after_ct
-
-    def capture_fragments(self, puzzle: Puzzle, radius: int, position: tuple[int, int]) -> list[str]:
-        row, col = position
-        fragments = []
-        height = width = self.game.size
-
-        # cardinal direction ranges to capture
-        ranges = [
-            (
-                range(row - (radius - 1), row + radius),
-                range(col - (radius - 1), col + radius),
-            ),  # top-left to bottom-right
-            (
-                [row] * (radius * 2 - 1),
-                range(col - (radius - 1), col + radius),
-            ),  # left to right
-            (
-                range(row - (radius - 1), row + radius),
-                [col] * (radius * 2 - 1),
-            ),  # top to bottom
-            (
-                range(row + (radius - 1), row - radius, -1),
-                range(col - (radius - 1), col + radius),
-            ),  # bottom-left to top-right
-        ]
-
-        for row_range, col_range in ranges:
-            fragment = ""
-            for r, c in zip(row_range, col_range, strict=False):
-                if not in_bounds(c, r, width, height):
-                    continue
-                fragment += "*" if (r, c) == (row, col) else puzzle[r][c]
-            fragments.append(fragment)
-        return fragments
+        return self.detector.no_duped_words(self.puzzle, char, position, current_word)
 
     def test_a_fit(
         self,
-        puzzle: Puzzle,
         word: str,
         position: tuple[int, int],
         direction: Direction,
@@ -110,311 +320,339 @@ class WordSearchGenerator(Generator):
         coordinates heading in the specified direction."""
         coordinates = []
         row, col = position
+        dr, dc = direction.r_move, direction.c_move
+        puzzle, mask, inactive = self.puzzle, self.game.mask, self.game.INACTIVE
+        size = len(puzzle)
         # iterate over each letter in the word
         for char in word:
             # if coordinates are off of puzzle cancel fit test
-            if not in_bounds(col, row, len(puzzle), len(puzzle)):
+            if not (0 <= row < size and 0 <= col < size):
                 return []
             # first check if the spot is inactive on the mask
-            if self.game.mask[row][col] == self.game.INACTIVE:
+            if mask[row][col] == inactive:
                 return []
             # if the current puzzle space is empty or if letters don't match
-            if puzzle[row][col] != "" and puzzle[row][col] != char:
+            current = puzzle[row][col]
+            if current != "" and current != char:
                 return []
             coordinates.append((row, col))
             # adjust the coordinates for the next character
-            row += direction.r_move
-            col += direction.c_move
+            row += dr
+            col += dc
         return coordinates
 
-    def func_test_a_fit(
-        self,
-        puzzle: Puzzle,
-        word: str,
-        position: tuple[int, int],
-        direction: Direction,
-    ) -> list[tuple[int, int]]:
-        """Test if word fits in the puzzle at the specified
-        coordinates heading in the specified direction."""
-        coordinates = []
-        row, col = position
-        # iterate over each letter in the word
-        for char in word:
-            # if coordinates are off of puzzle cancel fit test
-            if not in_bounds(col, row, len(puzzle), len(puzzle)):
-                return []
-            # first check if the spot is inactive on the mask
-            if self.game.mask[row][col] == self.game.INACTIVE:
-                return []
-            # if the current puzzle space is empty or if letters don't match
-            if puzzle[row][col] != "" and puzzle[row][col] != char:
-                return []
-            coordinates.append((row, col))
-            # adjust the coordinates for the next character
-            row += direction.r_move
-            col += direction.c_move
-        return coordinates
-
-    def find_a_fit(self, word: Word, position: tuple[int, int]) -> Fit:
-        """Look for random place in the puzzle where `word` fits."""
-        fits: Fits = []
-        # check all directions for level
-        directions = secret_directions = self.game.directions
-        if hasattr(self.game, "secret_directions"):
-            secret_directions = self.game.secret_directions
-        for d in secret_directions if word.secret else directions:
-            coords = self.test_a_fit(word.text, position, d)
-            if coords:
-                fits.append((Direction(d).name, coords))
-        # if the word fits, pick a random fit for placement
-        if not fits:
-            raise WordFitError
-        return random.choice(fits)
-
-    def func_find_a_fit(self, puzzle: Puzzle, word: Word, position: tuple[int, int]) -> Fit:
-        """Look for random place in the puzzle where `word` fits."""
-        fits: Fits = []
-        # check all directions for level
-        directions = secret_directions = self.game.directions
-        if hasattr(self.game, "secret_directions"):
-            secret_directions = self.game.secret_directions
-        for d in secret_directions if word.secret else directions:
-            coords = self.func_test_a_fit(puzzle, word.text, position, d)
-            if coords:
-                fits.append((Direction(d).name, coords))
-        # if the word fits, pick a random fit for placement
-        if not fits:
-            raise WordFitError
-        return random.choice(fits)
-
-    def fill_words(self) -> None:
-        """Fill puzzle with the supplied `words`.
-        Some words will be skipped if they don't fit."""
-        # try to place each word on the puzzle
-        placed_words_texts: list[str] = []
-        hidden_words = [word for word in self.game.words if not word.secret]
-        secret_words = [word for word in self.game.words if word.secret]
-
-        if not self.positions:
-            for i in range(0, len(self.puzzle)):
-                for j in range(len(self.puzzle) if self.puzzle else 0):
-                    self.positions.append((i, j))
-
-        words_to_place = hidden_words + secret_words
-        if not words_to_place:
-            if any(words.placed for word in self.game.words):
-                self.fill_blanks()
-            return
-
-        directions_list = list(self.game.directions)
-        initial_puzzle_state = [row[:] for row in self.puzzle]
-        stack = [{
-            "puzzle": initial_puzzle_state,
-            "word_obj": words_to_place.pop(0),
-            "positions_to_try": random.sample(self.positions, len(self.positions)),
-            "current_pos_directions_to_try": [],
-        }]
-
-        solution_found = False
-        while stack:
-            current_state = stack[-1]
-
-            current_word_obj = current_state["word_obj"]
-            current_puzzle_layout = current_state["puzzle"]
-
-            if not current_state["current_pos_directions_to_try"]:
-                if not current_state["positions_to_try"]:
-                    words_to_place.insert(0, current_word_obj)
-                    current_word_obj.start_row = -1
-                    current_word_obj.start_column = -1
-                    current_word_obj.coordinates = None
-                    stack.pop()
-                    continue
-
-                current_pos = current_state["positions_to_try"].pop()
-                current_state["current_pos_tuple"] = current_pos
-                current_state["current_pos_directions_to_try"] = random.sample(directions_list, len(directions_list))
-
-            if not current_state["current_pos_directions_to_try"]:
-                stack.pop()
-                continue
-
-            direction_to_try = current_state["current_pos_directions_to_try"].pop(0)
-            position_to_try = current_state["current_pos_tuple"]
-
-            new_puzzle_state_after_placement = self.func_try_to_fit_word_at(
-                current_puzzle_layout,
-                current_word_obj,
-                position_to_try,
-                direction_to_try,
+    def word_directions(self, word: Word) -> DirectionSet:
+        """Valid directions for `word` based on its type (hidden or secret)."""
+        if word.secret:
+            secret_directions: DirectionSet | None = getattr(
+                self.game, "secret_directions", None
             )
-
-            if new_puzzle_state_after_placement:
-                if not words_to_place:
-                    self.puzzle = new_puzzle_state_after_placement
-                    solution_found = True
-                    break
-                else:
-                    next_word_to_place = words_to_place.pop(0)
-                    stack.append({
-                        "puzzle": new_puzzle_state_after_placement,
-                        "word_obj": next_word_to_place,
-                        "positions_to_try": random.sample(self.positions, len(self.positions)),
-                        "current_pos_directions_to_try": [],
-                    })
-
-        if not solution_found:
-            print(f"Warning: Could not place all words. Remaining: {[w.text for w in words_to_place]}")
-
-        if any(word.placed for word in self.game.words) or solution_found:
-            self.fill_blanks()
-
-
-    def add_all_permutations(self, word: Word):
-        """Add all permutations of a word with current puzzle state
-           to the stack."""
-        to_stack = []
-        puzzle_state = self.puzzle
-        for p in self.positions:
-            for d in self.game.directions:
-                if self.test_a_fit(word.text, p, d):
-                    to_stack.append({
-                      "puzzle": puzzle_state,
-                      "word": word,
-                      "position": p,
-                      "direction": d,
-                    })
-        random.shuffle(to_stack)
-        return to_stack
-
-    def try_to_fit_word_at(self, word: Word, pos) -> bool:
-        """Try to fit `word` at a given coordinate"""
-        # no need to continue if position isn't available
-        if self.puzzle[pos[0]][pos[1]] != "" and self.puzzle[pos[0]][pos[1]] != word.text[0]:
-            return False
-        if self.game.mask[pos[0]][pos[1]] == self.game.INACTIVE:
-            return False
-        # try and find a directional fit using the starting coordinates if not INACTIVE
-        try:
-            d, coords = self.find_a_fit(word, (pos[0], pos[1]))
-        except:
-            return False
-
-        # place word characters at fit coordinates
-        previous_chars = []  # track previous to backtrack on WordFitError
+            if secret_directions is not None:
+                return secret_directions
+        return self.game.directions
+
+    def active_runs(self, direction: Direction) -> list[list[int]]:
+        """Count of consecutive active mask cells starting at each
+        puzzle position and heading in `direction`."""
+        if direction not in self.runs:
+            size = len(self.puzzle)
+            runs = [[0] * size for _ in range(size)]
+            dr, dc = direction.r_move, direction.c_move
+            # walk backwards against the direction so the next cell is known
+            rows = range(size - 1, -1, -1) if dr > 0 else range(size)
+            cols = range(size - 1, -1, -1) if dc > 0 else range(size)
+            for row in rows:
+                for col in cols:
+                    if self.game.mask[row][col] == self.game.INACTIVE:
+                        continue
+                    r, c = row + dr, col + dc
+                    runs[row][col] = 1 + (
+                        runs[r][c] if in_bounds(c, r, size, size) else 0
+                    )
+            self.runs[direction] = runs
+        return self.runs[direction]
+
+    def segment_starts(
+        self, length: int, direction: Direction
+    ) -> list[tuple[int, int]]:
+        """All puzzle positions where a word of `length` heading in `direction`
+        stays within the puzzle bounds and the active area of the mask.
+        Results are indexed by (length, direction) for the current generation."""
+        key = (length, direction)
+        if key not in self.index:
+            runs = self.active_runs(direction)
+            self.index[key] = [
+                (row, col)
+                for row, line in enumerate(runs)
+                for col, run in enumerate(line)
+                if run >= length
+            ]
+        return self.index[key]
+
+    def slots(self, word: Word) -> list[Candidate]:
+        """Every (position, direction) pair where `word` stays within the puzzle
+        bounds and the active area of the mask (see `segment_starts()`).
+        Results are shared by all words of the same length and type."""
+        key = (len(word.text), word.secret)
+        if key not in self.slot_index:
+            self.slot_index[key] = [
+                (position, direction)
+                for direction in sorted(
+                    self.word_directions(word), key=lambda d: d.name
+                )
+                for position in self.segment_starts(len(word.text), direction)
+            ]
+        return self.slot_index[key]
+
+    def slot_count(self, word: Word) -> int:
+        """Number of puzzle slots (see `slots()`) that can hold `word`."""
+        return sum(
+            len(self.segment_starts(len(word.text), direction))
+            for direction in self.word_directions(word)
+        )
+
+    def overlaps(self, word: Word) -> dict[Candidate, int]:
+        """Slots for `word` that share at least one letter with the words
+        already in the puzzle, mapped to the count of shared letters.
+
+        Found by working back from each puzzle cell holding a matching letter
+        (see `self.letters`) instead of testing every slot."""
+        size = len(self.puzzle)
+        length = len(word.text)
+        directions = sorted(self.word_directions(word), key=lambda d: d.name)
+        moves = [
+            (k, direction.r_move, direction.c_move, self.active_runs(direction))
+            for k, direction in enumerate(directions)
+        ]
+        # count by plain int tuples (enum members are slow to hash)
+        found: dict[tuple[int, int, int], int] = {}
         for i, char in enumerate(word.text):
-            check_row = coords[i][0]
-            check_col = coords[i][1]
-            previous_chars.append(self.puzzle[check_row][check_col])
-
-            # no need to check for dupes if characters are the same
-            if char == self.puzzle[check_row][check_col]:
+            cells = self.letters.get(char)
+            if not cells:
                 continue
-            # make sure placed character doesn't cause a duped word in the puzzle
-            if self.no_duped_words(char, (check_row, check_col), word.text):
-                self.puzzle[check_row][check_col] = char
-            else:
-                # if a duped word was created put previous characters back in place
-                for n, previous_char in enumerate(previous_chars):
-                    self.puzzle[coords[n][0]][coords[n][1]] = previous_char
-                # raise WordFitError
-                pass # Not important hopefully
-
-        # update word placement info
-        word.start_row = pos[0]
-        word.start_column = pos[1]
-        word.direction = Direction[d]
-        word.coordinates = coords
-
-        return word.placed
-
-    def func_try_to_fit_word_at(self, current_puzzle_state: Puzzle, word: Word, pos, direction: Direction) -> Puzzle | None:
-        """Try to fit `word` at a given coordinate"""
-        coords = self.test_a_fit(current_puzzle_state, word.text, pos, direction)
+            for row, col in sorted(cells):
+                for k, dr, dc, runs in moves:
+                    r = row - dr * i
+                    c = col - dc * i
+                    if 0 <= r < size and 0 <= c < size and runs[r][c] >= length:
+                        key = (r, c, k)
+                        found[key] = found.get(key, 0) + 1
+        return {((r, c), directions[k]): count for (r, c, k), count in found.items()}
+
+    def has_fit(self, word: Word) -> bool:
+        """Is there at least one slot where `word` fits the current puzzle.
+
+        The last fitting slot found for each word is remembered, and since a
+        single placement rarely blocks it, it is checked before rescanning."""
+        support = self.supports.get(word)
+        if support is not None and self.test_a_fit(word.text, *support):
+            return True
+        for position, direction in self.slots(word):
+            if self.test_a_fit(word.text, position, direction):
+                self.supports[word] = (position, direction)
+                return True
+        return False
+
+    def candidates(self, word: Word) -> list[Candidate]:
+        """Up to `MAX_FIT_TRIES` random (position, direction) pairs to try for
+        `word` plus every slot that overlaps existing puzzle letters (see
+        `overlaps()`). Candidates are popped from the end of the list during
+        the search, so overlapping slots are placed last, ordered by the
+        count of shared letters (ties keep a random order)."""
+        overlaps = self.overlaps(word)
+        slots = self.slots(word)
+        candidates = [
+            slot
+            for slot in self.random.sample(
+                slots, min(len(slots), self.game.MAX_FIT_TRIES)
+            )
+            if slot not in overlaps
+        ]
+        overlapping = list(overlaps)
+        self.random.shuffle(overlapping)
+        overlapping.sort(key=overlaps.__getitem__)
+        return candidates + overlapping
+
+    def place_word(
+        self, word: Word, position: tuple[int, int], direction: Direction
+    ) -> UndoLog | None:
+        """Try to place `word` at `position` heading in `direction`.
+
+        Characters are written directly into `self.puzzle`. Only empty cells
+        are ever written, so the returned undo log (the cells that changed)
+        is all that is needed to roll the placement back with `undo()`.
+
+        Returns:
+            The undo log for the placement or None if the word doesn't fit.
+        """
+        coords = self.test_a_fit(word.text, position, direction)
         if not coords:
             return None
 
-        prospective_puzzle = [row[:] for row in current_puzzle_state]
-
-        for i, char_to_place in enumerate(word.text):
-            r, c = coords[i]
-
-            char_before_placement_attempt = prospective_puzzle[r][c]
-
-            if char_before_placement_attempt == char_to_place:
+        changed: UndoLog = []
+        for (row, col), char in zip(coords, word.text, strict=True):
+            # no need to check for dupes if characters are the same
+            if self.puzzle[row][col] == char:
                 continue
-
-            if not self.no_duped_words(prospective_puzzle, char_to_place, (r, c), word.text):
+            # make sure placed character doesn't cause a duped word in the puzzle
+            if not self.no_duped_words(char, (row, col), word.text):
+                self.undo(changed)
                 return None
-
-            prospective_puzzle[r][c] = char_to_place
+            self.puzzle[row][col] = char
+            self.letters.setdefault(char, set()).add((row, col))
+            changed.append((row, col))
 
         # update word placement info
-        word.start_row = pos[0]
-        word.start_column = pos[1]
+        word.start_row, word.start_column = position
         word.direction = direction
-        word.coordinates = coords
+        self.detector.add(word.text)
+        return changed
 
-        return prospective_puzzle
+    def undo(self, changed: UndoLog) -> None:
+        """Roll back a placement by clearing the cells in its undo log."""
+        for row, col in changed:
+            self.letters[self.puzzle[row][col]].discard((row, col))
+            self.puzzle[row][col] = ""
 
-    @retry(1000)
-    def try_to_fit_word(self, word: Word) -> bool:
-        """Try to fit `word` at randomized coordinates.
-        @retry wrapper controls the number of attempts"""
-        row = random.randint(0, len(self.puzzle) - 1)
-        col = random.randint(0, len(self.puzzle) - 1)
-
-        # no need to continue if random coordinate isn't available
-        if self.puzzle[row][col] != "" and self.puzzle[row][col] != word.text[0]:
-            raise WordFitError
-        if self.game.mask[row][col] == self.game.INACTIVE:
-            raise WordFitError
-
-        # try and find a directional fit using the starting coordinates if not INACTIVE
-        d, coords = self.find_a_fit(word, (row, col))
-
-        # place word characters at fit coordinates
-        previous_chars = []  # track previous to backtrack on WordFitError
-        for i, char in enumerate(word.text):
-            check_row = coords[i][0]
-            check_col = coords[i][1]
-            previous_chars.append(self.puzzle[check_row][check_col])
+    def fill_words(self) -> None:
+        """Fill puzzle with the supplied `words`.
 
-            # no need to check for dupes if characters are the same
-            if char == self.puzzle[check_row][check_col]:
+        Words are placed with a depth-first backtracking search over a single
+        shared puzzle grid. When a word can't be placed the previous placement
+        is rolled back and its next candidate is tried. Once `MAX_BACKTRACKS`
+        is reached (or the search is exhausted) the deepest layout found is
+        restored and the word that doesn't fit is skipped.
+
+        Words are placed in the order picked by `self.ordering` (hidden words
+        always before secret words) and words that can't fit anywhere in the
+        empty puzzle are skipped up front. With `self.forward_check` enabled a
+        placement that leaves any remaining word without a possible fit is
+        rejected right away instead of being found out later by backtracking.
+
+        Every attempted placement spends one step of the game `budget`. When
+        the budget runs out the search stops and the deepest layout found
+        so far is kept."""
+        placed_words: list[str] = []
+        # sort words so set iteration order can't change the puzzle
+        words = sorted(self.game.words, key=lambda word: word.text)
+        hidden_words = [word for word in words if not word.secret]
+        secret_words = [word for word in words if word.secret]
+        valid: list[Word] = []
+        for word in hidden_words + secret_words:
+            if len(valid) == self.game.MAX_PUZZLE_WORDS:
+                break
+            if self.game.validators and not word.validate(
+                self.game.validators, placed_words
+            ):
                 continue
-            # make sure placed character doesn't cause a duped word in the puzzle
-            if self.no_duped_words(char, (check_row, check_col), word.text):
-                self.puzzle[check_row][check_col] = char
-            else:
-                # if a duped word was created put previous characters back in place
-                for n, previous_char in enumerate(previous_chars):
-                    self.puzzle[coords[n][0]][coords[n][1]] = previous_char
-                raise WordFitError
-
-        # update word placement info
-        word.start_row = row
-        word.start_column = col
-        word.direction = Direction[d]
-        word.coordinates = coords
+            placed_words.append(word.text)
+            valid.append(word)
+        valid = [word for word in valid if self.slot_count(word)]
+        self.placeable = valid
+        # compile every word into the detector once instead of on each placement
+        self.detector.reserve(word.text for word in valid)
+        pending = self.ordering.order(
+            [word for word in valid if not word.secret], self
+        ) + self.ordering.order([word for word in valid if word.secret], self)
+        if not pending:
+            return
 
-        return word.placed
+        stack: list[Placement] = []
+        best: list[tuple[Word, Candidate]] = []
+        budget = self.game.budget
+        backtracks = 0
+        word = pending.pop(0)
+        frame = Placement(word, self.candidates(word))
+        while True:
+            while frame.candidates:
+                if not budget.spend():
+                    break
+                candidate = frame.candidates.pop()
+                changed = self.place_word(frame.word, *candidate)
+                if changed is not None:
+                    frame.candidate = candidate
+                    frame.changed = changed
+                    if self.forward_check and not all(map(self.has_fit, pending)):
+                        self.rollback(frame)
+                        continue
+                    stack.append(frame)
+                    if len(stack) > len(best):
+                        best = [
+                            (f.word, f.candidate)
+                            for f in stack
+                            if f.candidate is not None
+                        ]
+                    break
+            else:
+                # no fit for the word with the current layout so
+                # backtrack and move the previous word if allowed
+                if stack and backtracks < self.MAX_BACKTRACKS:
+                    backtracks += 1
+                    pending.insert(0, frame.word)
+                    frame = stack.pop()
+                    self.rollback(frame)
+                    continue
+                # otherwise restore the deepest layout found and skip the
+                # word that blocked it (words always keep the same order)
+                if len(stack) < len(best):
+                    remaining = [f.word for f in stack] + [frame.word] + pending
+                    self.restore(stack, best)
+                    pending = remaining[len(best) + 1 :]
+            if budget.exhausted:
+                # out of time (or steps) so keep the deepest layout found
+                if len(stack) < len(best):
+                    self.restore(stack, best)
+                break
+            if not pending:
+                break
+            word = pending.pop(0)
+            frame = Placement(word, self.candidates(word))
+
+    def restore(
+        self, stack: list[Placement], layout: list[tuple[Word, Candidate]]
+    ) -> None:
+        """Roll back every placement on `stack` and replay `layout` in its place."""
+        while stack:
+            self.rollback(stack.pop())
+        for word, (position, direction) in layout:
+            restored = Placement(word, [])
+            restored.candidate = (position, direction)
+            restored.changed = self.place_word(word, position, direction) or []
+            stack.append(restored)
+
+    def rollback(self, frame: Placement) -> None:
+        """Undo the placement recorded in `frame` and reset its word."""
+        self.undo(frame.changed)
+        self.detector.remove(frame.word.text)
+        frame.word.remove_from_puzzle()
 
     def fill_blanks(self) -> None:
-        """Fill empty puzzle spaces with random characters."""
-        # iterate over the entire puzzle
+        """Fill empty puzzle spaces with random characters.
 
+        Every blank is filled in a single draw and the puzzle is then scanned
+        for any placed words that were accidentally duplicated. Only the
+        filler characters within those duplicates are redrawn, and only the
+        lines running through them are rescanned, until none are left."""
         size = len(self.puzzle)
-        for row in range(size):
-            for col in range(size):
-                # if the current spot is empty fill with random character
-                if (
-                    self.puzzle[row][col] == ""
-                    and self.game.mask[row][col] == self.game.ACTIVE
-                ):
-                    while True:
-                        random_char = random.choice(self.alphabet)
-                        if self.no_duped_words(self.puzzle, random_char, (row, col)):
-                            self.puzzle[row][col] = random_char
-                            break
-
+        blanks = [
+            (row, col)
+            for row in range(size)
+            for col in range(size)
+            if self.puzzle[row][col] == ""
+            and self.game.mask[row][col] == self.game.ACTIVE
+        ]
+        fillers = set(blanks)
+        check: list[tuple[int, int]] | None = None
+        while blanks:
+            chars = self.random.choices(self.alphabet, k=len(blanks))
+            for (row, col), char in zip(blanks, chars, strict=True):
+                self.puzzle[row][col] = char
+            blanks = sorted(
+                {
+                    cell
+                    for duplicate in self.detector.find_duplicates(self.puzzle, check)
+                    for cell in duplicate
+                    if cell in fillers
+                }
+            )
+            check = blanks
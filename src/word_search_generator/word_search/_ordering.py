@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..core.word import Word
+    from ._generator import WordSearchGenerator
+
+
+class WordOrder(ABC):
+    """Base class for the order words are placed in by `WordSearchGenerator`.
+
+    To implement your own `WordOrder`, subclass this class.
+
+    Example:
+        ```python
+        class ShortestFirst(WordOrder):
+            def order(self, words, generator) -> list[Word]:
+                return sorted(words, key=lambda word: len(word.text))
+        ```
+    """
+
+    @abstractmethod
+    def order(self, words: list[Word], generator: WordSearchGenerator) -> list[Word]:
+        """Order the words for placement.
+
+        Args:
+            words: Words to be placed (hidden or secret, never mixed).
+            generator: The generator placing the words, setup for the
+                current game.
+
+        Returns:
+            The words in the order they should be placed.
+        """
+
+
+class InputOrder(WordOrder):
+    """Place words in the order they were provided (alphabetically sorted)."""
+
+    def order(self, words: list[Word], generator: WordSearchGenerator) -> list[Word]:
+        return list(words)
+
+
+class LongestFirst(WordOrder):
+    """Place the longest words first while the puzzle is still empty."""
+
+    def order(self, words: list[Word], generator: WordSearchGenerator) -> list[Word]:
+        return sorted(words, key=lambda word: -len(word.text))
+
+
+class MostConstrainedFirst(WordOrder):
+    """Place the words with the fewest possible puzzle slots first. Ties
+    are broken by placing longer words first."""
+
+    def order(self, words: list[Word], generator: WordSearchGenerator) -> list[Word]:
+        return sorted(
+            words, key=lambda word: (generator.slot_count(word), -len(word.text))
+        )
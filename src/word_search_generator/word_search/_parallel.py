@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import copy
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+from ..core.directions import Direction
+from ..core.game import Puzzle
+from ..core.generator import ALPHABET, Budget
+from ..utils import available_cpus
+from ._generator import WordSearchGenerator
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from ..core import GameType
+    from ._ordering import WordOrder
+
+
+Placements: TypeAlias = dict[str, tuple[int, int, str]]
+SearchResult: TypeAlias = tuple[Puzzle, Placements, bool, tuple[int, float, bool]]
+
+# set in each worker process by `_init_worker()`
+_cancelled: Any = None
+
+
+class CancellableBudget(Budget):
+    """Generation `Budget` that also runs out as soon as `event` is set,
+    letting a parallel search stop once another worker has won."""
+
+    def __init__(
+        self,
+        event: Any,
+        timeout: float | None = None,
+        max_steps: int | None = None,
+    ) -> None:
+        super().__init__(timeout, max_steps)
+        self.event = event
+
+    def spend(self, steps: int = 1) -> bool:
+        if self.event is not None and self.event.is_set():
+            self.exhausted = True
+            return False
+        return super().spend(steps)
+
+
+def _init_worker(event: Any) -> None:
+    """Share the cancellation `event` with a pool worker (events can only
+    be passed to other processes by inheritance)."""
+    global _cancelled
+    _cancelled = event
+
+
+def _search(
+    game: GameType,
+    seed: int,
+    alphabet: list[str],
+    ordering: WordOrder | None,
+    forward_check: bool,
+    deadline: float | None,
+) -> SearchResult:
+    """Run a single independently seeded search in a pool worker.
+
+    The search stops at `deadline` (a `time.time()` timestamp set by the
+    parent process) so the game timeout also covers starting the pool and
+    sending the game to the worker.
+
+    Returns:
+        The generated puzzle, the placement of each placed word by text as
+        (start row, start column, direction name), if every
+        placeable word was placed, and the budget used as (steps, elapsed,
+        exhausted).
+    """
+    game.seed = seed
+    timeout = None if deadline is None else max(0.0, deadline - time.time())
+    game.budget = CancellableBudget(_cancelled, timeout, game.budget.max_steps)
+    generator = WordSearchGenerator(
+        alphabet, ordering=ordering, forward_check=forward_check
+    )
+    puzzle = generator.generate(game)
+    placements: Placements = {
+        word.text: (
+            word.start_row,  # type: ignore[misc]
+            word.start_column,
+            word.direction.name,  # type: ignore[union-attr]
+        )
+        for word in game.words
+        if word.placed
+    }
+    complete = len(placements) == len(generator.placeable)
+    budget = game.budget
+    return (
+        puzzle,
+        placements,
+        complete,
+        (budget.steps, budget.elapsed, budget.exhausted),
+    )
+
+
+class ParallelWordSearchGenerator(WordSearchGenerator):
+    """Generator that runs several independently seeded searches at once
+    across a pool of worker processes.
+
+    The first search to place every word wins and the rest are cancelled.
+    If no search places every word the one that placed the most is used.
+    Since the winner depends on which worker finishes first, the same seed
+    isn't guaranteed to produce the same puzzle unless `workers` is 1.
+
+    The worker pool is started on first use and reused for every puzzle
+    until `close()` is called (or the generator is used as a context manager).
+    """
+
+    def __init__(
+        self,
+        alphabet: str | Iterable[str] = ALPHABET,
+        seed: int | None = None,
+        ordering: WordOrder | None = None,
+        forward_check: bool = True,
+        workers: int | None = None,
+    ) -> None:
+        """Initialize Generator.
+
+        Args:
+            alphabet: Alphabet (letters) to use for the puzzle filler characters.
+            seed: Base seed for the worker searches when the game doesn't
+                provide its own. Defaults to None.
+            ordering: Order words are placed in. Defaults to None which
+                uses `MostConstrainedFirst`.
+            forward_check: After each placement make sure every remaining
+                word can still fit somewhere in the puzzle. Defaults to True.
+            workers: Count of searches (and worker processes) to run.
+                Defaults to None which uses the count of available CPUs.
+
+        Raises:
+            ValueError: `workers` less than 1.
+        """
+        super().__init__(alphabet, seed, ordering, forward_check)
+        if workers is None:
+            workers = available_cpus()
+        if workers < 1:
+            raise ValueError("Workers must be >= 1.")
+        self.workers = workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._cancelled: Any = None
+
+    def generate(self, game: GameType) -> Puzzle:
+        if self.workers == 1:
+            return super().generate(game)
+        self.game = game
+        seed = getattr(game, "seed", None)
+        if seed is None:
+            seed = self.seed
+        if seed is None:
+            seed = self.random.randrange(2**32)
+
+        # workers get a copy of the game without anything that can't be pickled
+        snapshot = copy.copy(game)
+        snapshot.generator = None
+        snapshot.formatter = None
+        snapshot._masks = []
+
+        # the clock started with the game generation so the workers get
+        # whatever time is left after starting the pool and pickling
+        remaining = game.budget.remaining
+        deadline = None if remaining is None else time.time() + remaining
+
+        executor = self.executor
+        self._cancelled.clear()
+        futures: set[Future[SearchResult]] = {
+            executor.submit(
+                _search,
+                snapshot,
+                seed + i,
+                self.alphabet,
+                self.ordering,
+                self.forward_check,
+                deadline,
+            )
+            for i in range(self.workers)
+        }
+        best: SearchResult | None = None
+        pending = futures
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if best is None or len(result[1]) > len(best[1]):
+                    best = result
+            if best is not None and best[2]:
+                break
+
+        # cancel the losers and wait for them to stop before moving on
+        self._cancelled.set()
+        for future in pending:
+            future.cancel()
+        wait(pending)
+
+        assert best is not None
+        puzzle, placements, _, used = best
+        for word in game.words:
+            if word.text not in placements:
+                continue
+            row, col, direction = placements[word.text]
+            word.start_row, word.start_column = row, col
+            word.direction = Direction[direction]
+        steps, _, exhausted = used
+        game.budget.steps, game.budget.exhausted = steps, exhausted
+        game.budget.elapsed = time.perf_counter() - game.budget._started
+        self.puzzle = puzzle
+        return puzzle
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Worker process pool (started on first use)."""
+        if self._executor is None:
+            self._cancelled = multiprocessing.Event()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self._cancelled,),
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker process pool."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> ParallelWordSearchGenerator:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_cancelled"] = None
+        return state
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import copy
+import heapq
+from math import ceil
+from typing import TYPE_CHECKING, TypeAlias
+
+from ..core.generator import ALPHABET
+from ._detector import DuplicateDetector
+from ._generator import WordSearchGenerator
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from ..core import GameType
+    from ..core.game import Game, Puzzle
+    from ..core.word import Word
+    from ._ordering import WordOrder
+
+
+# (top row, left column, size) of a square puzzle tile
+Tile: TypeAlias = tuple[int, int, int]
+
+
+class TiledWordSearchGenerator(WordSearchGenerator):
+    """Generator for large puzzles that splits the puzzle into square tiles,
+    fills each one independently with `WordSearchGenerator`, and then
+    stitches them back together.
+
+    Words are spread across the tiles by letter count (longest words first)
+    and never cross a tile edge. Each tile also checks for copies of the
+    words from every other tile so a tile can't spell out another tile's
+    words. Once stitched, the whole puzzle is checked for copies of every
+    placed word running across the tile edges. Only the filler characters
+    within those copies are redrawn, and any copy made up of placed letters
+    is removed by moving one of its words (see `separate_copies()`), so the
+    work grows with the puzzle area instead of with the square of the word
+    count.
+
+    Puzzles no bigger than `tile_size` are generated as a single tile.
+    """
+
+    def __init__(
+        self,
+        alphabet: str | Iterable[str] = ALPHABET,
+        seed: int | None = None,
+        ordering: WordOrder | None = None,
+        forward_check: bool = True,
+        tile_size: int = 50,
+    ) -> None:
+        """Initialize Generator.
+
+        Args:
+            alphabet: Alphabet (letters) to use for the puzzle filler characters.
+            seed: Seed used for every puzzle generated when the game doesn't
+                provide its own. Defaults to None which never reseeds.
+            ordering: Order words are placed in. Defaults to None which
+                uses `MostConstrainedFirst`.
+            forward_check: After each placement make sure every remaining
+                word can still fit somewhere in the tile. Defaults to True.
+            tile_size: Largest tile size. Defaults to 50.
+
+        Raises:
+            ValueError: `tile_size` less than 1.
+        """
+        super().__init__(alphabet, seed, ordering, forward_check)
+        if tile_size < 1:
+            raise ValueError("Tile size must be >= 1.")
+        self.tile_size = tile_size
+        self.outside_words: set[str] = set()
+
+    def generate(self, game: GameType) -> Puzzle:
+        if game.size <= self.tile_size:
+            return super().generate(game)
+        seed = getattr(game, "seed", None)
+        if seed is None:
+            seed = self.seed
+        if seed is not None:
+            self.random.seed(seed)
+        size = game.size
+        tiles = self.tiles(size)
+        puzzle = game._build_puzzle(size, "")
+        assigned = self.assign_words(game, tiles)
+        texts = {word.text for words in assigned for word in words}
+        for i, (tile, words) in enumerate(zip(tiles, assigned, strict=True)):
+            if not words:
+                continue
+            tile_seed = None if seed is None else seed + i + 1
+            self.outside_words = texts.difference(word.text for word in words)
+            try:
+                tile_puzzle = super().generate(
+                    self.tile_game(game, tile, words, tile_seed)
+                )
+            finally:
+                self.outside_words = set()
+            top, left, side = tile
+            width = min(side, size - left)
+            for row in range(min(side, size - top)):
+                puzzle[top + row][left : left + width] = tile_puzzle[row][:width]
+            for word in words:
+                if word.start_row is not None and word.start_column is not None:
+                    word.start_row += top
+                    word.start_column += left
+        self.game = game
+        self.puzzle = puzzle
+        self._detector = DuplicateDetector(
+            word.text for word in game.words if word.placed
+        )
+        self.stitch()
+        self.separate_copies()
+        return self.puzzle
+
+    def fill_words(self) -> None:
+        # copies of the words from the other tiles are duplicates too
+        for text in self.outside_words:
+            self.detector.add(text)
+        super().fill_words()
+
+    def tiles(self, size: int) -> list[Tile]:
+        """Split a `size` puzzle into (nearly) equal square tiles no bigger
+        than `tile_size`. Tiles along the bottom and right edges can run
+        past the puzzle."""
+        count = ceil(size / self.tile_size)
+        side = ceil(size / count)
+        return [
+            (row, col, side)
+            for row in range(0, size, side)
+            for col in range(0, size, side)
+        ]
+
+    def assign_words(self, game: Game, tiles: list[Tile]) -> list[list[Word]]:
+        """Validate the game words (just like `fill_words()`) and spread them
+        across `tiles`, each going to the tile with the lowest share of its
+        active cells already taken. Words too long for a tile are skipped.
+
+        Returns:
+            The words for each tile.
+        """
+        placed_words: list[str] = []
+        words = sorted(game.words, key=lambda word: word.text)
+        valid: list[Word] = []
+        for word in [w for w in words if not w.secret] + [w for w in words if w.secret]:
+            if len(valid) == game.MAX_PUZZLE_WORDS:
+                break
+            if game.validators and not word.validate(game.validators, placed_words):
+                continue
+            placed_words.append(word.text)
+            valid.append(word)
+        self.placeable = valid
+
+        size = len(game.mask)
+        assigned: list[list[Word]] = [[] for _ in tiles]
+        heap: list[tuple[float, int, int, int]] = []
+        for i, (top, left, side) in enumerate(tiles):
+            active = sum(
+                row[left : left + side].count(game.ACTIVE)
+                for row in game.mask[top : min(top + side, size)]
+            )
+            if active:
+                heapq.heappush(heap, (0.0, i, 0, active))
+        for word in sorted(valid, key=lambda word: (-len(word.text), word.text)):
+            if not heap or len(word.text) > tiles[0][2]:
+                continue
+            _, i, letters, active = heapq.heappop(heap)
+            assigned[i].append(word)
+            letters += len(word.text)
+            heapq.heappush(heap, (letters / active, i, letters, active))
+        return assigned
+
+    @staticmethod
+    def tile_game(
+        game: GameType, tile: Tile, words: list[Word], seed: int | None
+    ) -> GameType:
+        """Copy of `game` covering just `tile` of the puzzle with `words`."""
+        top, left, side = tile
+        size = game.size
+        sub = copy.copy(game)
+        sub._words = set(words)
+        sub._word_sets = {}
+        sub._size = side
+        sub._mask = [
+            [
+                game.mask[row][col] if row < size and col < size else game.INACTIVE
+                for col in range(left, left + side)
+            ]
+            for row in range(top, top + side)
+        ]
+        sub._masks = []
+        sub._puzzle = []
+        sub.seed = seed
+        sub.generator = None
+        sub.formatter = None
+        return sub
+
+    def stitch(self) -> None:
+        """Fill any blank cells (tiles without words) and redraw filler
+        characters until no placed word is duplicated anywhere in the puzzle.
+
+        Copies made up only of placed word letters are left alone, just like
+        in `fill_blanks()`, and are removed by `separate_copies()`."""
+        game = self.game
+        puzzle = self.puzzle
+        size = len(puzzle)
+        mask = game.mask
+        # flag the cells used by placed words in a single flat buffer
+        fixed = bytearray(size * size)
+        for word in game.words:
+            for row, col in word.coordinates:
+                fixed[row * size + col] = 1
+        blanks = [
+            (row, col)
+            for row in range(size)
+            for col in range(size)
+            if puzzle[row][col] == "" and mask[row][col] == game.ACTIVE
+        ]
+        check: list[tuple[int, int]] | None = None
+        while True:
+            chars = self.random.choices(self.alphabet, k=len(blanks))
+            for (row, col), char in zip(blanks, chars, strict=True):
+                puzzle[row][col] = char
+            blanks = sorted(
+                {
+                    (row, col)
+                    for duplicate in self.detector.find_duplicates(puzzle, check)
+                    for row, col in duplicate
+                    if not fixed[row * size + col]
+                }
+            )
+            if not blanks:
+                break
+            check = blanks
+
+    def separate_copies(self) -> None:
+        """Move placed words until no copy of a placed word is made up of the
+        letters of other placed words (e.g. across a tile edge).
+
+        One of the words making up each copy is taken out of the puzzle and
+        patched back in somewhere else (see `patch_word()`). A word that
+        can't be placed again is left unplaced. Copies that are part of a
+        single placed word (e.g. "CAT" within "CATERPILLAR") can't be removed
+        and are left alone."""
+        game = self.game
+        puzzle = self.puzzle
+        self.check_layout(game)
+        fillers = {
+            (row, col)
+            for row, line in enumerate(game.mask)
+            for col, cell in enumerate(line)
+            if cell == game.ACTIVE
+        }
+        owners: dict[tuple[int, int], list[Word]] = {}
+        for word in game.words:
+            for cell in word.coordinates:
+                owners.setdefault(cell, []).append(word)
+        fillers.difference_update(owners)
+        self._placements = {
+            frozenset(word.coordinates) for word in game.words if word.placed
+        }
+        for _ in range(self.MAX_REDRAWS):
+            copies = [
+                duplicate
+                for duplicate in self.detector.find_duplicates(puzzle)
+                if all(cell in owners for cell in duplicate)
+                and not any(
+                    set(duplicate) <= set(word.coordinates)
+                    for word in owners[duplicate[0]]
+                )
+            ]
+            if not copies:
+                return
+            duplicate = min(copies)
+            words = {word for cell in duplicate for word in owners[cell]}
+            # prefer the words that are the only one using a cell of the copy
+            movable = {
+                word
+                for cell in duplicate
+                if len(owners[cell]) == 1
+                for word in owners[cell]
+            }
+            word = self.random.choice(
+                sorted(movable or words, key=lambda word: word.text)
+            )
+            coordinates = word.coordinates
+            freed = [cell for cell in coordinates if len(owners[cell]) == 1]
+            for cell in coordinates:
+                owners[cell].remove(word)
+                if not owners[cell]:
+                    del owners[cell]
+            self._placements.discard(frozenset(coordinates))
+            self.detector.remove(word.text)
+            word.remove_from_puzzle()
+            fillers.update(freed)
+            chars = self.random.choices(self.alphabet, k=len(freed))
+            for (row, col), char in zip(freed, chars, strict=True):
+                puzzle[row][col] = char
+            self.redraw_duplicates(fillers, freed, {})
+            if self.patch_word(word, fillers):
+                for cell in word.coordinates:
+                    owners.setdefault(cell, []).append(word)
@@ -1,12 +1,15 @@
 import json
 import math
 import random
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from pathlib import Path
 
 from typing import List, Set
 
 from .. import utils
+from ..core.cache import PuzzleCache
+from ..core.directions import Direction
 from ..core.formatter import Formatter
 from ..core.game import (
     DirectionSet,
@@ -15,10 +18,11 @@ from ..core.game import (
     Game,
     MissingGeneratorError,
     MissingWordError,
+    Puzzle,
     PuzzleSizeError,
     WordSet,
 )
-from ..core.generator import Generator
+from ..core.generator import Budget, Generator
 from ..core.validator import (
     NoPalindromes,
     NoPunctuation,
@@ -26,8 +30,11 @@ from ..core.validator import (
     NoSubwords,
     Validator,
 )
+from ..core.word import Word
+from ..mask import Mask
 from ._formatter import WordSearchFormatter
 from ._generator import WordSearchGenerator
+from ._tiled import TiledWordSearchGenerator
 
 
 class WordSearch(Game):
@@ -59,6 +66,10 @@ class WordSearch(Game):
         generator: Generator | None = None,
         formatter: Formatter | None = None,
         validators: Iterable[Validator] | None = DEFAULT_VALIDATORS,
+        seed: int | None = None,
+        lazy: bool = False,
+        large: bool = False,
+        cache: PuzzleCache | None = None,
     ):
         """Initialize a game.
 
@@ -79,7 +90,28 @@ class WordSearch(Game):
             validators: An iterable of validators that puzzle words will be checked
                 against during puzzle generation. Provide an empty iterable to disable
                 word validation. Defaults to `DEFAULT_VALIDATORS`.
+            seed: Seed for all random choices made by the game (word colors,
+                random words, and puzzle generation). The same inputs and seed
+                always produce the same puzzle. Defaults to None.
+            lazy: Don't generate the puzzle after each change (setting the size,
+                adding words, applying a mask, etc.), only the next time the
+                puzzle, words placements, or answer key are used. Defaults to False.
+            large: Large puzzle mode for puzzles up to `LARGE_MAX_PUZZLE_SIZE`
+                with up to `LARGE_MAX_PUZZLE_WORDS` words. Unless a `generator`
+                is provided, large puzzles are generated in tiles by
+                `TiledWordSearchGenerator`. Defaults to False.
+            cache: Cache to load previously generated puzzles from (and store
+                new puzzles in). Only used by seeded games. Defaults to None.
         """
+        # input is checked against the puzzle limits so set them first
+        self.large = large
+        if large and generator is None:
+            generator = TiledWordSearchGenerator()
+
+        # words are colored as they are processed so seed the game first
+        self.seed = seed
+        self.random = random.Random(seed)
+
         # determine valid word directions
         self._secret_directions: DirectionSet = (
             self.validate_level(secret_level)
@@ -102,6 +134,10 @@ class WordSearch(Game):
             generator=generator,
             formatter=formatter,
             validators=validators,
+            seed=seed,
+            lazy=lazy,
+            large=large,
+            cache=cache,
         )
 
     # **************************************************** #
@@ -111,32 +147,42 @@ class WordSearch(Game):
     @property
     def hidden_words(self) -> WordSet:
         """Words of type "hidden"."""
-        return {word for word in self.words if not word.secret}
+        return self._word_set("hidden", lambda word: not word.secret)
 
     @property
     def placed_hidden_words(self) -> WordSet:
         """Words of type "hidden" currently placed in the puzzle."""
-        return {word for word in self.placed_words if not word.secret}
+        self._flush()
+        return self._word_set(
+            "placed_hidden", lambda word: word.placed and not word.secret
+        )
 
     @property
     def unplaced_hidden_words(self) -> WordSet:
         """Words of type "hidden" not currently placed in the puzzle."""
-        return self.hidden_words - self.placed_hidden_words
+        self._flush()
+        return self._word_set(
+            "unplaced_hidden", lambda word: not word.placed and not word.secret
+        )
 
     @property
     def secret_words(self) -> WordSet:
         """Words of type "secret"."""
-        return {word for word in self.words if word.secret}
+        return self._word_set("secret", lambda word: word.secret)
 
     @property
     def placed_secret_words(self) -> WordSet:
         """Words of type "secret" currently placed in the puzzle."""
-        return {word for word in self.placed_words if word.secret}
+        self._flush()
+        return self._word_set("placed_secret", lambda word: word.placed and word.secret)
 
     @property
     def unplaced_secret_words(self) -> WordSet:
         """Words of type "secret" not currently placed in the puzzle."""
-        return self.secret_words - self.placed_secret_words
+        self._flush()
+        return self._word_set(
+            "unplaced_secret", lambda word: not word.placed and word.secret
+        )
 
     @property
     def json(self) -> str:
@@ -146,9 +192,10 @@ class WordSearch(Game):
         return json.dumps(
             {
                 "puzzle": self.cropped_puzzle,
-                "words": [word.text for word in self.placed_words],
+                "words": sorted(word.text for word in self.placed_words),
                 "key": {
-                    word.text: word.key_info_json for word in self.words if word.placed
+                    word.text: word.key_info_json
+                    for word in sorted(self.placed_words, key=lambda w: w.text)
                 },
             }
         )
@@ -172,7 +219,7 @@ class WordSearch(Game):
                 from the Direction object.
         """
         self._secret_directions = self.validate_level(value)
-        self.generate()
+        self._regenerate()
 
     # ************************************************* #
     # ******************** METHODS ******************** #
@@ -253,23 +300,36 @@ class WordSearch(Game):
             raise ValueError("Action must be either 'ADD' or 'REPLACE'.")
         if action.upper() == "ADD":
             self.add_words(
-                ",".join(utils.get_random_words(count)),
+                ",".join(utils.get_random_words(count, rng=self.random)),
                 secret=secret,
                 reset_size=reset_size,
             )
         else:
             self.replace_words(
-                ",".join(utils.get_random_words(count)),
+                ",".join(utils.get_random_words(count, rng=self.random)),
                 secret=secret,
                 reset_size=reset_size,
             )
 
-    def generate(self, reset_size: bool = False) -> None:
+    def generate(
+        self,
+        reset_size: bool = False,
+        timeout: float | None = None,
+        max_steps: int | None = None,
+    ) -> None:
         """Generate the puzzle grid.
 
+        When `timeout` or `max_steps` is reached the generator stops searching
+        and the best partial puzzle found so far is kept. See `self.budget`
+        for how much of the budget was used.
+
         Args:
             reset_size: Recalculate the puzzle size before generation.
                 Defaults to False.
+            timeout: Wall-clock limit in seconds for the generator.
+                Defaults to None (unlimited).
+            max_steps: Search step (attempted word placement) limit for the
+                generator. Defaults to None (unlimited).
 
         Raises:
             MissingGeneratorError: No set puzzle generator.
@@ -278,12 +338,17 @@ class WordSearch(Game):
             NoValidWordsError: No valid game words.
             MissingWordError: Not all game words could be placed by the generator.
         """
+        self._pending = self._pending_reset = False
         if not self.generator:
             raise MissingGeneratorError()
         if not self.words:
             raise EmptyWordlistError("No words have been added to the puzzle.")
         if not self.size or reset_size:
-            self.size = self._calc_puzzle_size(self._words, self._directions)
+            self._resize(
+                self._calc_puzzle_size(
+                    self._words, self._directions, max_size=self.MAX_PUZZLE_SIZE
+                )
+            )
         min_word_length = (
             min([len(word.text) for word in self.words]) if self.words else self.size
         )
@@ -293,15 +358,210 @@ class WordSearch(Game):
             )
         for word in self.words:
             word.remove_from_puzzle()
+        self._reset_word_sets()
         if not self.mask or len(self.mask) != self.size:
             self._mask = self._build_puzzle(self.size, self.ACTIVE)
-        self._puzzle = self.generator.generate(self)
+        self.budget = Budget(timeout, max_steps)
+        self._generate_puzzle()
+        self._reset_word_sets()
         if self.require_all_words and self.unplaced_hidden_words:
             raise MissingWordError("All words could not be placed in the puzzle.")
 
+    @classmethod
+    def generate_many(
+        cls,
+        word_lists: Iterable[str | tuple[str, str]] | None = None,
+        count: int | None = None,
+        *,
+        random_words: int = 10,
+        level: int | str | None = None,
+        size: int | None = None,
+        secret_level: int | str | None = None,
+        masks: Iterable[Mask] | None = None,
+        require_all_words: bool = False,
+        generator: Generator | None = None,
+        formatter: Formatter | None = None,
+        validators: Iterable[Validator] | None = DEFAULT_VALIDATORS,
+        seed: int | None = None,
+    ) -> Iterator["WordSearch"]:
+        """Generate many puzzles that share the same settings.
+
+        Each puzzle is generated exactly once (no regeneration while it is
+        setup) and the shared generator, validators, and mask rasters (built
+        once per puzzle size) are reused for every puzzle so the generator
+        can keep its candidate indexes between puzzles.
+
+        Args:
+            word_lists: Words for each puzzle, either a string of words or a
+                tuple of (words, secret words). Defaults to None.
+            count: Count of puzzles to generate. Required if no `word_lists`
+                are provided, in which case each puzzle gets `random_words`
+                random words. Otherwise limits the `word_lists` used.
+                Defaults to None.
+            random_words: Count of random words for each puzzle when no
+                `word_lists` are provided. Defaults to 10.
+            level: Difficulty level or potential word directions. Defaults to 2.
+            size: Puzzle size. Defaults to None which is calculated per puzzle.
+            secret_level: Difficulty level or potential word directions for
+                'secret' words. Defaults to None.
+            masks: Masks applied to every puzzle. Puzzles without a set `size`
+                are made at least as big as the largest mask `min_size`.
+                Defaults to None.
+            require_all_words: Raises an error when `generator` cannot place all
+                of the words. Defaults to False.
+            generator: Puzzle generator. Defaults to None.
+            formatter: Game formatter. Defaults to None.
+            validators: An iterable of validators that puzzle words will be
+                checked against. Defaults to `DEFAULT_VALIDATORS`.
+            seed: Base seed. Puzzle `i` is seeded with `seed + i`.
+                Defaults to None.
+
+        Raises:
+            ValueError: Neither `word_lists` nor `count` were provided.
+
+        Yields:
+            Each generated puzzle.
+        """
+        if word_lists is None:
+            if count is None:
+                raise ValueError("Provide `word_lists` or a `count` of puzzles.")
+            rng = random.Random(seed)
+            word_lists = (
+                ",".join(utils.get_random_words(random_words, size, rng=rng))
+                for _ in range(count)
+            )
+        elif count is not None:
+            word_lists = islice(word_lists, count)
+        if generator is None:
+            generator = cls.DEFAULT_GENERATOR
+        masks = list(masks) if masks else []
+        # calculated puzzle sizes are grown to fit shapes with a minimum size
+        min_size = max((getattr(mask, "min_size", 0) for mask in masks), default=0)
+        rasters: dict[int, Puzzle] = {}
+
+        for i, item in enumerate(word_lists):
+            words, secret_words = (item, "") if isinstance(item, str) else item
+            ws = cls(
+                level=level,
+                size=size,
+                secret_level=secret_level,
+                require_all_words=require_all_words,
+                generator=generator,
+                formatter=formatter,
+                validators=validators,
+                seed=None if seed is None else seed + i,
+            )
+            # setup the puzzle directly so it is only generated once
+            word_set = set()
+            if words:
+                word_set.update(ws._process_input(words))
+            if secret_words:
+                word_set.update(ws._process_input(secret_words, secret=True))
+            ws._words = word_set
+            ws._reset_word_sets()
+            if not ws.size and ws._words:
+                ws._size = max(
+                    ws._calc_puzzle_size(ws._words, ws._directions), min_size
+                )
+            if masks:
+                if ws.size not in rasters:
+                    ws._mask = ws._build_puzzle(ws.size, ws.ACTIVE)
+                    # every mask is rendered at each new puzzle size
+                    for mask in masks:
+                        ws._combine_mask(mask)
+                    rasters[ws.size] = ws._mask
+                ws._masks = list(masks)
+                ws._mask = [row[:] for row in rasters[ws.size]]
+            ws.generate()
+            yield ws
+
+    @classmethod
+    def from_json(
+        cls,
+        data: str,
+        level: int | str | None = None,
+        secret_level: int | str | None = None,
+    ) -> "WordSearch":
+        """Rebuild a puzzle from its `json` (or a JSON file saved with
+        `save()`) without generating it again. Use `from_bytes()` for the
+        binary format.
+
+        The JSON only holds the puzzle cropped to its mask, so the cropped
+        puzzle is put back at its original position (worked out from the
+        answer key) in the smallest square puzzle that holds it, and every
+        cell outside of it (or left empty) is masked. Word directions aren't
+        part of the JSON so they come from `level` and `secret_level`.
+
+        Args:
+            data: Puzzle JSON.
+            level: Difficulty level or potential word directions. Defaults to 2.
+            secret_level: Difficulty level or potential word directions for
+                'secret' words. Defaults to None.
+
+        Raises:
+            ValueError: `data` isn't a puzzle or its answer key doesn't
+                match the puzzle.
+
+        Returns:
+            The rebuilt puzzle.
+        """
+        ws = cls(level=level, secret_level=secret_level)
+        words: WordSet = set()
+        try:
+            loaded = json.loads(data)
+            cropped = [[char.upper() for char in row] for row in loaded["puzzle"]]
+            for text, info in loaded["key"].items():
+                word = Word(text, secret=info["secret"], rng=ws.random)
+                word.start_row = info["start_row"]
+                word.start_column = info["start_col"]
+                word.direction = Direction[info["direction"]]
+                words.add(word)
+        except (AttributeError, KeyError, TypeError) as err:
+            raise ValueError("JSON is not a word search puzzle.") from err
+        top, left = cls._find_offset(cropped, words)
+        size = max(
+            top + len(cropped),
+            left + max((len(row) for row in cropped), default=0),
+            cls.MIN_PUZZLE_SIZE,
+        )
+        ws.large = size > ws.MAX_PUZZLE_SIZE
+        puzzle = ws._build_puzzle(size, "")
+        mask = ws._build_puzzle(size, ws.INACTIVE)
+        for row, chars in enumerate(cropped, start=top):
+            for col, char in enumerate(chars, start=left):
+                if char:
+                    puzzle[row][col] = char
+                    mask[row][col] = ws.ACTIVE
+        ws._restore(puzzle, mask, words)
+        return ws
+
+    @staticmethod
+    def _find_offset(cropped: Puzzle, words: WordSet) -> tuple[int, int]:
+        """(top row, left column) of a `cropped` puzzle in its full puzzle
+        where the letters of every word in `words` line up.
+
+        Raises:
+            ValueError: The words don't line up anywhere.
+        """
+        placements = [(word.text, word.coordinates) for word in words]
+        cells = [cell for _, coordinates in placements for cell in coordinates]
+        if not cells:
+            return 0, 0
+        for top in range(min(row for row, _ in cells) + 1):
+            for left in range(min(col for _, col in cells) + 1):
+                if all(
+                    0 <= row - top < len(cropped)
+                    and 0 <= col - left < len(cropped[row - top])
+                    and cropped[row - top][col - left] == char
+                    for text, coordinates in placements
+                    for char, (row, col) in zip(text, coordinates, strict=True)
+                ):
+                    return top, left
+        raise ValueError("The answer key doesn't match the puzzle.")
+
     def _reverse_words(self, words_list: List[str]) -> List[str]:
       """Reverse words in list."""
-      num_to_reverse: Set[int] = set([random.randint(0, len(words_list)-1) for i in range(0, math.floor(len(words_list) / 3))])
+      num_to_reverse: Set[int] = set([self.random.randint(0, len(words_list)-1) for i in range(0, math.floor(len(words_list) / 3))])
       return ",".join([c[::-1] if i in num_to_reverse else c for i, c in enumerate(words_list)])
 
     # ******************************************************** #
@@ -88,6 +88,22 @@ def ws(words):
     return WordSearch(words)
 
 
+@pytest.fixture
+def count_generations(monkeypatch):
+    def count(ws):
+        calls = []
+        generate = ws.generate
+
+        def counted(*args, **kwargs):
+            calls.append(kwargs)
+            return generate(*args, **kwargs)
+
+        monkeypatch.setattr(ws, "generate", counted)
+        return calls
+
+    return count
+
+
 @pytest.fixture
 def builtin_mask_shapes():
     return [eval(f"shapes.{shape}")() for shape in shapes.BUILTIN_MASK_SHAPES]
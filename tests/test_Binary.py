@@ -0,0 +1,114 @@
+import struct
+
+import pytest
+
+from word_search_generator import WordSearch
+from word_search_generator.core.binary import (
+    HEADER,
+    MAGIC,
+    BinaryFormatError,
+    dumps,
+)
+from word_search_generator.core.game import EmptyPuzzleError
+from word_search_generator.mask.shapes import Heart
+
+
+def test_round_trip(words):
+    ws = WordSearch(words, level=3, seed=1)
+    loaded = WordSearch.from_bytes(ws.to_bytes())
+    assert isinstance(loaded, WordSearch)
+    assert loaded.puzzle == ws.puzzle
+    assert loaded.mask == ws.mask
+    assert loaded.key == ws.key
+    assert loaded.directions == ws.directions
+    assert loaded.size == ws.size
+    assert not loaded.masked
+
+
+def test_round_trip_words(words):
+    ws = WordSearch(words, secret_words="lion bat", seed=1)
+    loaded = WordSearch.from_bytes(ws.to_bytes())
+    assert loaded.words == ws.words
+    assert loaded.secret_words == ws.secret_words
+    assert loaded.secret_directions == ws.secret_directions
+    for word in loaded.placed_words:
+        original = next(w for w in ws.placed_words if w == word)
+        assert word.coordinates == original.coordinates
+
+
+def test_round_trip_unplaced_words():
+    ws = WordSearch("cat dog pig elephant", size=7, seed=1)
+    assert ws.unplaced_words
+    loaded = WordSearch.from_bytes(ws.to_bytes())
+    assert loaded.unplaced_words == ws.unplaced_words
+    assert loaded.placed_words == ws.placed_words
+
+
+def test_round_trip_masked(words):
+    ws = WordSearch(words, size=21, seed=1)
+    ws.apply_mask(Heart())
+    loaded = WordSearch.from_bytes(ws.to_bytes())
+    assert loaded.masked
+    assert loaded.mask == ws.mask
+    assert loaded.puzzle == ws.puzzle
+    assert loaded.cropped_puzzle == ws.cropped_puzzle
+
+
+def test_round_trip_large():
+    ws = WordSearch("cat dog pig", size=60, large=True, seed=1)
+    loaded = WordSearch.from_bytes(ws.to_bytes())
+    assert loaded.large
+    assert loaded.puzzle == ws.puzzle
+
+
+def test_loading_does_not_generate(words, monkeypatch):
+    data = WordSearch(words, seed=1).to_bytes()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("puzzle regenerated")
+
+    monkeypatch.setattr(WordSearch, "generate", fail)
+    loaded = WordSearch.from_bytes(memoryview(data))
+    assert loaded.placed_words
+
+
+def test_smaller_than_json(words):
+    ws = WordSearch(words, size=25, seed=1)
+    assert len(ws.to_bytes()) < len(ws.json) / 2
+
+
+def test_header(words):
+    ws = WordSearch(words, size=25, seed=1)
+    magic, version, _, size, *_ = HEADER.unpack_from(ws.to_bytes())
+    assert magic == MAGIC
+    assert version == 1
+    assert size == 25
+
+
+def test_empty_puzzle():
+    with pytest.raises(EmptyPuzzleError):
+        WordSearch().to_bytes()
+
+
+def test_dumps_matches_to_bytes(words):
+    ws = WordSearch(words, seed=1)
+    assert dumps(ws) == ws.to_bytes()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"PK\x03\x04" + bytes(HEADER.size),
+        struct.pack("<4sBBHBBHHI", MAGIC, 99, 0, 5, 0, 0, 0, 0, 0),
+    ],
+)
+def test_invalid_data(data):
+    with pytest.raises(BinaryFormatError):
+        WordSearch.from_bytes(data)
+
+
+def test_truncated_data(words):
+    data = WordSearch(words, seed=1).to_bytes()
+    with pytest.raises(BinaryFormatError):
+        WordSearch.from_bytes(data[:-1])
@@ -0,0 +1,112 @@
+import pickle
+
+import pytest
+
+from word_search_generator import WordSearch
+from word_search_generator.core import PuzzleCache
+from word_search_generator.mask.shapes import Heart
+
+
+def test_cache_hit_returns_same_puzzle(words):
+    cache = PuzzleCache()
+    a = WordSearch(words, size=15, seed=1, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+    b = WordSearch(words, size=15, seed=1, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert a.puzzle == b.puzzle
+    assert a.key == b.key
+    assert len(cache) == 1
+
+
+def test_cache_skips_unseeded_games(words):
+    cache = PuzzleCache()
+    puzzles = [WordSearch(words, size=15, cache=cache).puzzle for _ in range(3)]
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert len(cache) == 0
+    assert puzzles[0] != puzzles[1] or puzzles[1] != puzzles[2]
+
+
+def test_cache_seeded_generator(words):
+    from word_search_generator.word_search._generator import WordSearchGenerator
+
+    cache = PuzzleCache()
+    WordSearch(words, size=15, generator=WordSearchGenerator(seed=1), cache=cache)
+    WordSearch(words, size=15, generator=WordSearchGenerator(seed=1), cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_persists_between_instances(words, tmp_path):
+    path = tmp_path / "puzzles.db"
+    cache = PuzzleCache(path)
+    a = WordSearch(words, seed=1, cache=cache)
+    cache.close()
+    cache = PuzzleCache(path)
+    b = WordSearch(words, seed=1, cache=cache)
+    assert cache.hits == 1
+    assert a.puzzle == b.puzzle
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"seed": 2},
+        {"size": 16},
+        {"level": 3},
+        {"secret_words": "lion"},
+        {"validators": []},
+    ],
+)
+def test_cache_key_changes_with_inputs(words, kwargs):
+    cache = PuzzleCache()
+    WordSearch(words, size=15, seed=1, cache=cache)
+    WordSearch(words, **{"size": 15, "seed": 1, "cache": cache, **kwargs})
+    assert cache.hits == 0
+    assert len(cache) == 2
+
+
+def test_cache_key_includes_mask(words):
+    cache = PuzzleCache()
+    ws = WordSearch(words, size=15, seed=1, cache=cache)
+    ws.apply_mask(Heart())
+    assert cache.misses == 2
+    assert all(
+        ws.mask[r][c] == ws.ACTIVE
+        for word in ws.placed_words
+        for r, c in word.coordinates
+    )
+
+
+def test_cache_evicts_least_recently_used(words):
+    cache = PuzzleCache(max_entries=2)
+    WordSearch(words, seed=1, cache=cache)
+    WordSearch(words, seed=2, cache=cache)
+    WordSearch(words, seed=1, cache=cache)  # most recently used
+    WordSearch(words, seed=3, cache=cache)
+    assert len(cache) == 2
+    WordSearch(words, seed=1, cache=cache)
+    assert cache.hits == 2
+    WordSearch(words, seed=2, cache=cache)
+    assert cache.misses == 4
+
+
+def test_cache_skips_exhausted_budget(words):
+    cache = PuzzleCache()
+    ws = WordSearch(words, seed=1, lazy=True, cache=cache)
+    ws.generate(max_steps=1)
+    assert ws.budget.exhausted
+    assert not len(cache)
+
+
+def test_cache_clear_and_pickle(words):
+    cache = PuzzleCache()
+    WordSearch(words, seed=1, cache=cache)
+    copy = pickle.loads(pickle.dumps(cache))
+    assert copy.misses == 1
+    cache.clear()
+    assert not len(cache)
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_cache_invalid_max_entries():
+    with pytest.raises(ValueError):
+        PuzzleCache(max_entries=0)
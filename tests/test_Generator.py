@@ -1,10 +1,26 @@
+import random
+import string
+
 import pytest
 
 from word_search_generator import WordSearch
 from word_search_generator.core.directions import LEVEL_DIRS
-from word_search_generator.core.generator import EmptyAlphabetError
+from word_search_generator.core.generator import Budget, EmptyAlphabetError
+from word_search_generator.core.word import Direction, Word
+from word_search_generator.mask.polygon import Rectangle
 from word_search_generator.utils import get_random_words
+from word_search_generator.word_search._detector import DuplicateDetector
 from word_search_generator.word_search._generator import WordSearchGenerator
+from word_search_generator.word_search._ordering import (
+    LongestFirst,
+    MostConstrainedFirst,
+    WordOrder,
+)
+from word_search_generator.word_search._parallel import (
+    CancellableBudget,
+    ParallelWordSearchGenerator,
+)
+from word_search_generator.word_search._tiled import TiledWordSearchGenerator
 
 
 def test_dupe_at_position_1(generator_test_game):
@@ -95,3 +111,364 @@ def test_custom_get_attr():
 def test_empty_alphabet():
     with pytest.raises(EmptyAlphabetError):
         bad_generator = WordSearchGenerator("1")  # noqa: F841
+
+
+def test_place_word_undo_restores_puzzle(generator_test_game):
+    gen = WordSearchGenerator()
+    gen.game = generator_test_game
+    gen.game._mask = gen.game._build_puzzle(gen.game.size, gen.game.ACTIVE)
+    gen.puzzle = [row[:] for row in generator_test_game.puzzle]
+    before = [row[:] for row in gen.puzzle]
+    word = Word("cow")
+    changed = gen.place_word(word, (3, 0), Direction.E)
+    assert changed == [(3, 0), (3, 1), (3, 2)]
+    assert word.placed
+    gen.undo(changed)
+    assert gen.puzzle == before
+
+
+def test_place_word_no_fit(generator_test_game):
+    gen = WordSearchGenerator()
+    gen.game = generator_test_game
+    gen.game._mask = gen.game._build_puzzle(gen.game.size, gen.game.ACTIVE)
+    gen.puzzle = [row[:] for row in generator_test_game.puzzle]
+    word = Word("cow")
+    assert gen.place_word(word, (0, 0), Direction.E) is None
+    assert not word.placed
+
+
+def test_segment_starts_respect_bounds_and_mask():
+    ws = WordSearch("cat dog pig", size=10)
+    ws.apply_mask(Rectangle(4, 3, (2, 2)))
+    gen = ws.generator
+    assert isinstance(gen, WordSearchGenerator)
+    starts = gen.segment_starts(3, Direction.E)
+    assert starts
+    for row, col in starts:
+        for i in range(3):
+            assert ws.mask[row][col + i] == ws.ACTIVE
+    assert gen.segment_starts(5, Direction.E) == []
+    assert len(gen.segment_starts(3, Direction.S)) == 4
+
+
+def test_detector_matches_words_and_reverses():
+    detector = DuplicateDetector(["CAT", "DOG"])
+    assert detector.matches("XCATGOD") == [(1, "CAT"), (4, "DOG")]
+
+
+def test_detector_add_and_remove_words(generator_test_puzzle):
+    detector = DuplicateDetector()
+    assert detector.no_duped_words(generator_test_puzzle, "A", (3, 3))
+    detector.add("BAT")
+    assert not detector.no_duped_words(generator_test_puzzle, "A", (3, 3))
+    detector.remove("BAT")
+    assert detector.no_duped_words(generator_test_puzzle, "A", (3, 3))
+
+
+def test_detector_ignores_current_word(generator_test_puzzle):
+    detector = DuplicateDetector(["BAT"])
+    assert detector.no_duped_words(generator_test_puzzle, "A", (3, 3), "BATS")
+
+
+def test_detector_find_duplicates(generator_test_puzzle):
+    detector = DuplicateDetector(["BAT", "RAT"])
+    found = detector.find_duplicates(generator_test_puzzle)
+    assert sorted(found) == [[(0, 0), (1, 1), (2, 2)], [(0, 4), (1, 4), (2, 4)]]
+    assert detector.find_duplicates(generator_test_puzzle, [(4, 0)]) == []
+
+
+def test_fill_blanks_fills_active_cells():
+    ws = WordSearch("cat dog pig", size=10)
+    ws.apply_mask(Rectangle(6, 6, (2, 2)))
+    for row in range(ws.size):
+        for col in range(ws.size):
+            assert bool(ws.puzzle[row][col]) == (ws.mask[row][col] == ws.ACTIVE)
+
+
+def test_budget_spend_steps():
+    budget = Budget(max_steps=2)
+    assert budget.spend()
+    assert budget.spend()
+    assert not budget.spend()
+    assert budget.exhausted
+    assert budget.steps == 2
+
+
+def test_budget_unlimited():
+    budget = Budget()
+    assert not budget.limited
+    assert all(budget.spend() for _ in range(1000))
+    assert not budget.exhausted
+
+
+def test_budget_remaining():
+    assert Budget().remaining is None
+    assert 0 < Budget(timeout=10).remaining <= 10
+    assert Budget(timeout=0).remaining == 0
+
+
+def test_budget_invalid_limits():
+    with pytest.raises(ValueError):
+        Budget(timeout=-1)
+    with pytest.raises(ValueError):
+        Budget(max_steps=-1)
+
+
+def test_generate_step_budget_keeps_partial_puzzle():
+    ws = WordSearch(seed=1)
+    ws.random_words(100)
+    ws.generate(max_steps=20)
+    assert ws.budget.exhausted
+    assert ws.budget.steps == 20
+    assert 0 < len(ws.placed_words) <= 20
+    assert all(char for row in ws.puzzle for char in row)
+
+
+def test_generate_time_budget():
+    ws = WordSearch(seed=1)
+    ws.random_words(100)
+    ws.generate(timeout=0)
+    assert ws.budget.exhausted
+    assert ws.budget.elapsed >= 0
+
+
+def test_generate_budget_reset_on_regenerate(words):
+    ws = WordSearch(words)
+    ws.generate(max_steps=1)
+    ws.generate()
+    assert not ws.budget.limited
+    assert not ws.budget.exhausted
+
+
+def test_longest_first_ordering():
+    ws = WordSearch("cat elephant horse", size=10)
+    words = sorted(ws.words, key=lambda w: w.text)
+    ordered = LongestFirst().order(words, ws.generator)  # type: ignore[arg-type]
+    assert [w.text for w in ordered] == ["ELEPHANT", "HORSE", "CAT"]
+
+
+def test_most_constrained_first_ordering():
+    ws = WordSearch("cat elephant horse", size=10)
+    gen = ws.generator
+    assert isinstance(gen, WordSearchGenerator)
+    words = sorted(ws.words, key=lambda w: w.text)
+    ordered = MostConstrainedFirst().order(words, gen)
+    counts = [gen.slot_count(w) for w in ordered]
+    assert counts == sorted(counts)
+    assert ordered[0].text == "ELEPHANT"
+
+
+def test_custom_ordering_used():
+    class Reverse(WordOrder):
+        def order(self, words, generator):
+            return sorted(words, key=lambda w: w.text, reverse=True)
+
+    gen = WordSearchGenerator(ordering=Reverse())
+    ws = WordSearch("cat dog pig", size=10, generator=gen)
+    assert len(ws.placed_words) == 3
+
+
+def empty_generator(size: int = 5) -> WordSearchGenerator:
+    ws = WordSearch("cat", size=size, level=1)
+    gen = ws.generator
+    assert isinstance(gen, WordSearchGenerator)
+    gen.puzzle = ws._build_puzzle(size, "")
+    gen.letters = {}
+    gen.supports = {}
+    gen._detector = DuplicateDetector()
+    return gen
+
+
+def test_overlaps_share_letters():
+    gen = empty_generator()
+    gen.place_word(Word("cat"), (0, 0), Direction.E)
+    overlaps = gen.overlaps(Word("tab"))
+    assert overlaps[((0, 2), Direction.E)] == 1
+    assert overlaps[((0, 2), Direction.S)] == 1
+    for ((row, col), direction), count in overlaps.items():
+        shared = sum(
+            gen.puzzle[row + direction.r_move * i][col + direction.c_move * i] == char
+            for i, char in enumerate("TAB")
+        )
+        assert shared == count
+
+
+def test_candidates_try_overlaps_first():
+    gen = empty_generator()
+    gen.place_word(Word("cat"), (0, 0), Direction.E)
+    candidates = gen.candidates(Word("tab"))
+    assert candidates[-1] in gen.overlaps(Word("tab"))
+
+
+def test_has_fit():
+    gen = empty_generator()
+    assert gen.has_fit(Word("dog"))
+    assert not gen.has_fit(Word("abcdefg"))
+    for row in range(5):
+        gen.place_word(Word("zzzzz"), (row, 0), Direction.E)
+    assert not gen.has_fit(Word("dog"))
+
+
+def test_unplaceable_words_skipped_without_search():
+    ws = WordSearch("cat dog abcdefghijklmnop", size=10)
+    assert {w.text for w in ws.placed_words} == {"CAT", "DOG"}
+    assert ws.budget.steps <= 10
+
+
+def test_forward_check_disabled():
+    gen = WordSearchGenerator(forward_check=False)
+    ws = WordSearch("cat dog pig cow", size=10, generator=gen)
+    assert len(ws.placed_words) == 4
+
+
+def check_placements(ws: WordSearch) -> bool:
+    return all(
+        ws.puzzle[row][col] == char
+        for word in ws.placed_words
+        for (row, col), char in zip(word.coordinates, word.text, strict=True)
+    )
+
+
+def test_parallel_generator_places_words():
+    with ParallelWordSearchGenerator(workers=2) as gen:
+        ws = WordSearch("cat dog pig horse goat", size=10, generator=gen, seed=1)
+        assert len(ws.placed_words) == 5
+        assert check_placements(ws)
+        ws.random_words(20)
+        assert check_placements(ws)
+    assert gen._executor is None
+
+
+def test_parallel_generator_timeout_includes_startup():
+    with ParallelWordSearchGenerator(workers=2) as gen:
+        ws = WordSearch(seed=1, generator=gen)
+        ws.random_words(50)
+        # a pool started from scratch can't fit in the timeout
+        gen.close()
+        ws.generate(timeout=0.001)
+        assert ws.budget.exhausted
+        assert ws.budget.elapsed >= 0.001
+
+
+def test_parallel_generator_single_worker_runs_in_process():
+    gen = ParallelWordSearchGenerator(workers=1)
+    ws = WordSearch("cat dog pig", size=10, generator=gen)
+    assert len(ws.placed_words) == 3
+    assert gen._executor is None
+
+
+def test_parallel_generator_invalid_workers():
+    with pytest.raises(ValueError):
+        ParallelWordSearchGenerator(workers=0)
+
+
+def test_cancellable_budget():
+    class Event:
+        def __init__(self):
+            self.flag = False
+
+        def is_set(self):
+            return self.flag
+
+    event = Event()
+    budget = CancellableBudget(event)
+    assert budget.spend()
+    event.flag = True
+    assert not budget.spend()
+    assert budget.exhausted
+
+
+def synthetic_words(count, seed=1):
+    rng = random.Random(seed)
+    return ",".join(
+        "".join(rng.choice(string.ascii_uppercase) for _ in range(rng.randint(5, 9)))
+        for _ in range(count)
+    )
+
+
+def test_detector_reserved_words():
+    detector = DuplicateDetector()
+    detector.reserve(["CAT", "HORSE"])
+    assert not detector.matches("HORSE")
+    detector.add("HORSE")
+    assert detector.radius == 5
+    assert detector.matches("XHORSE") == [(1, "HORSE")]
+    detector.add("CAT")
+    compiled = detector._goto
+    detector.remove("HORSE")
+    assert detector.radius == 3
+    assert detector.matches("HORSECAT") == [(5, "CAT")]
+    assert detector._goto is compiled
+
+
+def test_large_puzzle_limits():
+    with pytest.raises(ValueError):
+        WordSearch("cat", size=120)
+    ws = WordSearch(synthetic_words(150), size=120, large=True, seed=1)
+    assert ws.MAX_PUZZLE_SIZE == WordSearch.LARGE_MAX_PUZZLE_SIZE
+    assert len(ws.words) == 150
+    assert len(ws.puzzle) == 120
+    assert isinstance(ws.generator, TiledWordSearchGenerator)
+
+
+def test_large_puzzle_size_grows_with_words():
+    words = {Word(w) for w in synthetic_words(1000).split(",")}
+    letters = sum(len(word) for word in words)
+    assert WordSearch._calc_puzzle_size(words, LEVEL_DIRS[3]) == 50
+    size = WordSearch._calc_puzzle_size(words, LEVEL_DIRS[3], max_size=1000)
+    assert size**2 >= letters * 2 > (size - 1) ** 2
+
+
+def test_tiles_cover_puzzle():
+    gen = TiledWordSearchGenerator(tile_size=50)
+    tiles = gen.tiles(120)
+    assert len(tiles) == 9
+    assert {side for _, _, side in tiles} == {40}
+    covered = {
+        (top + r, left + c)
+        for top, left, side in tiles
+        for r in range(side)
+        for c in range(side)
+    }
+    assert covered == {(r, c) for r in range(120) for c in range(120)}
+
+
+def test_tiled_generation():
+    ws = WordSearch(synthetic_words(300), level=3, size=120, large=True, seed=2)
+    placed = ws.placed_words
+    assert len(placed) == len(ws.words)
+    for word in placed:
+        assert "".join(ws.puzzle[r][c] for r, c in word.coordinates) == word.text
+    assert all(cell for row in ws.puzzle for cell in row)
+    # only the placements themselves are left
+    detector = DuplicateDetector(word.text for word in placed)
+    assert {frozenset(dup) for dup in detector.find_duplicates(ws.puzzle)} == {
+        frozenset(word.coordinates) for word in placed
+    }
+
+
+def test_tiled_generation_no_copies_across_tiles():
+    ws = WordSearch(synthetic_words(900), level=3, size=101, large=True, seed=1)
+    placed = ws.placed_words
+    detector = DuplicateDetector(word.text for word in placed)
+    assert {frozenset(dup) for dup in detector.find_duplicates(ws.puzzle)} == {
+        frozenset(word.coordinates) for word in placed
+    }
+
+
+
+def test_tiled_generation_is_seeded():
+    words = synthetic_words(150)
+    a = WordSearch(words, size=100, large=True, seed=3)
+    b = WordSearch(words, size=100, large=True, seed=3)
+    assert a.puzzle == b.puzzle
+
+
+def test_tiled_generator_small_puzzle():
+    ws = WordSearch("cat dog pig", size=10, generator=TiledWordSearchGenerator())
+    assert len(ws.placed_words) == 3
+
+
+def test_tiled_generator_invalid_tile_size():
+    with pytest.raises(ValueError):
+        TiledWordSearchGenerator(tile_size=0)
@@ -0,0 +1,86 @@
+import pytest
+
+from word_search_generator import WordSearch
+from word_search_generator.core import Grid
+from word_search_generator.core.grid import GridAlphabetError
+from word_search_generator.word_search._detector import LINES, line_coordinates
+
+
+@pytest.fixture
+def puzzle():
+    return [list(row) for row in ("ABCD", "EFGH", "IJKL", "MNOP")]
+
+
+def test_grid_round_trip(puzzle):
+    grid = Grid.from_puzzle(puzzle)
+    assert len(grid) == 4
+    assert grid.to_puzzle() == puzzle
+    assert grid[1, 2] == "G"
+
+
+def test_grid_empty_cells():
+    grid = Grid(3)
+    assert grid.to_puzzle() == [[""] * 3 for _ in range(3)]
+    grid[2, 1] = "X"
+    assert grid.cells[7] == grid.codes["X"]
+    assert grid[0, 0] == ""
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 8])
+def test_grid_lines_match_puzzle_lines(size):
+    puzzle = [[chr(65 + (r * size + c) % 26) for c in range(size)] for r in range(size)]
+    grid = Grid.from_puzzle(puzzle)
+    for line in LINES:
+        for key in range(-size, size * 2):
+            expected = "".join(
+                puzzle[r][c] for r, c in line_coordinates(line, key, size)
+            )
+            if line == (0, 1):
+                codes = grid.row(key) if 0 <= key < size else b""
+            elif line == (1, 0):
+                codes = grid.column(key) if 0 <= key < size else b""
+            elif line == (1, 1):
+                codes = grid.diagonal(key)
+            else:
+                codes = grid.antidiagonal(key)
+            assert grid.decode(codes) == expected
+
+
+def test_grid_snapshot_restore(puzzle):
+    grid = Grid.from_puzzle(puzzle)
+    saved = grid.snapshot()
+    grid[0, 0] = "Z"
+    assert grid[0, 0] == "Z"
+    grid.restore(saved)
+    assert grid.to_puzzle() == puzzle
+    with pytest.raises(ValueError):
+        grid.restore(b"")
+
+
+def test_grid_view_is_zero_copy(puzzle):
+    grid = Grid.from_puzzle(puzzle)
+    view = grid.view()
+    grid[3, 3] = "Z"
+    assert view[15] == grid.codes["Z"]
+
+
+def test_grid_copy_and_equality(puzzle):
+    grid = Grid.from_puzzle(puzzle)
+    copy = grid.copy()
+    assert copy == grid
+    copy[0, 0] = "Z"
+    assert copy != grid
+    assert Grid.from_puzzle(puzzle, "ZYX") == grid
+
+
+def test_grid_alphabet_limit():
+    grid = Grid(1)
+    for i in range(255):
+        grid.code(chr(0x100 + i))
+    with pytest.raises(GridAlphabetError):
+        grid.code("!")
+
+
+def test_game_grid(words):
+    ws = WordSearch(words, size=15)
+    assert ws.grid.to_puzzle() == ws.puzzle
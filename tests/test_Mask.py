@@ -1,15 +1,24 @@
+import os
 from pathlib import Path
 
 import pytest
 from PIL import Image as PILImage
 
 from word_search_generator import WordSearch
-from word_search_generator.mask import CompoundMask, Mask, MaskNotGenerated
+from word_search_generator.mask import (
+    MASK_CACHE,
+    CompoundMask,
+    Mask,
+    MaskCache,
+    MaskNotGenerated,
+    pack_rows,
+    unpack_rows,
+)
 from word_search_generator.mask.bitmap import Bitmap, BitmapImage, ContrastError
 from word_search_generator.mask.ellipse import Ellipse
 from word_search_generator.mask.polygon import Polygon, RegularPolygon, Star
 from word_search_generator.mask.shapes import Circle, Heart
-from word_search_generator.utils import get_random_words
+from word_search_generator.utils import float_range, get_random_words
 
 
 def test_mask_property_points_set_during_init():
@@ -182,6 +191,42 @@ def test_transpose():
     assert m.mask == [["1", "4", "7"], ["2", "5", "8"], ["3", "6", "9"]]
 
 
+def test_pack_rows():
+    grid = [["*", "#", "#"], ["#", "#", "*"], ["#", "#", "#"]]
+    assert pack_rows(grid) == [0b001, 0b100, 0]
+    assert unpack_rows(pack_rows(grid), 3) == grid
+
+
+def test_pack_rows_invalid_character():
+    with pytest.raises(ValueError):
+        pack_rows([["1", "2"], ["3", "4"]])
+
+
+def test_rows_view_stays_in_sync():
+    m = Bitmap([(0, 0), (2, 1)])
+    m.generate(3)
+    assert m.rows == [0b001, 0b100, 0]
+    m.mask[2][1] = m.ACTIVE
+    assert m.rows == [0b001, 0b100, 0b010]
+    m.rows = [0, 0, 0b111]
+    assert m.mask == [["#"] * 3, ["#"] * 3, ["*"] * 3]
+
+
+def test_transform_packed_mask():
+    m = Bitmap([(0, 0), (1, 0), (2, 1)])
+    m.generate(3)
+    m.invert()
+    m.flip_horizontal()
+    m.flip_vertical()
+    m.transpose()
+    assert m.mask == [
+        ["*", "#", "*"],
+        ["*", "*", "#"],
+        ["*", "*", "#"],
+    ]
+    assert m.bounding_box == ((0, 0), (2, 2))
+
+
 def test_ungenerated_mask():
     """Test MaskNotGenerated exception when mask hasn't been generated yet."""
     m = Mask()
@@ -278,6 +323,94 @@ def test_compound_mask_apply_mask_method_3():
     assert cm.mask == [[cm.INACTIVE] * size] * size
 
 
+def test_render_matches_generate():
+    MASK_CACHE.clear()
+    expected = Heart()
+    expected.generate(25)
+    for _ in range(3):
+        m = Heart()
+        m.render(25)
+        assert m.mask == expected.mask
+        assert m.puzzle_size == 25
+    assert (MASK_CACHE.hits, MASK_CACHE.misses) == (2, 1)
+
+
+def test_render_cached_raster_not_shared():
+    MASK_CACHE.clear()
+    a, b = Circle(), Circle()
+    a.render(11)
+    b.render(11)
+    b.mask[5][5] = b.INACTIVE
+    b.points.clear()
+    c = Circle()
+    c.render(11)
+    assert c.mask == a.mask
+    assert c.points == a.points
+
+
+def test_render_cache_key_includes_parameters():
+    MASK_CACHE.clear()
+    Ellipse(5, 7).render(11)
+    Ellipse(7, 5).render(11)
+    Ellipse(7, 5).render(13)
+    Ellipse(7, 5, method=3).render(13)
+    assert (MASK_CACHE.hits, MASK_CACHE.misses) == (1, 3)
+
+
+def test_render_cache_key_ignores_generated_state():
+    MASK_CACHE.clear()
+    m = Circle()
+    for size in (20, 25, 20, 25):
+        m.render(size)
+    assert (MASK_CACHE.hits, MASK_CACHE.misses) == (2, 2)
+    expected = Circle()
+    expected.generate(25)
+    assert m.mask == expected.mask
+    assert m.points == expected.points
+
+
+def test_render_compound_mask_with_submasks_not_cached():
+    cm = CompoundMask([Circle()])
+    assert cm.cache_key() is None
+    cm.render(11)
+    assert cm.mask == cm.masks[0].mask
+
+
+def test_render_caching_is_opt_in():
+    class Custom(Polygon):
+        width = 2
+
+        def _draw(self) -> None:
+            self.points = [(0, 0), (self.width, 0), (self.width, 2), (0, 2)]
+            super()._draw()
+
+    class CachedCircle(Circle):
+        cacheable = True
+
+    assert not Mask.cacheable
+    assert Custom([(0, 0), (1, 0), (1, 1)]).cache_key() is None
+    assert CachedCircle().cache_key() is not None
+    MASK_CACHE.clear()
+    a = Custom([(0, 0), (1, 0), (1, 1)])
+    a.render(5)
+    Custom.width = 4
+    b = Custom([(0, 0), (1, 0), (1, 1)])
+    b.render(5)
+    assert a.mask != b.mask
+    assert len(MASK_CACHE) == 0
+
+
+def test_mask_cache_evicts_least_recently_used():
+    cache = MaskCache(maxsize=2)
+    cache.put("a", ((1,), 1, {}))
+    cache.put("b", ((1,), 1, {}))
+    assert cache.get("a")
+    cache.put("c", ((1,), 1, {}))
+    assert cache.get("b") is None
+    assert cache.get("a") and cache.get("c")
+    assert len(cache) == 2
+
+
 # ************************************************ #
 # ******************** BITMAP ******************** #
 # ************************************************ #
@@ -342,6 +475,64 @@ def test_image_mask_contrast_exception(tmp_path: Path):
         im.generate(size)
 
 
+def test_image_mask_cached_by_mtime(tmp_path: Path):
+    img_path = Path.joinpath(tmp_path, "test_image_cache.png")
+    PILImage.new("L", (100, 100), (0)).save(img_path, "PNG")
+    image = BitmapImage.load_image(img_path)
+    assert BitmapImage.load_image(img_path) is image
+    test_img = PILImage.new("L", (100, 100), (255))
+    test_img.paste(0, (0, 0, 50, 50))
+    test_img.save(img_path, "PNG")
+    stat = img_path.stat()
+    os.utime(img_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert BitmapImage.load_image(img_path) is not image
+
+
+def test_image_mask_resize_matches_process_image(tmp_path: Path):
+    img_path = Path.joinpath(tmp_path, "test_image_resize.png")
+    test_img = PILImage.new("L", (120, 80), (255))
+    test_img.paste(0, (10, 10, 70, 60))
+    test_img.paste(0, (90, 40, 110, 75))
+    test_img.save(img_path, "PNG")
+    im = BitmapImage(img_path)
+    for size in (21, 11, 21):
+        im.generate(size)
+        with PILImage.open(img_path) as img:
+            assert im.points == BitmapImage.process_image(img, size)
+
+
+def test_image_mask_render_redraws_changed_image(tmp_path: Path):
+    img_path = Path.joinpath(tmp_path, "test_image_render.png")
+    PILImage.new("L", (100, 100), (0)).save(img_path, "PNG")
+    im = BitmapImage(img_path)
+    im.render(11)
+    assert im.mask == [[im.ACTIVE] * 11] * 11
+    test_img = PILImage.new("L", (100, 100), (255))
+    test_img.paste(0, (0, 0, 100, 50))
+    test_img.save(img_path, "PNG")
+    stat = img_path.stat()
+    os.utime(img_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    im = BitmapImage(img_path)
+    im.render(11)
+    assert im.mask[10] == [im.INACTIVE] * 11
+
+
+def test_image_mask_render_uses_threshold(tmp_path: Path, monkeypatch):
+    img_path = Path.joinpath(tmp_path, "test_image_threshold.png")
+    # gray (only black with the default threshold) with black corners
+    test_img = PILImage.new("L", (100, 100), (100))
+    test_img.paste(0, (0, 0, 20, 20))
+    test_img.paste(0, (80, 80, 100, 100))
+    test_img.save(img_path, "PNG")
+    im = BitmapImage(img_path)
+    im.render(11)
+    assert im.mask == [[im.ACTIVE] * 11] * 11
+    monkeypatch.setattr(BitmapImage, "threshold", 50)
+    im = BitmapImage(img_path)
+    im.render(11)
+    assert im.mask[5] == [im.INACTIVE] * 11
+
+
 # ************************************************* #
 # ******************** ELLIPSE ******************** #
 # ************************************************* #
@@ -371,6 +562,37 @@ def test_calculate_ellipse_points_method_2():
     assert len(points) % 2 == 0
 
 
+@pytest.mark.parametrize(
+    ("width", "height", "puzzle_size"),
+    [(21, 21, 21), (5, 3, 6), (6, 4, 7), (30, 9, 25), (8, 17, 12)],
+)
+def test_ellipse_points_match_distance_check(width, height, puzzle_size):
+    width_r, height_r = width / 2, height / 2
+    ratio = width_r / height_r
+    span_x, span_y = width + 1, height + 1
+    origin = puzzle_size // 2
+    x_offset = origin - 1 if puzzle_size % 2 == 0 and width % 2 else origin
+    y_offset = origin - 1 if puzzle_size % 2 == 0 and height % 2 else origin
+    expected = [
+        (int(x + x_offset), int(y + y_offset))
+        for y in float_range(-span_y / 2 + 1, span_y / 2)
+        for x in float_range(-span_x / 2 + 1, span_x / 2)
+        if Ellipse.within_radius(x, y, width_r, ratio)
+    ]
+    points = Ellipse.calculate_ellipse_points(
+        width, height, (origin, origin), puzzle_size
+    )
+    assert points == expected
+
+
+def test_ellipse_draws_points():
+    e = Ellipse(30, 9, (-2, 20))
+    e.generate(25)
+    b = Bitmap(e.points)
+    b.generate(25)
+    assert e.mask == b.mask
+
+
 def test_within_radius_true():
     width = 10
     height = 6
@@ -417,6 +639,41 @@ def test_generate_method_no_size():
         m.generate()  # type: ignore
 
 
+@pytest.mark.parametrize(
+    "points",
+    [
+        [(1, 1), (8, 2), (3, 4), (9, 9), (0, 7)],  # concave
+        [(0, 0), (9, 9), (9, 0), (0, 9)],  # self-intersecting
+        [(-3, 2), (12, -1), (11, 13), (4, 6)],  # out of bounds
+    ],
+)
+def test_fill_shape_matches_ray_casting(points):
+    def inside(x, y):
+        crossings = 0
+        path = points + [points[0]]
+        for (x1, y1), (x2, y2) in zip(path, path[1:], strict=False):
+            if (y < y1) != (y < y2) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
+                crossings += 1
+        return crossings % 2 == 1
+
+    pm = Polygon(points)
+    pm.generate(10)
+    outline = Polygon(points)
+    outline.puzzle_size = 10
+    outline._mask = outline.build_mask(10, outline.INACTIVE)
+    for i in range(len(points)):
+        outline._connect_points(
+            points[i], points[(i + 1) % len(points)], outline.ACTIVE
+        )
+    ((min_x, min_y), (max_x, max_y)) = outline.bounding_box
+    for y in range(10):
+        for x in range(10):
+            expected = outline.mask[y][x] == pm.ACTIVE or (
+                min_x <= x <= max_x and min_y <= y <= max_y and inside(x, y)
+            )
+            assert (pm.mask[y][x] == pm.ACTIVE) == expected
+
+
 def test_regular_polygon_too_few_vertices():
     with pytest.raises(ValueError):
         pm = RegularPolygon(2)  # noqa: F841
@@ -501,6 +758,41 @@ def test_apply_masks():
     assert ws.puzzle[size // 2][size // 2] == ""
 
 
+def test_apply_masks_generates_once(count_generations):
+    ws = WordSearch("pig horse cow", size=21)
+    calls = count_generations(ws)
+    ws.apply_masks([Circle(), Ellipse(2, 2, method=3), Star(method=2)])
+    assert len(calls) == 1
+    assert len(ws.masks) == 3
+
+
+def test_batch_update_mask_operations(count_generations):
+    size = 6
+    ws = WordSearch("pig horse cow", size=size)
+    m1 = Polygon([(0, 0), (0, size - 1), (2, size - 1), (2, 0)])
+    m2 = Polygon([(0, 0), (size - 1, 0), (size - 1, 2), (0, 2)])
+    m2.generate(size)
+    calls = count_generations(ws)
+    with ws.batch_update():
+        ws.apply_mask(m1)
+        ws.flip_mask_horizontal()
+        ws.flip_mask_horizontal()
+        with ws.batch_update():
+            ws.transpose_mask()
+        assert not calls
+    assert len(calls) == 1
+    assert ws.mask == m2.mask
+    assert all(ws.puzzle[y][x] == "" for y in range(size) for x in range(size) if y > 2)
+
+
+def test_resize_reapplies_masks_without_generating(count_generations):
+    ws = WordSearch("pig horse cow", size=11)
+    ws.apply_masks([Star(), Ellipse(5, 5, static=False)])
+    calls = count_generations(ws)
+    ws.size = 21
+    assert len(calls) == 1
+
+
 def test_show_mask(capsys):
     size = 5
     ws = WordSearch("pig horse cow", size=size)
@@ -1,3 +1,5 @@
+import random
+
 from rich.style import Style
 
 from word_search_generator.core.word import Direction, Position, Word
@@ -82,3 +84,32 @@ def test_word_bool_false():
 def test_rich_style():
     w = Word("fancy")
     assert isinstance(w.rich_style, Style)
+
+
+def test_word_is_slotted():
+    w = Word("test")
+    assert not hasattr(w, "__dict__")
+
+
+def test_coordinates_from_start_and_direction():
+    w = Word("test")
+    assert w.coordinates == []
+    w.position = Position(2, 3)
+    w.direction = Direction.SE
+    assert w.coordinates == [(2, 3), (3, 4), (4, 5), (5, 6)]
+
+
+def test_coordinates_setter():
+    w = Word("test")
+    w.coordinates = [(4, 1), (3, 1), (2, 1), (1, 1)]
+    assert w.position == Position(4, 1)
+    assert w.direction == Direction.N
+    w.coordinates = []
+    assert not w.placed
+
+
+def test_color_is_picked_lazily():
+    a, b = Word("test", rng=random.Random(1)), Word("test", rng=random.Random(1))
+    assert a._color is None
+    assert a.color == b.color
+    assert all(0 <= v <= 1 for v in a.color)
@@ -17,6 +17,8 @@ from word_search_generator.core.game import (
 )
 from word_search_generator.core.validator import NoSingleLetterWords
 from word_search_generator.mask.polygon import Rectangle
+from word_search_generator.mask.shapes import Heart
+from word_search_generator.word_search._detector import DuplicateDetector
 from word_search_generator.word_search._formatter import WordSearchFormatter
 
 formatter = WordSearchFormatter()
@@ -152,6 +154,66 @@ def test_json_output_property_for_key():
         assert pos == ws.key[word]["start"]
 
 
+def test_from_json(words):
+    ws = WordSearch(words, level=3, secret_words="lion", seed=1)
+    loaded = WordSearch.from_json(ws.json, level=3)
+    assert loaded.puzzle == ws.puzzle
+    assert loaded.key == ws.key
+    assert loaded.secret_words == ws.placed_secret_words
+    assert loaded.directions == ws.directions
+    assert not loaded.masked
+    for word in loaded.placed_words:
+        original = next(w for w in ws.placed_words if w == word)
+        assert word.coordinates == original.coordinates
+
+
+def test_from_json_masked(words):
+    ws = WordSearch(words, size=25, seed=1)
+    ws.apply_mask(Rectangle(15, 12, (6, 8)))
+    loaded = WordSearch.from_json(ws.json)
+    assert loaded.masked
+    assert loaded.cropped_puzzle == ws.cropped_puzzle
+    assert loaded.key == ws.key
+    assert loaded.bounding_box == ws.bounding_box
+    assert loaded.json == ws.json
+
+
+def test_from_json_saved_file(words, tmp_path: Path):
+    ws = WordSearch(words, seed=1)
+    path = tmp_path / "puzzle.json"
+    ws.save(path, format="json", lowercase=True)
+    loaded = WordSearch.from_json(path.read_text())
+    assert loaded.puzzle == ws.puzzle
+    assert loaded.key == ws.key
+    assert loaded.save(tmp_path / "puzzle.pdf")
+
+
+def test_from_json_does_not_generate(words, monkeypatch):
+    data = WordSearch(words, seed=1).json
+
+    def fail(*args, **kwargs):
+        raise AssertionError("puzzle regenerated")
+
+    monkeypatch.setattr(WordSearch, "generate", fail)
+    assert WordSearch.from_json(data).placed_words
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "not json",
+        "[]",
+        '{"puzzle": [["A"]]}',
+        '{"puzzle": [["A"]], "key": {"CAT": {"start_row": 0}}}',
+        '{"puzzle": [["C", "A", "T"]], "key": {"DOG": {"start_row": 0, '
+        + '"start_col": 0, "direction": "E", "secret": false}}}',
+    ],
+)
+def test_from_json_invalid(data):
+    with pytest.raises(ValueError):
+        WordSearch.from_json(data)
+
+
 def test_for_empty_spaces(iterations):
     for _ in range(iterations):
         words = ",".join(utils.get_random_words(10))
@@ -433,3 +495,322 @@ def test_no_words_to_generate(ws: WordSearch):
     ws._words = set()
     with pytest.raises(EmptyWordlistError):
         ws.generate()
+
+
+def test_seeded_puzzles_match(words, secret_words):
+    a = WordSearch(words, size=15, secret_words=secret_words, seed=42)
+    b = WordSearch(words, size=15, secret_words=secret_words, seed=42)
+    assert a.puzzle == b.puzzle
+    assert a.key == b.key
+    assert [w.color for w in sorted(a.words, key=lambda w: w.text)] == [
+        w.color for w in sorted(b.words, key=lambda w: w.text)
+    ]
+
+
+def test_seeded_added_words_get_new_color_seeds():
+    ws = WordSearch("cat dog", seed=1)
+    ws.add_words("pig")
+    seeds = [word._color_seed for word in ws.words]
+    assert len(set(seeds)) == 3
+
+
+def test_seeded_regeneration_matches(words):
+    ws = WordSearch(words, size=15, seed=7)
+    puzzle = ws.puzzle
+    ws.generate()
+    assert ws.puzzle == puzzle
+
+
+def test_seeded_random_words_match():
+    a = WordSearch(seed=3)
+    a.random_words(10)
+    b = WordSearch(seed=3)
+    b.random_words(10)
+    assert a.words == b.words
+    assert a.puzzle == b.puzzle
+
+
+def test_seeded_puzzles_match_across_processes(tmp_path: Path):
+    import os
+    import subprocess
+    import sys
+
+    script = (
+        "from word_search_generator import WordSearch;"
+        "ws = WordSearch('dog, cat, pig, horse, donkey, turtle, goat, sheep',"
+        " size=12, seed=1);"
+        "print(ws.json)"
+    )
+    outputs = []
+    for hash_seed in ("1", "2"):
+        env = {**os.environ, "PYTHONHASHSEED": hash_seed}
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        outputs.append(result.stdout)
+    assert outputs[0] == outputs[1]
+
+
+def test_generator_seed():
+    from word_search_generator.word_search._generator import WordSearchGenerator
+
+    a = WordSearch(
+        "dog, cat, pig, horse", size=10, generator=WordSearchGenerator(seed=5)
+    )
+    b = WordSearch(
+        "dog, cat, pig, horse", size=10, generator=WordSearchGenerator(seed=5)
+    )
+    assert a.puzzle == b.puzzle
+
+
+def test_generate_many_word_lists(words):
+    puzzles = list(WordSearch.generate_many([words, "cat, dog, pig"], size=15))
+    assert len(puzzles) == 2
+    assert all(check_key(ws.key, ws.puzzle) for ws in puzzles)
+    assert {w.text for w in puzzles[1].words} == {"CAT", "DOG", "PIG"}
+
+
+def test_generate_many_secret_words():
+    (ws,) = WordSearch.generate_many([("cat, dog", "pig")], size=10)
+    assert {w.text for w in ws.secret_words} == {"PIG"}
+
+
+def test_generate_many_random_count():
+    puzzles = list(WordSearch.generate_many(count=3, random_words=5, size=10))
+    assert len(puzzles) == 3
+    assert all(len(ws.words) == 5 for ws in puzzles)
+
+
+def test_generate_many_count_limits_word_lists():
+    puzzles = list(WordSearch.generate_many(["cat", "dog", "pig"], count=2))
+    assert len(puzzles) == 2
+
+
+def test_generate_many_requires_input():
+    with pytest.raises(ValueError):
+        next(WordSearch.generate_many())
+
+
+def test_generate_many_seeded():
+    a = [ws.puzzle for ws in WordSearch.generate_many(count=3, size=12, seed=5)]
+    b = [ws.puzzle for ws in WordSearch.generate_many(count=3, size=12, seed=5)]
+    assert a == b
+
+
+def test_generate_many_masks_match_single_puzzle(words):
+    mask = Rectangle(8, 8, (1, 1))
+    (batch,) = WordSearch.generate_many([words], size=12, masks=[mask])
+    single = WordSearch(words, size=12)
+    single.apply_mask(Rectangle(8, 8, (1, 1)))
+    assert batch.mask == single.mask
+    assert batch.masks == [mask]
+
+
+def test_generate_many_masks_every_size():
+    word_lists = ["cat dog pig", "elephant giraffe hippopotamus rhinoceros"]
+    small, large = WordSearch.generate_many(word_lists, masks=[Heart()])
+    assert small.size != large.size
+    for ws in (small, large):
+        single = WordSearch(" ".join(w.text for w in ws.words), size=ws.size)
+        single.apply_mask(Heart())
+        assert ws.mask == single.mask
+        assert any(WordSearch.INACTIVE in row for row in ws.mask)
+
+
+def test_batch_update_generates_once(words, count_generations):
+    ws = WordSearch(words, size=15)
+    calls = count_generations(ws)
+    with ws.batch_update():
+        ws.size = 20
+        ws.directions = "N,S,E,W"
+        ws.secret_directions = "NE"
+        ws.validators = [NoSingleLetterWords()]
+        ws.add_words("lion tiger")
+        ws.remove_words("lion")
+        ws.apply_mask(Rectangle(15, 15))
+        assert not calls
+    assert len(calls) == 1
+    assert len(ws.puzzle) == 20
+    assert "TIGER" in {word.text for word in ws.placed_words}
+    assert check_key(ws.key, ws.puzzle)
+
+
+def test_batch_update_keeps_reset_size(count_generations):
+    ws = WordSearch("cat dog", size=20)
+    calls = count_generations(ws)
+    with ws.batch_update():
+        ws.add_words("pig", reset_size=True)
+        ws.add_words("cow")
+    assert calls == [{"reset_size": True}]
+    assert ws.size != 20
+
+
+def test_batch_update_raises_on_exit():
+    ws = WordSearch("cat dog", size=10, require_all_words=True)
+    with pytest.raises(MissingWordError), ws.batch_update():
+        ws.add_words("elephant")
+        ws.size = 5
+
+
+def test_batch_update_leaves_changes_pending_on_error(count_generations):
+    ws = WordSearch("cat dog", size=10)
+    calls = count_generations(ws)
+    with pytest.raises(RuntimeError), ws.batch_update():
+        ws.add_words("pig")
+        raise RuntimeError
+    assert not calls
+    assert "PIG" in {word.text for word in ws.placed_words}
+    assert len(calls) == 1
+
+
+def test_lazy_size_and_mask_are_current(count_generations):
+    ws = WordSearch("cat dog", size=20, lazy=True)
+    assert ws.puzzle
+    calls = count_generations(ws)
+    ws.add_words("pig", reset_size=True)
+    assert not calls
+    assert ws.size != 20
+    assert len(ws.mask) == ws.size
+    assert len(calls) == 1
+    ws.size = 12
+    assert ws.bounding_box == ((0, 0), (11, 11))
+    assert len(calls) == 2
+
+
+def test_lazy_generates_on_access(words, count_generations):
+    ws = WordSearch(words, lazy=True)
+    calls = count_generations(ws)
+    assert not calls
+    ws.size = 18
+    ws.directions = 3
+    with ws.batch_update():
+        ws.add_words("lion")
+    assert not calls
+    assert ws.puzzle
+    assert check_key(ws.key, ws.puzzle)
+    assert len(calls) == 1
+
+
+def test_lazy_matches_eager(words):
+    lazy = WordSearch(words, size=15, seed=3, lazy=True)
+    lazy.add_words("lion")
+    eager = WordSearch(words, size=15, seed=3)
+    eager.add_words("lion")
+    assert lazy.puzzle == eager.puzzle
+
+
+def copies(ws, word):
+    detector = DuplicateDetector([word.text])
+    return len({frozenset(m) for m in detector.find_duplicates(ws.puzzle)})
+
+
+def test_incremental_add_keeps_placed_words(words, count_generations):
+    ws = WordSearch(words, size=20, seed=1)
+    placements = {word.text: word.coordinates for word in ws.placed_words}
+    calls = count_generations(ws)
+    ws.add_words("zebra", incremental=True)
+    assert not calls
+    assert {word.text: word.coordinates for word in ws.placed_words} == {
+        **placements,
+        "ZEBRA": next(w for w in ws.words if w.text == "ZEBRA").coordinates,
+    }
+    assert check_key(ws.key, ws.puzzle)
+
+
+def test_incremental_remove_only_redraws_freed_cells(words, count_generations):
+    ws = WordSearch(words, size=20, seed=1)
+    before = [row[:] for row in ws.puzzle]
+    removed = max(ws.placed_words, key=lambda word: word.text)
+    cells = set(removed.coordinates)
+    calls = count_generations(ws)
+    ws.remove_words(removed.text, incremental=True)
+    assert not calls
+    changed = {
+        (row, col)
+        for row in range(ws.size)
+        for col in range(ws.size)
+        if before[row][col] != ws.puzzle[row][col]
+    }
+    assert changed <= cells
+    assert removed.text not in {word.text for word in ws.words}
+    assert check_key(ws.key, ws.puzzle)
+
+
+def test_incremental_replace_words(count_generations):
+    ws = WordSearch("cat dog pig horse", size=15, seed=2)
+    kept = {word.text: word.coordinates for word in ws.placed_words}
+    del kept["HORSE"]
+    calls = count_generations(ws)
+    ws.replace_words("cat dog pig zebra", incremental=True)
+    assert not calls
+    placed = {word.text: word.coordinates for word in ws.placed_words}
+    assert placed.keys() == {"CAT", "DOG", "PIG", "ZEBRA"}
+    assert all(placed[text] == coords for text, coords in kept.items())
+    assert check_key(ws.key, ws.puzzle)
+
+
+def test_incremental_patches_have_no_duplicates():
+    ws = WordSearch("cat dog pig", size=8, seed=4)
+    for word in ("cow", "hen", "ram", "ewe", "yak", "emu", "ant"):
+        ws.add_words(word, incremental=True)
+    ws.remove_words("dog cow", incremental=True)
+    assert check_key(ws.key, ws.puzzle)
+    assert all(copies(ws, word) == 1 for word in ws.placed_words)
+
+
+def test_incremental_falls_back_to_generation(count_generations):
+    ws = WordSearch("cat dog pig", size=10, seed=1)
+    calls = count_generations(ws)
+    ws.add_words("hippopotamus", incremental=True, reset_size=True)
+    assert calls == [{"reset_size": True}]
+    assert "HIPPOPOTAMUS" in {word.text for word in ws.placed_words}
+
+    # too long for the current puzzle so it can't be patched in
+    ws = WordSearch("cat dog pig", size=10, seed=1)
+    calls = count_generations(ws)
+    ws.add_words("caterpillar", incremental=True)
+    assert calls == [{"reset_size": False}]
+    assert "CATERPILLAR" in {word.text for word in ws.unplaced_words}
+
+
+def test_incremental_waits_for_batch_update(count_generations):
+    ws = WordSearch("cat dog pig", size=10, seed=1)
+    calls = count_generations(ws)
+    with ws.batch_update():
+        ws.add_words("cow", incremental=True)
+        assert not calls
+    assert len(calls) == 1
+
+
+def test_word_sets_are_memoized(monkeypatch):
+    ws = WordSearch("cat dog", secret_words="pig", size=10, seed=1)
+    assert {w.text for w in ws.placed_hidden_words} == {"CAT", "DOG"}
+    assert {w.text for w in ws.secret_words} == {"PIG"}
+    # later reads come from the memoized sets
+    monkeypatch.setattr(ws, "_words", set())
+    assert {w.text for w in ws.placed_hidden_words} == {"CAT", "DOG"}
+    monkeypatch.undo()
+    # and callers only ever get copies
+    ws.placed_words.clear()
+    assert len(ws.placed_words) == 3
+
+
+def test_word_sets_reset_on_changes():
+    ws = WordSearch("cat dog", size=10, seed=1)
+    assert len(ws.placed_words) == len(ws.hidden_words) == 2
+    ws.add_words("pig", secret=True)
+    assert len(ws.placed_words) == 3
+    assert {w.text for w in ws.secret_words} == {"PIG"}
+    ws.remove_words("dog")
+    assert {w.text for w in ws.placed_hidden_words} == {"CAT"}
+    ws.replace_words("cow hen")
+    assert {w.text for w in ws.placed_words} == {"COW", "HEN"}
+    assert not ws.secret_words
+    ws.add_words("caterpillar", incremental=True)
+    assert {w.text for w in ws.unplaced_words} == {"CATERPILLAR"}
+    ws.size = 12
+    assert not ws.unplaced_hidden_words
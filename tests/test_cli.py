@@ -1,3 +1,4 @@
+import json
 import random
 import subprocess
 from pathlib import Path
@@ -238,3 +239,79 @@ def test_input_file(tmp_path: Path):
     file_to_read.write_text("dog, pig\nmoose,horse,cat,    mouse, newt\ngoose")
     result = subprocess.run(f"word-search -i {file_to_read.absolute()}", shell=True)
     assert result.returncode == 0
+
+
+def test_batch_random_puzzles(tmp_path: Path):
+    result = subprocess.run(
+        f'word-search batch -n 3 -j 2 -f csv -s 10 -o "{tmp_path}"', shell=True
+    )
+    assert result.returncode == 0
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "puzzle-00001.csv",
+        "puzzle-00002.csv",
+        "puzzle-00003.csv",
+    ]
+
+
+def test_batch_manifest(tmp_path: Path):
+    manifest = tmp_path.joinpath("manifest.txt")
+    manifest.write_text("cat dog pig\n\nhorse, goat\n")
+    out = tmp_path.joinpath("out")
+    result = subprocess.run(
+        f'word-search batch -i "{manifest}" -j 1 -f csv -o "{out}"', shell=True
+    )
+    assert result.returncode == 0
+    assert len(list(out.iterdir())) == 2
+    assert "HORSE" in out.joinpath("puzzle-00002.csv").read_text()
+
+
+def test_batch_resume_skips_existing(tmp_path: Path):
+    existing = tmp_path.joinpath("puzzle-00001.csv")
+    existing.write_text("keep")
+    result = subprocess.run(
+        f'word-search batch -n 2 -j 1 -f csv -o "{tmp_path}"',
+        shell=True,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0
+    assert "Skipping 1 existing" in result.stderr
+    assert existing.read_text() == "keep"
+    assert tmp_path.joinpath("puzzle-00002.csv").exists()
+
+
+def test_batch_json(tmp_path: Path):
+    result = subprocess.run(
+        f'word-search batch -n 2 -j 1 -f json -s 10 -o "{tmp_path}"', shell=True
+    )
+    assert result.returncode == 0
+    for i in (1, 2):
+        data = json.loads(tmp_path.joinpath(f"puzzle-0000{i}.json").read_text())
+        assert data["words"]
+
+
+def test_batch_resume_ignores_partial_files(tmp_path: Path):
+    tmp_path.joinpath(".puzzle-00001.csv.1.tmp").write_text("partial")
+    result = subprocess.run(
+        f'word-search batch -n 1 -j 1 -f csv -o "{tmp_path}"',
+        shell=True,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0
+    assert "Skipping" not in result.stderr
+    assert "WORD SEARCH" in tmp_path.joinpath("puzzle-00001.csv").read_text()
+
+
+def test_batch_mask_min_size(tmp_path: Path):
+    result = subprocess.run(
+        f'word-search batch -n 1 -j 1 -r 3 -m Club -f csv -o "{tmp_path}"',
+        shell=True,
+    )
+    assert result.returncode == 0
+    assert tmp_path.joinpath("puzzle-00001.csv").exists()
+
+
+def test_batch_requires_manifest_or_count(tmp_path: Path):
+    result = subprocess.run(f'word-search batch -o "{tmp_path}"', shell=True)
+    assert result.returncode == 2
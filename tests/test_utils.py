@@ -46,3 +46,13 @@ def test_float_range_invalid_args():
 
 def test_float_range_negative():
     assert len(list(utils.float_range(0.40, 0.30, -0.1))) == 2
+
+
+def test_available_cpus(monkeypatch):
+    monkeypatch.setattr(
+        utils.os, "sched_getaffinity", lambda pid: {0, 3}, raising=False
+    )
+    monkeypatch.setattr(utils.os, "cpu_count", lambda: 8)
+    assert utils.available_cpus() == 2
+    monkeypatch.delattr(utils.os, "sched_getaffinity")
+    assert utils.available_cpus() == 8